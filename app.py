@@ -209,4 +209,20 @@ def ml_models():
     return api.fetch_ml_model_info()
 
 
+@app.route("/ml_models/registry")
+def ml_model_registry():
+    """
+    Fetch cache counters for the ML models loaded by this worker.
+
+    Returns
+    -------
+    Response with a body that has a JSON of model registry hits, misses, evictions,
+    and currently-cached models.
+    """
+    if not _request_is_authorized(request):
+        return _unauthorized_response()
+
+    return api.fetch_model_registry_stats()
+
+
 run(app, **_run_kwargs())
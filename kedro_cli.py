@@ -71,6 +71,9 @@ command arguments from. If command line arguments are provided, they will
 override the loaded ones."""
 PIPELINE_ARG_HELP = """Name of the modular pipeline to run.
 If not set, the project pipeline is run by default."""
+PARTITION_PLAYER_DATA_HELP = """Calculate player data a batch of seasons
+at a time to save memory. This flag cannot be used together with options
+that filter the pipeline's nodes."""
 PARAMS_ARG_HELP = """Specify extra parameters that you want to pass
 to the context initializer. Items must be separated by comma, keys - by colon,
 example: param1:value1,param2:value2. Each parameter is split by the first comma,
@@ -190,6 +193,7 @@ def cli():
 @click.option(
     "--params", type=str, default="", help=PARAMS_ARG_HELP, callback=_split_params
 )
+@click.option("--partition-player-data", is_flag=True, help=PARTITION_PLAYER_DATA_HELP)
 def run(
     tag,
     env,
@@ -203,6 +207,7 @@ def run(
     pipeline,
     _config,
     params,
+    partition_player_data,
 ):
     """Run the pipeline."""
     if parallel and runner:
@@ -219,6 +224,19 @@ def run(
     node_names = _get_values_as_tuple(node_names) if node_names else node_names
 
     context = load_context(Path.cwd(), env=env, extra_params=params)
+
+    if partition_player_data:
+        if any([tag, node_names, from_nodes, to_nodes, from_inputs, load_version]):
+            raise KedroCliError(
+                "The --partition-player-data flag cannot be used together with "
+                "options that filter the pipeline's nodes or load versions."
+            )
+
+        context.run_with_player_partitions(
+            pipeline_name=pipeline, runner=runner_class()
+        )
+        return
+
     context.run(
         tags=tag,
         runner=runner_class(),
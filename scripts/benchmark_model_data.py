@@ -0,0 +1,150 @@
+"""Script for measuring load time and peak memory of MLData for JSON and columnar data.
+
+Saves synthetic model data as JSON records and as a ColumnarDataSet, then loads
+increasing numbers of seasons with MLData in a fresh process for each run.
+Load time and peak RSS for columnar data should grow with the number of seasons
+requested, but stay the same for JSON data, which always has to be read in full.
+
+Usage: python scripts/benchmark_model_data.py [--seasons N] [--columns M]
+    [n_requested_seasons ...]
+"""
+
+from typing import Any, Callable, Dict, Tuple
+from multiprocessing import get_context
+from unittest.mock import MagicMock
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from kedro.extras.datasets.pandas import JSONDataSet
+from kedro.io import DataCatalog
+
+BASE_DIR = os.path.join(os.path.abspath(os.path.dirname(__file__)), "../")
+SRC_PATH = os.path.join(BASE_DIR, "src")
+
+if SRC_PATH not in sys.path:
+    sys.path.append(SRC_PATH)
+
+from augury.io import ColumnarDataSet
+from augury.ml_data import MLData
+from augury.runner import peak_memory_mb
+from augury.settings import SEED, TEAM_NAMES
+
+np.random.seed(SEED)
+
+LAST_SEASON = 2020
+DEFAULT_N_SEASONS = 120
+DEFAULT_N_COLUMNS = 200
+DEFAULT_REQUESTED_SEASON_COUNTS = [1, 10, 40, 120]
+ROUNDS_PER_SEASON = 22
+DATA_SET_NAME = "model_data"
+
+
+def _fake_model_data(n_seasons: int, n_columns: int) -> pd.DataFrame:
+    years = np.arange(LAST_SEASON - n_seasons, LAST_SEASON)
+    round_numbers = np.arange(1, ROUNDS_PER_SEASON + 1)
+    index = pd.MultiIndex.from_product(
+        [TEAM_NAMES, years, round_numbers], names=["team", "year", "round_number"]
+    )
+    row_count = len(index)
+
+    return pd.DataFrame(
+        np.random.random((row_count, n_columns)),
+        columns=[f"feature_{n}" for n in range(n_columns)],
+    ).assign(
+        team=index.get_level_values("team"),
+        oppo_team=np.random.choice(TEAM_NAMES, row_count),
+        year=index.get_level_values("year"),
+        round_number=index.get_level_values("round_number"),
+        date=pd.to_datetime(index.get_level_values("year").astype(str), utc=True)
+        + pd.to_timedelta(index.get_level_values("round_number") * 7, unit="days"),
+        margin=np.random.randint(-100, 100, row_count),
+    )
+
+
+def _save_model_data(
+    data_set_paths: Dict[str, str], n_seasons: int, n_columns: int
+) -> None:
+    model_data = _fake_model_data(n_seasons, n_columns)
+
+    JSONDataSet(
+        filepath=data_set_paths["json"],
+        save_args={"orient": "records", "date_format": "iso"},
+    ).save(model_data)
+    ColumnarDataSet(filepath=data_set_paths["columnar"]).save(model_data)
+
+
+def _run_in_fresh_process(func: Callable[..., Any], *args: Any) -> Any:
+    # Peak RSS is inherited by child processes, so we spawn rather than fork them,
+    # and the parent never holds any big data itself
+    with get_context("spawn").Pool(processes=1) as pool:
+        return pool.apply(func, args)
+
+
+def _load_ml_data(
+    data_set_path: str, is_columnar: bool, year_range: Tuple[int, int]
+) -> Dict[str, float]:
+    start_time = time.perf_counter()
+
+    data_set = (
+        ColumnarDataSet(filepath=data_set_path)
+        if is_columnar
+        else JSONDataSet(filepath=data_set_path)
+    )
+    data = MLData(
+        context=MagicMock(catalog=DataCatalog({DATA_SET_NAME: data_set})),
+        data_set=DATA_SET_NAME,
+        train_year_range=year_range,
+        test_year_range=(max(year_range) - 1, max(year_range)),
+    )
+    data.train_data  # pylint: disable=pointless-statement
+    data.test_data  # pylint: disable=pointless-statement
+
+    return {
+        "seconds": time.perf_counter() - start_time,
+        "peak_rss_mb": peak_memory_mb(),
+    }
+
+
+def main(*args: str):
+    """Load the requested numbers of seasons from JSON and columnar data sets."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("requested_season_counts", nargs="*", type=int)
+    parser.add_argument("--seasons", type=int, default=DEFAULT_N_SEASONS)
+    parser.add_argument("--columns", type=int, default=DEFAULT_N_COLUMNS)
+    params = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        data_set_paths = {
+            "json": os.path.join(data_dir, "model-data.json"),
+            "columnar": os.path.join(data_dir, "model-data"),
+        }
+        _run_in_fresh_process(
+            _save_model_data, data_set_paths, params.seasons, params.columns
+        )
+
+        for n_seasons in params.requested_season_counts or [
+            count
+            for count in DEFAULT_REQUESTED_SEASON_COUNTS
+            if count <= params.seasons
+        ]:
+            year_range = (LAST_SEASON - n_seasons, LAST_SEASON)
+
+            for data_format, data_set_path in data_set_paths.items():
+                result = _run_in_fresh_process(
+                    _load_ml_data, data_set_path, data_format == "columnar", year_range
+                )
+
+                print(
+                    f"{data_format} ({n_seasons} of {params.seasons} seasons): "
+                    f"{result['seconds']:.3f}s, "
+                    f"peak RSS {result['peak_rss_mb']:.1f}MB"
+                )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
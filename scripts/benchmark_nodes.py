@@ -0,0 +1,142 @@
+"""Script for comparing the run times of optimised nodes with reference versions.
+
+Usage: python scripts/benchmark_nodes.py [benchmark_name ...]
+"""
+
+import os
+import sys
+import timeit
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+from candystore import CandyStore
+
+BASE_DIR = os.path.join(os.path.abspath(os.path.dirname(__file__)), "../")
+SRC_PATH = os.path.join(BASE_DIR, "src")
+
+if SRC_PATH not in sys.path:
+    sys.path.append(SRC_PATH)
+
+from benchmarks import reference_nodes
+from augury.nodes import match, common
+from augury.settings import SEED
+
+np.random.seed(SEED)
+
+# 1897 to 2020 is the full history of VFL/AFL match data
+SEASONS = (1897, 2021)
+N_RUNS = 3
+
+BenchmarkCase = Tuple[Callable[[], pd.DataFrame], Callable, Callable]
+
+
+def _match_data() -> pd.DataFrame:
+    return CandyStore(seasons=SEASONS).match_results().pipe(match.clean_match_data)
+
+
+def _elo_match_data() -> pd.DataFrame:
+    return _match_data().loc[
+        :,
+        [
+            "date",
+            "year",
+            "round_number",
+            "home_team",
+            "away_team",
+            "home_score",
+            "away_score",
+        ],
+    ]
+
+
+def _team_match_data() -> pd.DataFrame:
+    return _match_data().pipe(common.convert_match_rows_to_teammatch_rows)
+
+
+def _win_streak_data() -> pd.DataFrame:
+    team_match_data = _team_match_data()
+
+    return team_match_data.assign(
+        prev_match_result=np.random.choice(
+            [1.0, 0.5, 0.0, np.nan], len(team_match_data), p=[0.49, 0.01, 0.49, 0.01]
+        )
+    ).sort_index()
+
+
+def _ladder_data() -> pd.DataFrame:
+    team_match_data = _team_match_data()
+
+    return team_match_data.assign(
+        cum_percent=(2.5 * np.random.ranf(len(team_match_data))) - 0.5,
+        cum_win_points=np.random.randint(0, 60, len(team_match_data)),
+    )
+
+
+def _oppo_feature_data() -> pd.DataFrame:
+    team_match_data = _team_match_data()
+
+    return team_match_data.assign(
+        cum_percent=(2.5 * np.random.ranf(len(team_match_data))) - 0.5,
+        ladder_position=np.random.randint(1, 19, len(team_match_data)),
+    )
+
+
+BENCHMARKS: Dict[str, BenchmarkCase] = {
+    "add_elo_rating": (
+        _elo_match_data,
+        match.add_elo_rating,
+        reference_nodes.add_elo_rating,
+    ),
+    "add_win_streak": (
+        _win_streak_data,
+        match.add_win_streak,
+        reference_nodes.add_win_streak,
+    ),
+    "add_ladder_position": (
+        _ladder_data,
+        match.add_ladder_position,
+        reference_nodes.add_ladder_position,
+    ),
+    # Without an opponent index, so this includes the time to build one
+    "add_oppo_features": (
+        _oppo_feature_data,
+        common.add_oppo_features(oppo_feature_cols=["cum_percent", "ladder_position"]),
+        reference_nodes.add_oppo_features(
+            oppo_feature_cols=["cum_percent", "ladder_position"]
+        ),
+    ),
+}
+
+
+def _time_node(node_func: Callable, data_frame: pd.DataFrame) -> float:
+    return min(timeit.repeat(lambda: node_func(data_frame), number=1, repeat=N_RUNS))
+
+
+def _run_benchmark(name: str, benchmark_case: BenchmarkCase) -> None:
+    create_data, node_func, reference_func = benchmark_case
+    data_frame = create_data()
+
+    pd.testing.assert_frame_equal(
+        node_func(data_frame), reference_func(data_frame), check_exact=True
+    )
+
+    node_time = _time_node(node_func, data_frame)
+    reference_time = _time_node(reference_func, data_frame)
+
+    print(
+        f"{name} ({len(data_frame)} rows): {node_time:.3f}s vs reference "
+        f"{reference_time:.3f}s ({reference_time / node_time:.1f}x speed-up)"
+    )
+
+
+def main(*benchmark_names: str):
+    """Run the named benchmarks, or all of them if none are given."""
+    names = benchmark_names or BENCHMARKS.keys()
+
+    for name in names:
+        _run_benchmark(name, BENCHMARKS[name])
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
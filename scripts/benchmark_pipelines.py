@@ -0,0 +1,270 @@
+"""Script for measuring pipeline, data, and model performance on synthetic data.
+
+Results are saved to data/08_reporting/benchmarks, named by the current commit,
+so that they can be compared from commit to commit.
+
+Usage: python scripts/benchmark_pipelines.py [--seasons N] [--teams M]
+    [--compare RESULTS_PATH] [benchmark_name ...]
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from datetime import date
+from unittest.mock import patch
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+BASE_DIR = os.path.join(os.path.abspath(os.path.dirname(__file__)), "../")
+SRC_PATH = os.path.join(BASE_DIR, "src")
+
+if SRC_PATH not in sys.path:
+    sys.path.append(SRC_PATH)
+
+from benchmarks.synthetic_data import fake_raw_data
+from augury import api
+from augury.ml_data import MLData
+from augury.ml_estimators import (
+    BenchmarkEstimator,
+    BaggingEstimator,
+    StackingEstimator,
+    ConfidenceEstimator,
+)
+from augury.ml_estimators.base_ml_estimator import BaseMLEstimator
+from augury.context import load_project_context
+from augury.model_registry import MODEL_REGISTRY
+from augury.result_cache import PREDICTION_CACHE
+from augury.runner import peak_memory_mb
+from augury.settings import ML_MODELS, SEED, TEAM_NAMES
+
+np.random.seed(SEED)
+
+RESULTS_DIR = os.path.join(BASE_DIR, "data/08_reporting/benchmarks")
+# The fixture season, for which we make predictions
+PREDICTION_YEAR = date.today().year
+DEFAULT_N_SEASONS = 10
+
+ESTIMATORS: Dict[str, Callable[[], BaseMLEstimator]] = {
+    "benchmark_estimator": BenchmarkEstimator,
+    "tipresias_2019": lambda: BaggingEstimator(name="tipresias_2019"),
+    "tipresias_2020": lambda: StackingEstimator(name="tipresias_2020"),
+    "confidence_estimator": ConfidenceEstimator,
+}
+
+BenchmarkResult = Dict[str, Optional[float]]
+
+
+def _measure(func: Callable[[], Any]) -> Tuple[Any, BenchmarkResult]:
+    start_rss = peak_memory_mb()
+    start_time = time.perf_counter()
+
+    result = func()
+
+    return (
+        result,
+        {
+            "seconds": time.perf_counter() - start_time,
+            # Peak RSS only goes up, so later benchmarks only register memory usage
+            # beyond the peak of earlier ones
+            "peak_rss_delta_mb": peak_memory_mb() - start_rss,
+        },
+    )
+
+
+def _ml_model(name: str) -> Dict[str, Any]:
+    return next(ml_model for ml_model in ML_MODELS if ml_model["name"] == name)
+
+
+class PipelineBenchmarks:
+    """Runs benchmarks against a context that loads synthetic raw data."""
+
+    def __init__(self, n_seasons: int, n_teams: int):
+        """Instantiate a PipelineBenchmarks object.
+
+        Params
+        ------
+        n_seasons: Number of seasons of played matches in the synthetic data.
+        n_teams: Maximum number of teams in the synthetic data.
+        """
+        self.seasons = (PREDICTION_YEAR - n_seasons, PREDICTION_YEAR)
+        self.context = load_project_context(
+            start_date=f"{min(self.seasons)}-01-01",
+            end_date=f"{PREDICTION_YEAR}-12-31",
+        )
+        # Memory data replaces the catalog's raw data sets, so no files
+        # or remote sources are involved
+        self.context._memory_data.update(  # pylint: disable=protected-access
+            fake_raw_data(self.seasons, n_teams=n_teams)
+        )
+        self.results: Dict[str, BenchmarkResult] = {}
+
+    def run(self, benchmark_names: List[str]) -> Dict[str, BenchmarkResult]:
+        """Run the named benchmarks in order, recording their results.
+
+        Later benchmarks use data sets and models created by earlier ones,
+        so we run any earlier benchmarks that they depend on without recording them.
+        """
+        all_names = list(self.benchmarks.keys())
+        last_index = max(all_names.index(name) for name in benchmark_names)
+
+        for name in all_names[: last_index + 1]:
+            _, result = _measure(self.benchmarks[name])
+
+            if name in benchmark_names:
+                self.results[name] = result
+                print(
+                    f"{name}: {result['seconds']:.3f}s, "
+                    f"peak RSS +{result['peak_rss_delta_mb']:.1f}MB"
+                )
+
+        return self.results
+
+    @property
+    def benchmarks(self) -> Dict[str, Callable[[], Any]]:
+        """Benchmark functions by name, in dependency order."""
+        return {
+            "full_pipeline": lambda: self._run_pipeline("full", "model_data"),
+            "legacy_pipeline": lambda: self._run_pipeline(
+                "legacy", "legacy_model_data"
+            ),
+            "ml_data": self._load_ml_data,
+            **{
+                f"{name}_fit": self._benchmark_fit(name, create_estimator)
+                for name, create_estimator in ESTIMATORS.items()
+            },
+            **{
+                f"{name}_predict": self._benchmark_predict(name)
+                for name in ESTIMATORS.keys()
+            },
+            "make_predictions": self._make_predictions,
+        }
+
+    def _run_pipeline(self, pipeline_name: str, data_set_name: str):
+        return self.context.run_prediction_slice(
+            pipeline_name, data_set_name, (min(self.seasons), PREDICTION_YEAR + 1)
+        )
+
+    def _ml_data(self, data_set_name: str, label_col: str = "margin") -> MLData:
+        return MLData(
+            context=self.context,
+            data_set=data_set_name,
+            label_col=label_col,
+            train_year_range=self.seasons,
+            test_year_range=(PREDICTION_YEAR, PREDICTION_YEAR + 1),
+        )
+
+    def _load_ml_data(self):
+        for data_set_name in {ml_model["data_set"] for ml_model in ML_MODELS}:
+            data = self._ml_data(data_set_name)
+            data.train_data  # pylint: disable=pointless-statement
+            data.test_data  # pylint: disable=pointless-statement
+
+    def _model_ml_data(self, name: str) -> MLData:
+        ml_model = _ml_model(name)
+
+        return self._ml_data(ml_model["data_set"], label_col=ml_model["label_col"])
+
+    def _benchmark_fit(
+        self, name: str, create_estimator: Callable[[], BaseMLEstimator]
+    ) -> Callable[[], None]:
+        def fit():
+            estimator = create_estimator()
+            estimator.fit(*self._model_ml_data(name).train_data)
+            # Making fitted models available to the catalog for predictions
+            memory_data = self.context._memory_data  # pylint: disable=protected-access
+            memory_data[name] = estimator
+
+        return fit
+
+    def _benchmark_predict(self, name: str) -> Callable[[], None]:
+        def predict():
+            X_test, _ = self._model_ml_data(name).test_data
+            self.context.catalog.load(name).predict(X_test)
+
+        return predict
+
+    def _make_predictions(self):
+        PREDICTION_CACHE.clear()
+        MODEL_REGISTRY.clear()
+
+        with patch("augury.api.load_project_context", return_value=self.context):
+            return api.make_predictions((PREDICTION_YEAR, PREDICTION_YEAR + 1))
+
+
+def _current_commit() -> str:
+    return (
+        subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR,
+            capture_output=True,
+            check=True,
+        )
+        .stdout.decode()
+        .strip()
+    )
+
+
+def _save_results(results: Dict[str, Any]) -> str:
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    results_path = os.path.join(
+        RESULTS_DIR, f"pipeline-benchmarks_{results['commit']}.json"
+    )
+
+    with open(results_path, "w") as file:
+        json.dump(results, file, indent=2)
+
+    return results_path
+
+
+def _compare_results(results: Dict[str, BenchmarkResult], comparison_path: str) -> None:
+    with open(comparison_path, "r") as file:
+        comparison = json.load(file)
+
+    print(f"\nCompared to {comparison['commit']}:")
+
+    for name, result in results.items():
+        if name not in comparison["results"]:
+            continue
+
+        seconds = result["seconds"]
+        comparison_seconds = comparison["results"][name]["seconds"]
+        print(
+            f"{name}: {seconds:.3f}s vs {comparison_seconds:.3f}s "
+            f"({comparison_seconds / seconds:.1f}x speed-up)"
+        )
+
+
+def main(*args: str):
+    """Run the named benchmarks, or all of them if none are given."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("benchmark_names", nargs="*")
+    parser.add_argument("--seasons", type=int, default=DEFAULT_N_SEASONS)
+    parser.add_argument("--teams", type=int, default=len(TEAM_NAMES))
+    parser.add_argument("--compare", help="Path to earlier benchmark results")
+    params = parser.parse_args(args)
+
+    benchmarks = PipelineBenchmarks(params.seasons, params.teams)
+    results = benchmarks.run(
+        params.benchmark_names or list(benchmarks.benchmarks.keys())
+    )
+
+    results_path = _save_results(
+        {
+            "commit": _current_commit(),
+            "seasons": params.seasons,
+            "teams": params.teams,
+            "results": results,
+        }
+    )
+    print(f"\nSaved results to {results_path}")
+
+    if params.compare:
+        _compare_results(results, params.compare)
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
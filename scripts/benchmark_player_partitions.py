@@ -0,0 +1,159 @@
+"""Script for measuring peak memory of the player pipeline as seasons are added.
+
+Runs the player pipeline on synthetic data for increasing numbers of seasons,
+both all at once and partitioned by season. Each run gets a fresh process
+that loads raw player data from per-season files, so peak RSS measurements
+are independent, and the partitioned pipeline's should stay flat.
+
+Usage: python scripts/benchmark_player_partitions.py [--max-partition-mb MB]
+    [n_seasons ...]
+"""
+
+from typing import Any, Dict, List, Tuple
+from functools import partial
+from multiprocessing import get_context
+import argparse
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from kedro.io import DataCatalog, MemoryDataSet
+
+BASE_DIR = os.path.join(os.path.abspath(os.path.dirname(__file__)), "../")
+SRC_PATH = os.path.join(BASE_DIR, "src")
+
+if SRC_PATH not in sys.path:
+    sys.path.append(SRC_PATH)
+
+from benchmarks.synthetic_data import fake_raw_data
+from augury.runner import peak_memory_mb, run_in_memory
+from augury.partitioned import SHARED_DATA_SETS, process_player_partitions
+from augury.pipelines.match_pipeline import create_past_match_pipeline
+from augury.pipelines.player_pipeline import create_player_pipeline
+from augury.settings import SEED
+
+np.random.seed(SEED)
+
+LAST_SEASON = 2020
+DEFAULT_SEASON_COUNTS = [5, 10, 20, 40]
+# Synthetic seasons are smaller than real ones, so we use a lower limit than
+# the default to split them into several batches
+DEFAULT_MAX_PARTITION_MB = 16.0
+SHARED_DATA_FILENAME = "shared-data.pkl"
+
+
+def _save_raw_data(data_dir: str, n_seasons: int) -> None:
+    raw_data = fake_raw_data((LAST_SEASON - n_seasons, LAST_SEASON))
+
+    for season, season_data in raw_data.pop("player_data").groupby("season"):
+        season_data.to_json(
+            os.path.join(data_dir, f"{season}.json"),
+            orient="records",
+            date_format="iso",
+        )
+
+    with open(os.path.join(data_dir, SHARED_DATA_FILENAME), "wb") as file:
+        pickle.dump(raw_data, file)
+
+
+def _run_pipeline(data_dir: str, is_partitioned: bool, max_partition_mb: float):
+    start_time = time.perf_counter()
+
+    with open(os.path.join(data_dir, SHARED_DATA_FILENAME), "rb") as file:
+        raw_data = pickle.load(file)
+
+    season_paths = {
+        filename.replace(".json", ""): os.path.join(data_dir, filename)
+        for filename in os.listdir(data_dir)
+        if filename.endswith(".json")
+    }
+    pipeline = create_player_pipeline(
+        "1897-01-01",
+        f"{LAST_SEASON}-12-31",
+        past_match_pipeline=create_past_match_pipeline(),
+    )
+    catalog = DataCatalog(
+        {
+            data_set_name: MemoryDataSet(data=data)
+            for data_set_name, data in raw_data.items()
+        }
+    )
+
+    if is_partitioned:
+        shared_catalog = run_in_memory(pipeline.to_outputs(*SHARED_DATA_SETS), catalog)
+        process_player_partitions(
+            pipeline,
+            {
+                season: partial(pd.read_json, season_path)
+                for season, season_path in season_paths.items()
+            },
+            {
+                data_set_name: shared_catalog.load(data_set_name)
+                for data_set_name in SHARED_DATA_SETS
+            },
+            max_partition_mb=max_partition_mb,
+        )
+    else:
+        catalog.add(
+            "player_data",
+            MemoryDataSet(
+                data=pd.concat(
+                    [pd.read_json(season_path) for season_path in season_paths.values()]
+                )
+            ),
+        )
+        run_in_memory(pipeline, catalog)
+
+    return {
+        "seconds": time.perf_counter() - start_time,
+        "peak_rss_mb": peak_memory_mb(),
+    }
+
+
+def _measure(
+    n_seasons: int, max_partition_mb: float
+) -> List[Tuple[str, Dict[str, Any]]]:
+    with tempfile.TemporaryDirectory() as data_dir:
+        # Fresh (i.e. spawned rather than forked) processes for each run
+        # keep peak memory measurements separate from this one's. Peak RSS
+        # is inherited by child processes, so this one doesn't create any data.
+        with get_context("spawn").Pool(processes=1, maxtasksperchild=1) as pool:
+            pool.apply(_save_raw_data, (data_dir, n_seasons))
+
+            return [
+                (
+                    pipeline_name,
+                    pool.apply(
+                        _run_pipeline, (data_dir, is_partitioned, max_partition_mb)
+                    ),
+                )
+                for pipeline_name, is_partitioned in [
+                    ("player", False),
+                    ("partitioned_player", True),
+                ]
+            ]
+
+
+def main(*args: str):
+    """Run the player pipeline with and without partitions for each season count."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("season_counts", nargs="*", type=int)
+    parser.add_argument(
+        "--max-partition-mb", type=float, default=DEFAULT_MAX_PARTITION_MB
+    )
+    params = parser.parse_args(args)
+
+    for n_seasons in params.season_counts or DEFAULT_SEASON_COUNTS:
+        for pipeline_name, result in _measure(n_seasons, params.max_partition_mb):
+            print(
+                f"{pipeline_name} ({n_seasons} seasons): {result['seconds']:.3f}s, "
+                f"peak RSS {result['peak_rss_mb']:.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
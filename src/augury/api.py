@@ -1,8 +1,10 @@
 """The public API for the Augury app."""
 
 from typing import List, Optional, Dict, Union, Any
+import hashlib
 
 import pandas as pd
+import joblib
 from mypy_extensions import TypedDict
 from kedro.framework.context import KedroContext
 import simplejson
@@ -10,11 +12,15 @@ import simplejson
 from augury.data_import import match_data
 from augury.nodes import match
 from augury.predictions import Predictor
+from augury.data_cache import ML_DATA_CACHE
+from augury.io.catalog import data_set_file_info
+from augury.io.json_remote_data_set import REMOTE_DATA_VERSIONS
+from augury.model_registry import MODEL_REGISTRY
+from augury.result_cache import PREDICTION_CACHE
 from augury.types import YearRange, MLModelDict
 from augury.settings import ML_MODELS
 from augury.context import load_project_context
 
-
 ApiResponse = TypedDict(
     "ApiResponse", {"data": Union[List[Dict[str, Any]], Dict[str, Any]]}
 )
@@ -39,11 +45,86 @@ def _api_response(data: Union[pd.DataFrame, Dict[str, Any]]) -> ApiResponse:
     return {"data": response_data}
 
 
-def _run_pipelines(context: KedroContext, ml_models: List[MLModelDict]):
+def _run_pipelines(
+    context: KedroContext,
+    ml_models: List[MLModelDict],
+    year_range: YearRange,
+    train: bool,
+):
     data_set_names = {ml_model["data_set"] for ml_model in ml_models}
 
     for data_set_name in data_set_names:
-        context.run(pipeline_name=PIPELINE_NAMES[data_set_name])
+        # Ignoring, because ProjectContext has project-specific attributes,
+        # and importing it to use as a type tends to create circular dependencies
+        context.run_prediction_slice(  # type: ignore
+            PIPELINE_NAMES[data_set_name],
+            data_set_name,
+            year_range,
+            # Training requires data from earlier seasons, which we can load
+            # from the saved data set rather than recalculating
+            include_history=train,
+        )
+
+
+def _input_data_digest(context: KedroContext, ml_models: List[MLModelDict]) -> str:
+    pipelines = context.pipelines
+    input_names = sorted(
+        set().union(
+            *[
+                pipelines[PIPELINE_NAMES[ml_model["data_set"]]].inputs()
+                for ml_model in ml_models
+            ]
+        )
+        | {ml_model["name"] for ml_model in ml_models}
+    )
+
+    catalog = context.catalog
+    digest = hashlib.sha256()
+
+    for input_name in input_names:
+        # We only check the metadata of files (e.g. saved raw data and models).
+        # Fetching remote data (e.g. rosters or match results for the current season)
+        # would cost as much as making the predictions, so we use the version
+        # of the remote data fetched so far instead. It changes whenever a data source
+        # returns different data than last time (e.g. for another request).
+        file_info = sorted(data_set_file_info(catalog, input_name).items(), key=str)
+        digest.update(f"{input_name}:{joblib.hash(file_info)}".encode())
+
+    digest.update(f"remote_data:{REMOTE_DATA_VERSIONS.version}".encode())
+
+    return digest.hexdigest()
+
+
+def _clear_stale_predictions(match_results: pd.DataFrame) -> pd.DataFrame:
+    # Predictions depend on the results of earlier matches, so any new results
+    # make cached predictions stale
+    if not match_results.empty:
+        PREDICTION_CACHE.clear()
+
+    return match_results
+
+
+def _make_predictions(
+    context: KedroContext,
+    year_range: YearRange,
+    ml_models: List[MLModelDict],
+    train: bool,
+) -> ApiResponse:
+    _run_pipelines(context, ml_models, year_range, train)
+
+    predictor = Predictor(
+        year_range,
+        context,
+        # Ignoring, because ProjectContext has project-specific attributes,
+        # and importing it to use as a type tends to create circular dependencies
+        round_number=context.round_number,  # type: ignore
+        train=train,
+        verbose=1,
+    )
+
+    predictions = predictor.make_predictions(ml_models)
+
+    return _api_response(predictions)
 
 
 def make_predictions(
@@ -54,6 +135,13 @@ def make_predictions(
 ) -> ApiResponse:
     """Generate predictions for the given year and round number.
 
+    Responses are cached until input files change, new match results are fetched
+    (via `fetch_match_data` or `fetch_match_results_data`), remote data fetched
+    for any request (e.g. rosters) changes, or they expire (per the
+    PREDICTION_CACHE_TTL_SECONDS env var, or an hour), and identical requests
+    that arrive while predictions are being generated wait for the same response
+    rather than generating their own.
+
     Params
     ------
     year_range: Year range for which you want prediction data. Format = yyyy-yyyy.
@@ -73,21 +161,18 @@ def make_predictions(
             ml_model for ml_model in ML_MODELS if ml_model["name"] in ml_model_names
         ]
 
-    _run_pipelines(context, ml_models)
-
-    predictor = Predictor(
-        year_range,
-        context,
-        # Ignoring, because ProjectContext has project-specific attributes,
-        # and importing it to use as a type tends to create circular dependencies
-        round_number=context.round_number,  # type: ignore
-        train=train,
-        verbose=1,
+    request_key = (
+        tuple(year_range),
+        round_number,
+        tuple(sorted(ml_model["name"] for ml_model in ml_models)),
+        train,
     )
 
-    predictions = predictor.make_predictions(ml_models)
-
-    return _api_response(predictions)
+    return PREDICTION_CACHE.get_or_compute(
+        request_key,
+        _input_data_digest(context, ml_models),
+        lambda: _make_predictions(context, year_range, ml_models, train),
+    )
 
 
 def fetch_fixture_data(
@@ -140,7 +225,9 @@ def fetch_match_data(
             data_import.fetch_match_data(
                 start_date=start_date, end_date=end_date, verbose=verbose
             )
-        ).pipe(match.clean_match_data)
+        )
+        .pipe(match.clean_match_data)
+        .pipe(_clear_stale_predictions)
     )
 
 
@@ -162,10 +249,23 @@ def fetch_match_results_data(
     return _api_response(
         pd.DataFrame(
             data_import.fetch_match_results_data(round_number, verbose=verbose)
-        ).pipe(match.clean_match_results_data)
+        )
+        .pipe(match.clean_match_results_data)
+        .pipe(_clear_stale_predictions)
     )
 
 
 def fetch_ml_model_info() -> ApiResponse:
     """Fetch general info about all saved ML models."""
     return _api_response(ML_MODELS)
+
+
+def fetch_model_registry_stats() -> ApiResponse:
+    """Fetch cache counters for the ML models, data and predictions of this process."""
+    return _api_response(
+        {
+            **MODEL_REGISTRY.stats,
+            "data_cache": ML_DATA_CACHE.stats,
+            "prediction_cache": PREDICTION_CACHE.stats,
+        }
+    )
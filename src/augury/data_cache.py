@@ -0,0 +1,213 @@
+"""Process-wide cache of model data sets and the features and labels made from them."""
+
+from typing import Any, Dict, Optional, Set, Tuple
+from collections import OrderedDict
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+from mypy_extensions import TypedDict
+
+
+# Each combination of data set and label column gets an entry, but entries
+# for the same data set share their data and features, so the default is enough
+# for the data sets and labels in ML_MODELS without holding many copies in memory
+DEFAULT_MAX_ENTRIES = int(os.getenv("ML_DATA_CACHE_MAX_ENTRIES", "4"))
+
+CacheKey = Tuple[str, str]
+CachedData = TypedDict(
+    "CachedData",
+    {
+        # Identifies the loaded data (e.g. file metadata), so changed files
+        # don't get served from the cache
+        "signature": Tuple[Any, ...],
+        # Years loaded from a partitioned data set (None means all of them)
+        "loaded_years": Optional[Set[int]],
+        "data": pd.DataFrame,
+        "X": Optional[pd.DataFrame],
+        "y": Optional[pd.Series],
+        "row_years": Optional[np.ndarray],
+    },
+)
+
+
+def _copy_data(data: Any) -> Any:
+    return None if data is None else data.copy()
+
+
+def _updated_data(new_data: Any, previous_data: Any) -> Any:
+    # Data that hasn't been passed in keeps its previous value
+    return previous_data if new_data is None else _copy_data(new_data)
+
+
+def _copy_cached_data(cached_data: CachedData) -> CachedData:
+    return {
+        "signature": cached_data["signature"],
+        "loaded_years": cached_data["loaded_years"],
+        "data": _copy_data(cached_data["data"]),
+        "X": _copy_data(cached_data["X"]),
+        "y": _copy_data(cached_data["y"]),
+        "row_years": _copy_data(cached_data["row_years"]),
+    }
+
+
+class MLDataCache:
+    """Keeps loaded model data in memory, keyed by data set and label column.
+
+    The cache stores and returns copies of data, so MLData objects can't
+    change each other's data by modifying it in place.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Instantiate an MLDataCache object.
+
+        Params
+        ------
+        max_entries: Maximum number of data set/label column combinations to keep.
+            The least-recently-used entries are dropped first.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[CacheKey, CachedData]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(
+        self,
+        data_set: str,
+        label_col: str,
+        signature: Tuple[Any, ...],
+        required_years: Set[int],
+    ) -> Optional[CachedData]:
+        """Get cached data for the data set and label column if it's still valid.
+
+        Params
+        ------
+        data_set: Name of the data set in the catalog.
+        label_col: Name of the column used for labels.
+        signature: Identifies the current version of the data set. Cached data
+            with a different signature is stale.
+        required_years: Years that the data must include.
+
+        Returns
+        -------
+        A copy of the cached data, or None if there isn't any that's valid.
+            When only data for a different label column is cached, its data
+            and features are returned without labels.
+        """
+        with self._lock:
+            cached_data = self._entries.get((data_set, label_col))
+
+            if cached_data is not None and self._is_valid(
+                cached_data, signature, required_years
+            ):
+                self.hits += 1
+                self._entries.move_to_end((data_set, label_col))
+                return _copy_cached_data(cached_data)
+
+            # Features don't depend on the label column, so we can share them
+            # between labels
+            for (cached_data_set, _), other_cached_data in reversed(
+                list(self._entries.items())
+            ):
+                if cached_data_set == data_set and self._is_valid(
+                    other_cached_data, signature, required_years
+                ):
+                    self.hits += 1
+                    self._add_entry(
+                        (data_set, label_col), {**other_cached_data, "y": None}
+                    )
+                    return _copy_cached_data(self._entries[(data_set, label_col)])
+
+            self.misses += 1
+            return None
+
+    def set(self, data_set: str, label_col: str, cached_data: CachedData) -> None:
+        """Cache a copy of the data for the data set and label column.
+
+        Params
+        ------
+        data_set: Name of the data set in the catalog.
+        label_col: Name of the column used for labels.
+        cached_data: Loaded data and whatever has been calculated from it. Data
+            that is None keeps its cached value, as long as the signature
+            and loaded years are the same, so callers only need to pass
+            what they've calculated since the last time.
+        """
+        with self._lock:
+            existing_data = self._entries.get((data_set, label_col))
+            previous_data = (
+                existing_data
+                if existing_data is not None
+                and self._is_same_data(existing_data, cached_data)
+                else cached_data
+            )
+
+            self._add_entry(
+                (data_set, label_col),
+                {
+                    "signature": cached_data["signature"],
+                    "loaded_years": cached_data["loaded_years"],
+                    "data": _updated_data(cached_data["data"], previous_data["data"]),
+                    "X": _updated_data(cached_data["X"], previous_data["X"]),
+                    "y": _updated_data(cached_data["y"], previous_data["y"]),
+                    "row_years": _updated_data(
+                        cached_data["row_years"], previous_data["row_years"]
+                    ),
+                },
+            )
+
+    def clear(self, data_set: Optional[str] = None) -> None:
+        """Remove cached data for the named data set, or all data if none is given."""
+        with self._lock:
+            for key in list(self._entries.keys()):
+                if data_set is None or key[0] == data_set:
+                    del self._entries[key]
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters and the data set/label column combinations in the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "max_entries": self.max_entries,
+                "entries": [list(key) for key in self._entries.keys()],
+            }
+
+    def _add_entry(self, key: CacheKey, cached_data: CachedData) -> None:
+        self._entries[key] = cached_data
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > max(self.max_entries, 1):
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @staticmethod
+    def _is_same_data(cached_data: CachedData, other_cached_data: CachedData) -> bool:
+        return (
+            cached_data["signature"] == other_cached_data["signature"]
+            and cached_data["loaded_years"] == other_cached_data["loaded_years"]
+        )
+
+    @staticmethod
+    def _is_valid(
+        cached_data: Optional[CachedData],
+        signature: Tuple[Any, ...],
+        required_years: Set[int],
+    ) -> bool:
+        return (
+            cached_data is not None
+            and cached_data["signature"] == signature
+            and (
+                cached_data["loaded_years"] is None
+                or required_years <= cached_data["loaded_years"]
+            )
+        )
+
+
+# Each gunicorn worker gets its own cache, which lives as long as the worker
+ML_DATA_CACHE = MLDataCache()
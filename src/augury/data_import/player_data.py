@@ -109,6 +109,7 @@ def save_player_data(
     end_date: str = END_OF_LAST_YEAR,
     verbose: int = 1,
     for_prod: bool = False,
+    by_season: bool = False,
 ) -> None:
     """
     Save match data as a *.json file with name based on date range of data.
@@ -121,6 +122,8 @@ def save_player_data(
     for_prod (bool): Whether saved data set is meant for loading in production.
         If True, this overwrites the given start_date to limit the data set
         to the last 10 years to limit memory usage.
+    by_season (bool): Whether to save a file per season in a player-data directory,
+        for loading one season at a time with the partitioned player pipeline.
 
     Returns
     -------
@@ -130,10 +133,24 @@ def save_player_data(
         start_date = max(start_date, PREDICTION_DATA_START_DATE)
 
     data = fetch_player_data(start_date=start_date, end_date=end_date, verbose=verbose)
-    filepath = os.path.join(RAW_DATA_DIR, f"player-data_{start_date}_{end_date}.json")
 
-    with open(filepath, "w") as json_file:
-        json.dump(data, json_file, indent=2)
+    if by_season:
+        season_dir = os.path.join(RAW_DATA_DIR, "player-data")
+        os.makedirs(season_dir, exist_ok=True)
+
+        for season, season_data in itertools.groupby(
+            sorted(data, key=lambda player: player["season"]),
+            key=lambda player: player["season"],
+        ):
+            with open(os.path.join(season_dir, f"{season}.json"), "w") as json_file:
+                json.dump(list(season_data), json_file, indent=2)
+    else:
+        filepath = os.path.join(
+            RAW_DATA_DIR, f"player-data_{start_date}_{end_date}.json"
+        )
+
+        with open(filepath, "w") as json_file:
+            json.dump(data, json_file, indent=2)
 
     if verbose == 1:
         print("Player data saved")
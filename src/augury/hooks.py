@@ -0,0 +1,261 @@
+"""Kedro hooks for profiling the time and memory used by each pipeline node."""
+
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+from kedro.framework.hooks import hook_impl
+from kedro.pipeline.node import Node
+from mypy_extensions import TypedDict
+
+from augury.runner import peak_memory_mb
+from augury.settings import BASE_DIR
+
+REPORTING_DIR = os.path.join(BASE_DIR, "data/08_reporting")
+# Profiling measures the memory size of every node's inputs and outputs,
+# which isn't free, so it's opt-in
+PROFILING_ENABLED = os.getenv("PROFILE_NODES", "false").lower() == "true"
+# Path to a JSON file of node names (as they appear in Kedro's logs) mapped to
+# maximum values per metric (e.g. {"*": {"wall_seconds": 30}}).
+# The key "*" applies to all nodes.
+PROFILING_BUDGET_PATH = os.getenv("PROFILE_NODES_BUDGET")
+BYTES_PER_MEGABYTE = 1024 ** 2
+DEFAULT_BUDGET_KEY = "*"
+
+DataFrameProfile = TypedDict(
+    "DataFrameProfile", {"rows": int, "columns": int, "memory_mb": float}
+)
+NodeProfile = TypedDict(
+    "NodeProfile",
+    {
+        "node": str,
+        "wall_seconds": float,
+        "cpu_seconds": float,
+        "peak_rss_delta_mb": float,
+        "inputs": Dict[str, DataFrameProfile],
+        "outputs": Dict[str, DataFrameProfile],
+    },
+)
+ProfilingBudget = Dict[str, Dict[str, float]]
+
+
+class NodeBudgetExceeded(Exception):
+    """Raised when a node uses more time or memory than its profiling budget."""
+
+
+def _profile_data_frames(data: Dict[str, Any]) -> Dict[str, DataFrameProfile]:
+    return {
+        data_set_name: {
+            "rows": len(data_frame),
+            "columns": len(data_frame.columns),
+            "memory_mb": data_frame.memory_usage(index=True, deep=True).sum()
+            / BYTES_PER_MEGABYTE,
+        }
+        for data_set_name, data_frame in data.items()
+        if isinstance(data_frame, pd.DataFrame)
+    }
+
+
+def _sum_profiles(
+    data_frame_profiles: Dict[str, DataFrameProfile], metric: str
+) -> float:
+    return sum(profile[metric] for profile in data_frame_profiles.values())
+
+
+def load_budget(budget_path: Optional[str]) -> ProfilingBudget:
+    """Load a profiling budget from a JSON file, returning an empty one for no path.
+
+    Params
+    ------
+    budget_path: Path to a JSON file that maps node names to maximum values
+        for 'wall_seconds', 'cpu_seconds', or 'peak_rss_delta_mb'.
+
+    Returns
+    -------
+    Dictionary of maximum metric values per node name.
+    """
+    if budget_path is None:
+        return {}
+
+    with open(budget_path, "r") as file:
+        return json.load(file)
+
+
+class NodeProfilingHooks:
+    """Records wall time, CPU time, and memory usage for each node in a run.
+
+    When the pipeline finishes, results are written to JSON and CSV reports.
+    If any node exceeds its budget, the run fails after the reports are written,
+    so that the regression can be inspected.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = PROFILING_ENABLED,
+        report_dir: str = REPORTING_DIR,
+        budget: Optional[ProfilingBudget] = None,
+        budget_path: Optional[str] = PROFILING_BUDGET_PATH,
+    ):
+        """Instantiate a NodeProfilingHooks object.
+
+        Params
+        ------
+        enabled: Whether to profile nodes. Hooks are registered globally,
+            so this lets us keep them attached without the overhead.
+        report_dir: Directory in which to save profiling reports.
+        budget: Maximum metric values per node name. Defaults to the contents
+            of the file at `budget_path`, if any.
+        budget_path: Path to a JSON budget file, which is only read when
+            a profiled pipeline starts running, because hooks are created
+            whenever the project context is imported.
+        """
+        self.enabled = enabled
+        self.report_dir = report_dir
+        self.budget = budget
+        self.budget_path = budget_path
+        self.node_profiles: List[NodeProfile] = []
+        self._node_starts: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @hook_impl
+    def before_pipeline_run(self) -> None:
+        """Reset profiles from any earlier run and load the budget if necessary."""
+        with self._lock:
+            self.node_profiles = []
+            self._node_starts = {}
+
+            if self.enabled and self.budget is None:
+                self.budget = load_budget(self.budget_path)
+
+    @hook_impl
+    def before_node_run(self, node: Node) -> None:
+        """Record time and memory usage before the node runs."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._node_starts[node.name] = {
+                "wall_seconds": time.perf_counter(),
+                "cpu_seconds": time.process_time(),
+                "peak_rss_mb": peak_memory_mb(),
+            }
+
+        return None
+
+    @hook_impl
+    def after_node_run(
+        self, node: Node, inputs: Dict[str, Any], outputs: Dict[str, Any]
+    ) -> None:
+        """Record the node's time and memory usage along with its data sizes."""
+        if not self.enabled:
+            return None
+
+        wall_seconds = time.perf_counter()
+        cpu_seconds = time.process_time()
+        peak_rss_mb = peak_memory_mb()
+
+        with self._lock:
+            node_start = self._node_starts.pop(node.name)
+
+        node_profile: NodeProfile = {
+            "node": node.name,
+            "wall_seconds": wall_seconds - node_start["wall_seconds"],
+            "cpu_seconds": cpu_seconds - node_start["cpu_seconds"],
+            # Peak RSS only ever goes up, so this is how much the node raised it by
+            # rather than its total memory usage
+            "peak_rss_delta_mb": peak_rss_mb - node_start["peak_rss_mb"],
+            "inputs": _profile_data_frames(inputs),
+            "outputs": _profile_data_frames(outputs),
+        }
+
+        with self._lock:
+            self.node_profiles.append(node_profile)
+
+        return None
+
+    @hook_impl
+    def after_pipeline_run(self, run_params: Dict[str, Any]) -> None:
+        """Write profiling reports, then check node profiles against the budget."""
+        if not self.enabled:
+            return None
+
+        self.write_reports(run_params.get("run_id"))
+
+        over_budget = self.over_budget()
+
+        if any(over_budget):
+            raise NodeBudgetExceeded(
+                "The following nodes exceeded their profiling budget:\n"
+                + "\n".join(over_budget)
+            )
+
+        return None
+
+    def write_reports(self, run_id: Optional[str] = None) -> Dict[str, str]:
+        """Save node profiles to JSON and CSV files in the report directory.
+
+        Params
+        ------
+        run_id: ID of the pipeline run, used in report file names. Defaults
+            to the current timestamp.
+
+        Returns
+        -------
+        Paths to the saved reports, keyed by file format.
+        """
+        report_name = f"node-profiles_{run_id or datetime.now().isoformat()}"
+        report_paths = {
+            file_format: os.path.join(self.report_dir, f"{report_name}.{file_format}")
+            for file_format in ["json", "csv"]
+        }
+
+        with open(report_paths["json"], "w") as file:
+            json.dump(self.node_profiles, file, indent=2)
+
+        # Flattening data frame profiles to totals, because CSV is mostly for
+        # comparing nodes at a glance
+        pd.DataFrame(
+            [
+                {
+                    "node": node_profile["node"],
+                    "wall_seconds": node_profile["wall_seconds"],
+                    "cpu_seconds": node_profile["cpu_seconds"],
+                    "peak_rss_delta_mb": node_profile["peak_rss_delta_mb"],
+                    **{
+                        f"{data_type}_{metric}": _sum_profiles(
+                            node_profile[data_type], metric  # type: ignore
+                        )
+                        for data_type in ["inputs", "outputs"]
+                        for metric in ["rows", "columns", "memory_mb"]
+                    },
+                }
+                for node_profile in self.node_profiles
+            ]
+        ).to_csv(report_paths["csv"], index=False)
+
+        return report_paths
+
+    def over_budget(self) -> List[str]:
+        """Describe each node metric that exceeds its budget.
+
+        Returns
+        -------
+        List of descriptions of node metrics that are over budget.
+        """
+        budget = self.budget or {}
+        default_budget = budget.get(DEFAULT_BUDGET_KEY, {})
+
+        return [
+            f"{node_profile['node']}: {metric} was {node_profile[metric]:.2f} "  # type: ignore
+            f"(budget: {max_value})"
+            for node_profile in self.node_profiles
+            for metric, max_value in {
+                **default_budget,
+                **budget.get(node_profile["node"], {}),
+            }.items()
+            if node_profile[metric] > max_value  # type: ignore
+        ]
@@ -0,0 +1,421 @@
+"""Incremental updates of feature data sets for new rounds of matches.
+
+Rather than recalculating features for all of history every time a round of matches
+is played, we persist the running state of each node whose features depend on
+earlier matches (e.g. season-to-date sums, the cumulative sums & counts that fill
+rolling windows, previous-match values, win streaks, and Elo ratings), which only
+grows with the number of teams, players, and venues. Stateful versions
+of those nodes continue from the saved state with the same calculations
+as the full pipeline, which guarantees identical results, and every other node
+runs unchanged on just the new rows.
+"""
+
+from typing import Any, Callable, Dict, Tuple, Optional
+from functools import partial, update_wrapper
+
+import pandas as pd
+import numpy as np
+from kedro.framework.context import KedroContext
+from kedro.pipeline import Pipeline, node
+from kedro.pipeline.node import Node
+from kedro.io import DataCatalog, MemoryDataSet
+from mypy_extensions import TypedDict
+
+from augury.pipelines import create_pipelines
+from augury.runner import run_in_memory
+from augury.nodes import feature_calculation, match, player
+from augury.settings import INDEX_COLS
+
+RoundKey = Tuple[int, int]
+
+IncrementalPipelineSpec = TypedDict(
+    "IncrementalPipelineSpec",
+    {
+        "pipeline_name": str,
+        "state_input": str,
+        "final_data_set": str,
+        "state_data_set": str,
+        # Stateful versions of nodes that depend on earlier matches, keyed by
+        # the nodes' outputs. They take the same arguments as the nodes' functions,
+        # plus the state, and return the output plus the next state.
+        "stateful_nodes": Dict[str, Callable],
+    },
+)
+
+FeatureState = TypedDict(
+    "FeatureState",
+    {
+        # Year & round number of the last round included in the node states
+        "last_round": Optional[RoundKey],
+        "node_states": Dict[str, Any],
+    },
+)
+
+MATCH_PIPELINE_SPEC: IncrementalPipelineSpec = {
+    "pipeline_name": "match",
+    # Last data set before any features that depend on earlier matches
+    "state_input": "match_data_a",
+    "final_data_set": "final_match_data",
+    "state_data_set": "match_feature_state",
+    "stateful_nodes": {
+        "shifted_match_data": match.shift_features_with_state,
+        "match_data_g": match.add_cum_win_points_with_state,
+        "match_data_h": match.add_win_streak_with_state,
+        "match_data_i": feature_calculation.calculate_features_with_state,
+        "match_data_k": match.add_cum_percent_with_state,
+    },
+}
+
+LEGACY_MATCH_PIPELINE_SPEC: IncrementalPipelineSpec = {
+    "pipeline_name": "legacy",
+    # Elo ratings get calculated from match rows, before they're split by team
+    "state_input": "filtered_past_match_data",
+    "final_data_set": "final_legacy_match_data",
+    "state_data_set": "legacy_match_feature_state",
+    "stateful_nodes": {
+        "match_data_a": match.add_elo_rating_with_state,
+        "match_data_g": match.shift_features_with_state,
+        "match_data_h": match.add_cum_win_points_with_state,
+        "match_data_i": match.add_win_streak_with_state,
+        "match_data_j": feature_calculation.calculate_features_with_state,
+        "match_data_l": match.add_cum_percent_with_state,
+        "match_data_o": feature_calculation.calculate_features_with_state,
+    },
+}
+
+BETTING_PIPELINE_SPEC: IncrementalPipelineSpec = {
+    "pipeline_name": "betting",
+    "state_input": "stacked_betting_data",
+    "final_data_set": "final_betting_data",
+    "state_data_set": "betting_feature_state",
+    "stateful_nodes": {
+        "betting_data_b": feature_calculation.calculate_features_with_state
+    },
+}
+
+PLAYER_PIPELINE_SPEC: IncrementalPipelineSpec = {
+    "pipeline_name": "player",
+    "state_input": "stacked_player_data",
+    "final_data_set": "final_player_data",
+    "state_data_set": "player_feature_state",
+    "stateful_nodes": {
+        "player_data_a": player.add_last_year_brownlow_votes_with_state,
+        "player_data_b": player.add_rolling_player_stats_with_state,
+        "player_data_c": player.add_cum_matches_played_with_state,
+    },
+}
+
+
+INCREMENTAL_PIPELINE_SPECS = [
+    MATCH_PIPELINE_SPEC,
+    LEGACY_MATCH_PIPELINE_SPEC,
+    BETTING_PIPELINE_SPEC,
+    PLAYER_PIPELINE_SPEC,
+]
+
+
+def _index_keys(data_frame: pd.DataFrame, team_col: str = "team") -> pd.MultiIndex:
+    return pd.MultiIndex.from_arrays(
+        [data_frame[team_col], data_frame["year"], data_frame["round_number"]]
+    )
+
+
+def _is_complete(data_frame: pd.DataFrame) -> pd.Series:
+    # Match rows (e.g. for Elo ratings) haven't been split by team yet
+    score_cols = (
+        ["score", "oppo_score"]
+        if "score" in data_frame.columns
+        else ["home_score", "away_score"]
+    )
+
+    # Fixture rows get filled with zero scores, and AFL matches never end 0-0
+    return (data_frame[score_cols] > 0).any(axis=1)
+
+
+def _is_after_round(
+    data_frame: pd.DataFrame, round_key: Optional[RoundKey]
+) -> np.ndarray:
+    if round_key is None:
+        return np.full(len(data_frame), True)
+
+    year, round_number = round_key
+
+    return (
+        (data_frame["year"] > year)
+        | ((data_frame["year"] == year) & (data_frame["round_number"] > round_number))
+    ).to_numpy()
+
+
+def _last_complete_round(
+    input_data: pd.DataFrame, last_round: Optional[RoundKey]
+) -> Optional[RoundKey]:
+    # Results for incomplete matches (i.e. fixtures) will change, so state can only
+    # include rounds before the first one with an incomplete match
+    round_keys = [
+        (int(year), int(round_number))
+        for year, round_number in zip(input_data["year"], input_data["round_number"])
+    ]
+    first_incomplete_round = min(
+        (
+            round_key
+            for round_key, is_complete in zip(round_keys, _is_complete(input_data))
+            if not is_complete
+        ),
+        default=None,
+    )
+
+    return max(
+        (
+            round_key
+            for round_key in round_keys
+            if first_incomplete_round is None or round_key < first_incomplete_round
+        ),
+        default=last_round,
+    )
+
+
+def _apply_node_state(stateful_func: Callable, state: Any, data_frame: pd.DataFrame):
+    return stateful_func(data_frame, state)
+
+
+def _stateful_node(pipeline_node: Node, stateful_func: Callable, state: Any) -> Node:
+    node_func = pipeline_node.func
+    # Node functions with arguments (e.g. columns to shift) are partials,
+    # and their stateful versions take the same arguments
+    bound_stateful_func = (
+        partial(stateful_func, *node_func.args, **node_func.keywords)
+        if isinstance(node_func, partial)
+        else stateful_func
+    )
+    (output,) = pipeline_node.outputs
+
+    return node(
+        update_wrapper(
+            partial(_apply_node_state, bound_stateful_func, state), stateful_func
+        ),
+        pipeline_node.inputs,
+        [output, f"{output}_state"],
+    )
+
+
+def _run_with_state(
+    feature_pipeline: Pipeline,
+    spec: IncrementalPipelineSpec,
+    node_states: Dict[str, Any],
+    input_data: pd.DataFrame,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    stateful_nodes = spec["stateful_nodes"]
+    pipeline_outputs = feature_pipeline.all_outputs()
+
+    assert all([output in pipeline_outputs for output in stateful_nodes]), (
+        f"The {spec['pipeline_name']} pipeline has no nodes for some stateful "
+        f"outputs: {set(stateful_nodes) - pipeline_outputs}"
+    )
+
+    stateful_pipeline = Pipeline(
+        [
+            _stateful_node(
+                pipeline_node,
+                stateful_nodes[pipeline_node.outputs[0]],
+                node_states.get(pipeline_node.outputs[0]),
+            )
+            if pipeline_node.outputs[0] in stateful_nodes
+            else pipeline_node
+            for pipeline_node in feature_pipeline.nodes
+        ]
+    )
+
+    catalog = run_in_memory(
+        stateful_pipeline,
+        DataCatalog({spec["state_input"]: MemoryDataSet(data=input_data)}),
+    )
+
+    return (
+        catalog.load(spec["final_data_set"]),
+        {output: catalog.load(f"{output}_state") for output in stateful_nodes},
+    )
+
+
+def append_features(
+    feature_pipeline: Pipeline,
+    spec: IncrementalPipelineSpec,
+    state: Optional[FeatureState],
+    new_data: pd.DataFrame,
+) -> Tuple[pd.DataFrame, FeatureState]:
+    """Calculate features for new rows, continuing from the saved state of earlier rows.
+
+    Params
+    ------
+    feature_pipeline: Pipeline that calculates features, starting from
+        the state input data set.
+    spec: Names of the incremental pipeline's data sets and stateful nodes.
+    state: Saved state from earlier rows, as returned by an earlier call.
+        Pass None to calculate features from the new rows alone.
+    new_data: Rows from the state input data set for matches after
+        the state's last round.
+
+    Returns
+    -------
+    A data frame with features for the new rows, and the state for calculating
+        features for later matches.
+    """
+    last_round = None if state is None else state["last_round"]
+    node_states = {} if state is None else state["node_states"]
+
+    new_feature_data, next_node_states = _run_with_state(
+        feature_pipeline, spec, node_states, new_data
+    )
+    next_last_round = _last_complete_round(new_data, last_round)
+
+    if next_last_round == last_round:
+        next_node_states = node_states
+    # Incomplete rounds don't go into the state, so they get recalculated
+    # with the next batch of new rows
+    elif _is_after_round(new_data, next_last_round).any():
+        _, next_node_states = _run_with_state(
+            feature_pipeline,
+            spec,
+            node_states,
+            new_data.loc[~_is_after_round(new_data, next_last_round)],
+        )
+
+    return (
+        new_feature_data,
+        {"last_round": next_last_round, "node_states": next_node_states},
+    )
+
+
+def combine_final_data(
+    saved_final_data: pd.DataFrame, new_feature_data: pd.DataFrame
+) -> pd.DataFrame:
+    """Replace saved feature rows with new ones for the same matches.
+
+    Params
+    ------
+    saved_final_data: Final data set as loaded from the catalog.
+    new_feature_data: Feature rows returned by `append_features`.
+
+    Returns
+    -------
+    Data frame with the same index and dtypes as the output of a full pipeline run.
+    """
+    # Data sets saved as JSON lose their index and dtypes (e.g. dates are strings,
+    # and integers with missing values are floats), so we restore those of
+    # freshly-calculated rows, which are the same as for a full run
+    saved_final_data = (
+        saved_final_data.astype(
+            {
+                column: dtype
+                for column, dtype in new_feature_data.dtypes.items()
+                if column in saved_final_data.columns and column != "date"
+            }
+        )
+        .assign(
+            date=lambda df: pd.to_datetime(df["date"], utc=True).dt.tz_convert(
+                new_feature_data["date"].dt.tz
+            )
+        )
+        .set_index(INDEX_COLS, drop=False)
+        .rename_axis([None] * len(INDEX_COLS))
+    )
+
+    return pd.concat(
+        [
+            saved_final_data.loc[
+                ~_index_keys(saved_final_data).isin(_index_keys(new_feature_data))
+            ],
+            new_feature_data,
+        ],
+        sort=False,
+    ).sort_index()
+
+
+def calculate_new_rounds(
+    context: KedroContext, spec: IncrementalPipelineSpec = MATCH_PIPELINE_SPEC
+) -> Tuple[pd.DataFrame, Optional[FeatureState]]:
+    """Calculate feature rows for any matches played or scheduled since the last update.
+
+    Rows for earlier matches come from the saved final data set. Without saved state,
+    we calculate features for all matches in the context's date range.
+    Nothing gets saved, so the result can be used without changing
+    the persisted data sets.
+
+    Params
+    ------
+    context: Kedro context with catalog entries for the spec's data sets.
+    spec: Names of the incremental pipeline's data sets and stateful nodes.
+
+    Returns
+    -------
+    The updated final data set, and the state for calculating features
+        for later matches (None if there are no new matches).
+    """
+    catalog = context.catalog
+    has_state = catalog.exists(spec["state_data_set"])
+    state = catalog.load(spec["state_data_set"]) if has_state else None
+    last_round = None if state is None else state["last_round"]
+
+    # Ignoring, because ProjectContext has project-specific attributes,
+    # and importing it to use as a type tends to create circular dependencies
+    start_date = (
+        context.start_date  # type: ignore
+        if last_round is None
+        # Seasons don't cross calendar years, so we load the whole season
+        # of the last saved round, then filter by round
+        else f"{last_round[0]}-01-01"
+    )
+    pipeline = create_pipelines(start_date, context.end_date)[  # type: ignore
+        spec["pipeline_name"]
+    ]
+
+    input_data = run_in_memory(pipeline.to_outputs(spec["state_input"]), catalog).load(
+        spec["state_input"]
+    )
+    new_data = input_data.loc[_is_after_round(input_data, last_round)]
+
+    if state is not None and new_data.empty:
+        return pd.DataFrame(catalog.load(spec["final_data_set"])), None
+
+    new_feature_data, next_state = append_features(
+        pipeline.from_inputs(spec["state_input"]).to_outputs(spec["final_data_set"]),
+        spec,
+        state,
+        new_data,
+    )
+
+    final_data = (
+        new_feature_data
+        if state is None
+        else combine_final_data(
+            pd.DataFrame(catalog.load(spec["final_data_set"])), new_feature_data
+        )
+    )
+
+    return final_data, next_state
+
+
+def append_new_rounds(
+    context: KedroContext, spec: IncrementalPipelineSpec = MATCH_PIPELINE_SPEC
+) -> pd.DataFrame:
+    """Add feature rows for any matches played or scheduled since the last update.
+
+    The first run, when there's no saved state, calculates features for all matches
+    in the context's date range.
+
+    Params
+    ------
+    context: Kedro context with catalog entries for the spec's data sets.
+    spec: Names of the incremental pipeline's data sets and stateful nodes.
+
+    Returns
+    -------
+    The updated final data set.
+    """
+    final_data, next_state = calculate_new_rounds(context, spec)
+
+    if next_state is not None:
+        catalog = context.catalog
+        catalog.save(spec["final_data_set"], final_data)
+        catalog.save(spec["state_data_set"], next_state)
+
+    return final_data
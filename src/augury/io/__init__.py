@@ -1,3 +1,4 @@
 """Custom data set classes that inherit from kedro's AbstractDataSet."""
 
 from .json_remote_data_set import JSONRemoteDataSet
+from .columnar_data_set import ColumnarDataSet
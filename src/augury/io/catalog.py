@@ -0,0 +1,111 @@
+"""Functions for inspecting and loading data sets in a kedro data catalog."""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+import os
+
+import pandas as pd
+from kedro.io import DataCatalog
+from kedro.io.core import AbstractDataSet, DataSetError, get_filepath_str
+
+from .columnar_data_set import ColumnarDataSet
+
+
+# Local file systems report modification times, while GCS reports content hashes
+# and update times, so we use whichever of these we get to detect changed files
+FILE_SIGNATURE_KEYS = ("size", "mtime", "updated", "md5Hash", "etag")
+
+
+def _get_data_set(catalog: DataCatalog, name: str) -> AbstractDataSet:
+    # Kedro doesn't have a public method for getting a catalog's data set objects
+    return catalog._get_dataset(name)  # pylint: disable=protected-access
+
+
+def data_set_file_info(catalog: DataCatalog, name: str) -> Dict[str, Any]:
+    """Get metadata (e.g. size and modification time) of a data set's file.
+
+    Params
+    ------
+    catalog: Catalog that includes the data set.
+    name: Name of the data set.
+
+    Returns
+    -------
+    File metadata from the data set's file system, or an empty dictionary
+        for data sets that aren't saved as files.
+    """
+    data_set = _get_data_set(catalog, name)
+
+    # Columnar data sets are directories of files, but their schemas are rewritten
+    # whenever any of their data changes
+    if isinstance(data_set, ColumnarDataSet):
+        try:
+            schema_stat = os.stat(data_set.schema_path)
+        except FileNotFoundError as err:
+            raise DataSetError(
+                f"Data set '{name}' has no saved data at {data_set.schema_path}"
+            ) from err
+
+        return {"size": schema_stat.st_size, "mtime": schema_stat.st_mtime}
+
+    # Kedro doesn't expose the file system or path of file-based data sets,
+    # so we use the same private attributes that they use to load their files.
+    # Anything without them is treated as a file that never changes.
+    # pylint: disable=protected-access
+    try:
+        load_path = get_filepath_str(data_set._get_load_path(), data_set._protocol)
+        return data_set._fs.info(load_path)
+    except AttributeError:
+        return {}
+
+
+def data_set_signature(catalog: DataCatalog, name: str) -> Optional[Tuple[Any, ...]]:
+    """Get a value that changes whenever a data set's file changes.
+
+    Params
+    ------
+    catalog: Catalog that includes the data set.
+    name: Name of the data set.
+
+    Returns
+    -------
+    Tuple of the data set's description and file metadata, or None
+        for data sets that aren't saved as files.
+    """
+    file_info = data_set_file_info(catalog, name)
+
+    if not file_info:
+        return None
+
+    # Different catalogs can have data sets with the same name for different files
+    return (str(_get_data_set(catalog, name)),) + tuple(
+        file_info.get(key) for key in FILE_SIGNATURE_KEYS
+    )
+
+
+def is_partitioned_by_year(catalog: DataCatalog, name: str) -> bool:
+    """Check whether individual years of a data set can be loaded on their own."""
+    return isinstance(_get_data_set(catalog, name), ColumnarDataSet)
+
+
+def load_year_partitions(
+    catalog: DataCatalog, name: str, years: Optional[Iterable[int]] = None
+) -> pd.DataFrame:
+    """Load a data set, only reading the given years if it's partitioned by year.
+
+    Params
+    ------
+    catalog: Catalog that includes the data set.
+    name: Name of the data set.
+    years: Years to load. Loads all years if None.
+
+    Returns
+    -------
+    Data frame with the given years of data. Data sets that aren't partitioned
+        by year are loaded in full, so callers still need to filter rows by year.
+    """
+    data_set = _get_data_set(catalog, name)
+
+    if isinstance(data_set, ColumnarDataSet):
+        return data_set.load_partitions(years)
+
+    return pd.DataFrame(catalog.load(name))
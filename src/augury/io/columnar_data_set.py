@@ -0,0 +1,295 @@
+"""kedro data set that saves data frames as memory-mapped columns per partition."""
+
+from typing import Any, Dict, Iterable, List, Optional
+from pathlib import Path
+import json
+import shutil
+
+import numpy as np
+import pandas as pd
+from kedro.io.core import AbstractDataSet
+from mypy_extensions import TypedDict
+
+
+SCHEMA_FILENAME = "schema.json"
+# numpy's default datetime unit, which pandas uses for all datetimes
+DATETIME_DTYPE = "datetime64[ns]"
+UTC = "UTC"
+
+ColumnSchema = TypedDict(
+    "ColumnSchema",
+    {
+        "name": str,
+        # One of 'array', 'datetime', or 'categorical'
+        "kind": str,
+        # dtype of the saved array (i.e. category codes for categorical columns)
+        "dtype": str,
+        "tz": Optional[str],
+        "categories": Optional[List[Any]],
+        "is_category": bool,
+    },
+)
+DataSetSchema = TypedDict(
+    "DataSetSchema",
+    {"partition_col": str, "partitions": List[Any], "columns": List[ColumnSchema]},
+)
+
+
+def _column_schema(column: pd.Series) -> ColumnSchema:
+    if pd.api.types.is_datetime64_any_dtype(column):
+        tz = getattr(column.dtype, "tz", None)
+
+        return {
+            "name": column.name,
+            "kind": "datetime",
+            "dtype": DATETIME_DTYPE,
+            "tz": None if tz is None else str(tz),
+            "categories": None,
+            "is_category": False,
+        }
+
+    # Extension dtypes (e.g. nullable integers) can have missing values that
+    # numpy can only store as Python objects
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biuf":
+        return {
+            "name": column.name,
+            "kind": "array",
+            "dtype": str(column.dtype),
+            "tz": None,
+            "categories": None,
+            "is_category": False,
+        }
+
+    # Strings (and anything else that numpy can only store as Python objects)
+    # are saved as category codes, because object arrays can't be memory-mapped
+    categorical = pd.Categorical(column)
+
+    return {
+        "name": column.name,
+        "kind": "categorical",
+        "dtype": str(categorical.codes.dtype),
+        "tz": None,
+        "categories": categorical.categories.tolist(),
+        "is_category": isinstance(column.dtype, pd.CategoricalDtype),
+    }
+
+
+def _column_values(column: pd.Series, column_schema: ColumnSchema) -> np.ndarray:
+    if column_schema["kind"] == "datetime":
+        # tz-aware datetimes are converted to UTC
+        return column.to_numpy(dtype=DATETIME_DTYPE)
+
+    if column_schema["kind"] == "categorical":
+        return pd.Categorical(
+            column, categories=column_schema["categories"]
+        ).codes.astype(column_schema["dtype"])
+
+    return column.to_numpy(dtype=column_schema["dtype"])
+
+
+def _column_from_values(values: np.ndarray, column_schema: ColumnSchema) -> Any:
+    if column_schema["kind"] == "datetime":
+        datetimes = pd.DatetimeIndex(values)
+
+        return (
+            datetimes
+            if column_schema["tz"] is None
+            else datetimes.tz_localize(UTC).tz_convert(column_schema["tz"])
+        )
+
+    if column_schema["kind"] == "categorical":
+        categorical = pd.Categorical.from_codes(
+            values, categories=column_schema["categories"]
+        )
+
+        return (
+            categorical
+            if column_schema["is_category"]
+            else np.asarray(categorical.astype(object))
+        )
+
+    return values
+
+
+class ColumnarDataSet(AbstractDataSet):
+    """Kedro data set that saves data frames as a numpy file per column per partition.
+
+    Data is partitioned by the values of one column (e.g. 'year'), with each
+    partition in its own directory, so loading a subset of partitions only reads
+    their files. Files are memory-mapped on load, and only pages that are used
+    get read from disk. Because of that, data sets must be on the local file system.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        partition_col: str = "year",
+        load_args: Optional[Dict[str, Any]] = None,
+    ):
+        """Instantiate a ColumnarDataSet object.
+
+        Params
+        ------
+        filepath: Path to the directory for the data set's files.
+        partition_col: Name of the column whose values define partitions.
+        load_args: Options for loading data. Supports 'mmap_mode' per `numpy.load`
+            (defaults to read-only memory maps).
+        """
+        self._filepath = Path(filepath)
+        self._partition_col = partition_col
+        self._load_args = {"mmap_mode": "r", **(load_args or {})}
+
+    @property
+    def schema_path(self) -> Path:
+        """Path to the data set's schema file, which is written last on each save."""
+        return self._filepath / SCHEMA_FILENAME
+
+    def _load(self) -> pd.DataFrame:
+        return self.load_partitions()
+
+    def load_partitions(
+        self, partition_values: Optional[Iterable[Any]] = None
+    ) -> pd.DataFrame:
+        """Load the data for the given partitions.
+
+        Params
+        ------
+        partition_values: Values of the partition column to load
+            (e.g. a range of years). Values without a partition are ignored.
+            Loads all partitions if None.
+
+        Returns
+        -------
+        Data frame with rows from each partition in partition order.
+        """
+        schema = self._load_schema()
+        partitions = schema["partitions"]
+
+        if partition_values is not None:
+            partition_value_set = set(partition_values)
+            partitions = [
+                partition
+                for partition in partitions
+                if partition in partition_value_set
+            ]
+
+        partition_paths = [self._partition_path(partition) for partition in partitions]
+
+        return pd.DataFrame(
+            {
+                column_schema["name"]: _column_from_values(
+                    self._load_column_values(
+                        partition_paths, column_position, column_schema
+                    ),
+                    column_schema,
+                )
+                for column_position, column_schema in enumerate(schema["columns"])
+            },
+            columns=[column_schema["name"] for column_schema in schema["columns"]],
+        )
+
+    def _load_column_values(
+        self,
+        partition_paths: List[Path],
+        column_position: int,
+        column_schema: ColumnSchema,
+    ) -> np.ndarray:
+        column_arrays = [
+            np.load(
+                partition_path / self._column_filename(column_position),
+                **self._load_args,
+            )
+            for partition_path in partition_paths
+        ]
+
+        if not column_arrays:
+            return np.empty(0, dtype=column_schema["dtype"])
+
+        # A single memory map can be used as is, but concatenating them
+        # reads all their data
+        return (
+            column_arrays[0]
+            if len(column_arrays) == 1
+            else np.concatenate(column_arrays)
+        )
+
+    def _save(self, data: pd.DataFrame) -> None:
+        assert self._partition_col in data.columns, (
+            f"Data must have a '{self._partition_col}' column to partition by, "
+            f"but its columns are {data.columns}."
+        )
+        assert data[self._partition_col].notna().all(), (
+            f"Column '{self._partition_col}' can't have any missing values, "
+            "because they have no partition."
+        )
+        assert not data.columns.duplicated().any(), (
+            "Column names must be unique, but the following are duplicated: "
+            f"{data.columns[data.columns.duplicated()]}"
+        )
+
+        # Index values are dropped, as with JSON data sets saved as records
+        column_schemas = [_column_schema(data[column]) for column in data.columns]
+        partitioned_data = [
+            (
+                partition.item() if isinstance(partition, np.generic) else partition,
+                partition_data_frame,
+            )
+            for partition, partition_data_frame in data.groupby(
+                self._partition_col, sort=True
+            )
+        ]
+        schema: DataSetSchema = {
+            "partition_col": self._partition_col,
+            "partitions": [partition for partition, _ in partitioned_data],
+            "columns": column_schemas,
+        }
+        # Serialising the schema before removing any saved data, because
+        # it fails for categories that aren't valid JSON
+        schema_json = json.dumps(schema, indent=2)
+
+        # Removing old partitions, so years that are no longer in the data
+        # don't get loaded
+        if self._filepath.exists():
+            shutil.rmtree(self._filepath)
+
+        self._filepath.mkdir(parents=True)
+
+        for partition, partition_data_frame in partitioned_data:
+            partition_path = self._partition_path(partition)
+            partition_path.mkdir()
+
+            for column_position, column_schema in enumerate(column_schemas):
+                np.save(
+                    partition_path / self._column_filename(column_position),
+                    _column_values(
+                        partition_data_frame.iloc[:, column_position], column_schema
+                    ),
+                )
+
+        # Writing the schema last, so the data set only exists if all partitions
+        # were saved
+        with open(self.schema_path, "w") as file:
+            file.write(schema_json)
+
+    def _exists(self) -> bool:
+        return self.schema_path.exists()
+
+    def _describe(self) -> Dict[str, Any]:
+        return {
+            "filepath": str(self._filepath),
+            "partition_col": self._partition_col,
+            "load_args": self._load_args,
+        }
+
+    def _load_schema(self) -> DataSetSchema:
+        with open(self.schema_path, "r") as file:
+            return json.load(file)
+
+    def _partition_path(self, partition: Any) -> Path:
+        return self._filepath / f"{self._partition_col}={partition}"
+
+    @staticmethod
+    def _column_filename(column_position: int) -> str:
+        # Column names can have characters that aren't valid in file names,
+        # so we use their positions instead
+        return f"{column_position}.npy"
@@ -1,7 +1,10 @@
 """kedro data set based on fetching fresh data from the afl_data service."""
 
-from typing import Any, List, Dict, Callable, Union, Optional
+from typing import Any, List, Dict, Callable, Union, Optional, Tuple
+import hashlib
 import importlib
+import json
+import threading
 from datetime import date, timedelta
 
 import pandas as pd
@@ -38,6 +41,48 @@ DATE_RANGE_TYPE: Dict[str, Dict[str, str]] = {
     "future_rounds": {"start_date": str(ONE_WEEK_AGO), "end_date": str(END_OF_YEAR)},
 }
 
+# Identifies the data fetched from a data source with a given set of arguments
+RemoteSourceKey = Tuple[Callable, str]
+
+
+class RemoteDataVersions:
+    """Keeps track of whether remote data sources have returned new data.
+
+    We can't tell whether remote data has changed without fetching it,
+    so caches of results that depend on it (e.g. predictions for the current
+    round, which depend on team rosters) can check the version instead.
+    """
+
+    def __init__(self):
+        """Instantiate a RemoteDataVersions object."""
+        # Goes up whenever a source returns different data than it did last time
+        self.version = 0
+        self._digests: Dict[RemoteSourceKey, str] = {}
+        self._lock = threading.Lock()
+
+    def update(self, source_key: RemoteSourceKey, data: Any) -> None:
+        """Record the data most recently fetched from the source.
+
+        Params
+        ------
+        source_key: Data source function and a JSON string of its arguments.
+        data: JSON-serializable data that the source returned.
+        """
+        digest = hashlib.sha256(
+            json.dumps(data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+        with self._lock:
+            previous_digest = self._digests.get(source_key)
+            self._digests[source_key] = digest
+
+            if previous_digest is not None and previous_digest != digest:
+                self.version += 1
+
+
+# Each gunicorn worker keeps track of the remote data that it has fetched
+REMOTE_DATA_VERSIONS = RemoteDataVersions()
+
 
 class JSONRemoteDataSet(AbstractDataSet):
     """Kedro data set based on fetching fresh data from the afl_data service."""
@@ -80,7 +125,17 @@ class JSONRemoteDataSet(AbstractDataSet):
             self.data_source = getattr(module, function_name)
 
     def _load(self) -> List[Dict[str, Any]]:
-        return self.data_source(**self._data_source_kwargs)
+        data = self.data_source(**self._data_source_kwargs)
+
+        REMOTE_DATA_VERSIONS.update(
+            (
+                self.data_source,
+                json.dumps(self._data_source_kwargs, sort_keys=True, default=str),
+            ),
+            data,
+        )
+
+        return data
 
     def _save(self, data: pd.DataFrame) -> None:
         pass
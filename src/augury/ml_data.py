@@ -1,11 +1,18 @@
 """Module for holding model data and returning it in a form useful for ML pipelines."""
 
-from typing import Tuple, Optional, List
+from typing import Any, Tuple, Optional, List, Set
 from datetime import date
 
+import numpy as np
 import pandas as pd
 from kedro.framework.context import KedroContext
 
+from augury.data_cache import ML_DATA_CACHE, MLDataCache
+from augury.io.catalog import (
+    data_set_signature,
+    is_partitioned_by_year,
+    load_year_partitions,
+)
 from augury.types import YearRange
 from augury.settings import (
     INDEX_COLS,
@@ -16,6 +23,14 @@ from augury.context import load_project_context
 
 
 END_OF_YEAR = f"{date.today().year}-12-31"
+# Saved models were trained on 64-bit features, and some of them (e.g. scalers,
+# linear regressors, Elo & ARIMA inputs) would give different predictions
+# with less precision. Estimators that use 32-bit floats (e.g. XGBoost)
+# convert features themselves.
+FEATURE_DTYPE = np.float64
+# Data sets that aren't saved as files don't have a signature, so the request
+# cache just needs to tell them apart from file-backed data
+UNSAVED_DATA_SIGNATURE = ("unsaved",)
 
 
 class MLData:
@@ -29,6 +44,8 @@ class MLData:
         test_year_range: YearRange = VALIDATION_YEAR_RANGE,
         index_cols: List[str] = INDEX_COLS,
         label_col: str = "margin",
+        cache: Optional[MLDataCache] = None,
+        request_cache: Optional[MLDataCache] = None,
     ) -> None:
         """
         Instantiate an MLData object.
@@ -43,22 +60,44 @@ class MLData:
             for data to include in testing sets.
         index_cols: Column names to use for the DataFrame's index.
         label_col: Name of the column to use for data labels (i.e. y data set).
+        cache: Cache for loaded data, shared with other MLData objects.
+            Defaults to the process-wide cache.
+        request_cache: Cache for data sets that aren't saved as files (e.g. data sets
+            in memory for a single request), which can't be checked for changes,
+            so it shouldn't outlive them. They aren't cached if this is omitted.
         """
         self.context = context or load_project_context()
         self._data_set = data_set
         self._train_year_range = train_year_range
         self._test_year_range = test_year_range
         self.index_cols = index_cols
-        self.label_col = label_col
+        self._label_col = label_col
+        self.cache = ML_DATA_CACHE if cache is None else cache
+        self.request_cache = request_cache
         self._data = None
         self._X_data = None
         self._y_data = None
+        self._row_year_data = None
+        self._signature: Optional[Tuple[Any, ...]] = None
+        # Whichever of the caches holds this data set's data
+        self._data_cache: Optional[MLDataCache] = None
+        # Years loaded from a partitioned data set (None means all of them)
+        self._loaded_years: Optional[Set[int]] = None
 
     @property
     def data(self) -> pd.DataFrame:
-        """Full data set stored in the given class instance."""
+        """Full data set stored in the given class instance.
+
+        Data sets that are partitioned by year only have the years
+        in the train and test year ranges. Loaded data is cached
+        for other MLData objects, which each get their own copy.
+        """
+        if self._data is None:
+            self._restore_cached_data()
+
         if self._data is None:
             self._data = self._load_data()
+            self._cache_data(data=self._data)
 
         return self._data
 
@@ -72,17 +111,9 @@ class MLData:
                 f"{self.data.index.names}"
             )
 
-        train_year_range = range(*self.train_year_range)
-        X_train = self._X.loc[(slice(None), train_year_range, slice(None)), :]
-        y_train = self._y.loc[
-            (
-                slice(None),
-                # Series can't slice by range, so we have to convert to a valid
-                # slice (i.e. end inclusive, so subtract 1)
-                slice(min(train_year_range), max(train_year_range)),
-                slice(None),
-            )
-        ]
+        train_rows = self._year_rows(self.train_year_range)
+        X_train = self._X.take(train_rows)
+        y_train = self._y.take(train_rows)
 
         return X_train, y_train
 
@@ -96,17 +127,9 @@ class MLData:
                 f"{self.data.index.names}"
             )
 
-        test_year_range = range(*self.test_year_range)
-        X_test = self._X.loc[(slice(None), test_year_range, slice(None)), :]
-        y_test = self._y.loc[
-            (
-                slice(None),
-                # Series can't slice by range, so we have to convert to a valid
-                # slice (i.e. end inclusive)
-                slice(min(test_year_range), max(test_year_range)),
-                slice(None),
-            )
-        ]
+        test_rows = self._year_rows(self.test_year_range)
+        X_test = self._X.take(test_rows)
+        y_test = self._y.take(test_rows)
 
         return X_test, y_test
 
@@ -118,6 +141,7 @@ class MLData:
     @train_year_range.setter
     def train_year_range(self, years: YearRange) -> None:
         self._train_year_range = years
+        self._reset_data_for_missing_years()
 
     @property
     def test_year_range(self) -> YearRange:
@@ -127,6 +151,7 @@ class MLData:
     @test_year_range.setter
     def test_year_range(self, years: YearRange) -> None:
         self._test_year_range = years
+        self._reset_data_for_missing_years()
 
     @property
     def data_set(self) -> str:
@@ -136,14 +161,116 @@ class MLData:
     @data_set.setter
     def data_set(self, name: str) -> None:
         if self._data_set != name:
-            self._data = None
-            self._X_data = None
-            self._y_data = None
+            self._reset_data()
 
         self._data_set = name
 
+    @property
+    def label_col(self) -> str:
+        """Name of the column to use for data labels."""
+        return self._label_col
+
+    @label_col.setter
+    def label_col(self, name: str) -> None:
+        # Cached data for the new label column (or at least its data set)
+        # gets restored on the next data access
+        if self._label_col != name:
+            self._reset_data()
+
+        self._label_col = name
+
+    def clear_cache(self) -> None:
+        """Remove this object's data, and that of its data set from the cache.
+
+        Use it when the data set has changed in a way that the cache can't detect
+        (e.g. data sets that aren't saved as files).
+        """
+        self.cache.clear(self.data_set)
+
+        if self.request_cache is not None:
+            self.request_cache.clear(self.data_set)
+
+        self._reset_data()
+
+    def _reset_data(self) -> None:
+        self._data = None
+        self._X_data = None
+        self._y_data = None
+        self._row_year_data = None
+        self._signature = None
+        self._data_cache = None
+        self._loaded_years = None
+
+    def _reset_data_for_missing_years(self) -> None:
+        is_missing_years = (
+            self._loaded_years is not None
+            and not self._required_years <= self._loaded_years
+        )
+
+        if is_missing_years:
+            self._reset_data()
+
+    @property
+    def _required_years(self) -> Set[int]:
+        return set(range(*self.train_year_range)) | set(range(*self.test_year_range))
+
+    def _restore_cached_data(self) -> None:
+        self._signature = data_set_signature(self.context.catalog, self.data_set)
+        self._data_cache = self.cache
+
+        # Data that isn't loaded from files (e.g. data sets in memory for a single
+        # request) can't be checked for changes, so we only keep it
+        # in the request cache
+        if self._signature is None and self.request_cache is not None:
+            self._signature = UNSAVED_DATA_SIGNATURE
+            self._data_cache = self.request_cache
+
+        if self._signature is None:
+            return
+
+        cached_data = self._data_cache.get(
+            self.data_set, self.label_col, self._signature, self._required_years
+        )
+
+        if cached_data is None:
+            return
+
+        self._loaded_years = cached_data["loaded_years"]
+        self._data = cached_data["data"]
+        self._X_data = cached_data["X"]
+        self._y_data = cached_data["y"]
+        self._row_year_data = cached_data["row_years"]
+
+    def _cache_data(self, **calculated_data) -> None:
+        if self._signature is None or self._data_cache is None:
+            return
+
+        # The cache keeps whatever we've already given it, so we only pass
+        # newly-calculated data to avoid copying the rest again
+        self._data_cache.set(
+            self.data_set,
+            self.label_col,
+            {
+                "signature": self._signature,
+                "loaded_years": self._loaded_years,
+                "data": None,
+                "X": None,
+                "y": None,
+                "row_years": None,
+                **calculated_data,  # type: ignore
+            },
+        )
+
     def _load_data(self):
-        data_frame = pd.DataFrame(self.context.catalog.load(self.data_set))
+        catalog = self.context.catalog
+
+        # Partitioned data sets let us skip reading years that we don't need
+        self._loaded_years = (
+            self._required_years
+            if is_partitioned_by_year(catalog, self.data_set)
+            else None
+        )
+        data_frame = load_year_partitions(catalog, self.data_set, self._loaded_years)
 
         # When loading date columns directly from JSON, we need to convert them
         # from string to datetime
@@ -160,6 +287,7 @@ class MLData:
     def _X(self) -> pd.DataFrame:
         if self._X_data is None:
             self._X_data = self._load_X()
+            self._cache_data(X=self._X_data)
 
         return self._X_data
 
@@ -172,27 +300,54 @@ class MLData:
             "(?:oppo_)?result",
         ]
         label_cols = self.data.filter(regex=f"^{'$|^'.join(labels)}$").columns
-        features = self.data.drop(label_cols, axis=1)
+        # Selecting feature columns from the full data, rather than dropping labels,
+        # saves copying all of it
+        feature_dtypes = self.data.dtypes.drop(label_cols)
+        numeric_cols = sorted(
+            feature_dtypes.index[feature_dtypes.map(pd.api.types.is_numeric_dtype)]
+        )
+        categorical_cols = sorted(feature_dtypes.index.difference(numeric_cols))
 
-        numeric_features = features.select_dtypes("number").astype(float)
-        categorical_features = features.select_dtypes(exclude=["number"])
+        # Converting all numeric features at once gives one contiguous float block,
+        # which pandas stores column-major, so wrapping it in a data frame
+        # doesn't copy it again
+        numeric_block = self.data[numeric_cols].to_numpy(dtype=FEATURE_DTYPE)
+
+        numeric_features = pd.DataFrame(
+            numeric_block, index=self.data.index, columns=numeric_cols, copy=False
+        )
 
         # Sorting columns with categorical features first to allow for positional indexing
         # for some data transformations further down the pipeline.
         # We sort each column group alphabetically to guarantee the same column order
         # as long as the columns are the same.
         return pd.concat(
-            [
-                categorical_features[sorted(categorical_features.columns)],
-                numeric_features[sorted(numeric_features.columns)],
-            ],
-            axis=1,
+            [self.data[categorical_cols], numeric_features], axis=1, copy=False
+        )
+
+    @property
+    def _row_years(self) -> np.ndarray:
+        if self._row_year_data is None:
+            self._row_year_data = self._X.index.get_level_values(1).to_numpy()
+            self._cache_data(row_years=self._row_year_data)
+
+        return self._row_year_data
+
+    def _year_rows(self, year_range: YearRange) -> np.ndarray:
+        years = range(*year_range)
+
+        # Rows are sorted by team first, so we select them by position rather than
+        # by slicing the index, which is much slower for a range of years
+        # in the middle level
+        return np.flatnonzero(
+            (self._row_years >= min(years)) & (self._row_years <= max(years))
         )
 
     @property
     def _y(self) -> pd.Series:
         if self._y_data is None:
             self._y_data = self._load_y()
+            self._cache_data(y=self._y_data)
 
         return self._y_data
 
@@ -6,11 +6,14 @@ from typing import Optional, Union, Type
 from sklearn.pipeline import Pipeline, make_pipeline
 from sklearn.utils.metaestimators import _BaseComposition
 from sklearn.base import RegressorMixin, BaseEstimator
+from sklearn.exceptions import NotFittedError
 from sklearn.preprocessing import OneHotEncoder, StandardScaler
 from sklearn.compose import ColumnTransformer
 import joblib
 import pandas as pd
 import numpy as np
+from xgboost import XGBModel
+from xgboost.core import XGBoostError
 
 from augury.sklearn.preprocessing import ColumnDropper, CorrelationSelector
 from augury.settings import BASE_DIR, TEAM_NAMES, ROUND_TYPES, VENUES, CATEGORY_COLS
@@ -25,6 +28,10 @@ ELO_MODEL_COLS = [
     "date",
 ]
 
+# Share of an XGBoost model's n_estimators to add with each partial fit. New data
+# is usually a season at a time, so the model only needs a few more trees for it.
+PARTIAL_FIT_ESTIMATOR_SHARE = 0.1
+
 BASE_ML_PIPELINE = make_pipeline(
     ColumnDropper(cols_to_drop=ELO_MODEL_COLS),
     CorrelationSelector(cols_to_keep=CATEGORY_COLS),
@@ -89,6 +96,47 @@ class BaseMLEstimator(_BaseComposition, RegressorMixin):
 
         return self
 
+    @property
+    def supports_partial_fit(self) -> bool:
+        """Whether the estimator can be updated with new data without refitting it."""
+        return isinstance(self.pipeline, Pipeline) and isinstance(
+            self.pipeline.steps[-1][1], XGBModel
+        )
+
+    def partial_fit(self, X: pd.DataFrame, y: pd.Series) -> Type[R]:
+        """Update the fitted estimator with data that follows its training data.
+
+        Only pipelines that end in an XGBoost model support this (per
+        supports_partial_fit). Preprocessing steps keep their fitted state,
+        so new data gets the same features, and the XGBoost model adds boosting
+        rounds on the new data to its fitted trees. The result isn't the same
+        as refitting the estimator on all of the data.
+        """
+        assert self.supports_partial_fit, (
+            "partial_fit is only supported for pipelines that end in an XGBoost "
+            f"model, but {self.name} has the pipeline {self.pipeline}."
+        )
+
+        xgboost_model = self.pipeline.steps[-1][1]
+
+        try:
+            booster = xgboost_model.get_booster()
+        # Depending on the version, XGBoost raises one or the other
+        except (NotFittedError, XGBoostError):
+            return self.fit(X, y)
+
+        n_estimators = xgboost_model.get_params()["n_estimators"]
+        xgboost_model.set_params(
+            n_estimators=max(round(n_estimators * PARTIAL_FIT_ESTIMATOR_SHARE), 1)
+        )
+
+        try:
+            xgboost_model.fit(self.pipeline[:-1].transform(X), y, xgb_model=booster)
+        finally:
+            xgboost_model.set_params(n_estimators=n_estimators)
+
+        return self
+
     def predict(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
         """Make predictions based on the data input."""
         if self.pipeline is None:
@@ -49,6 +49,10 @@ class ConfidenceEstimator(BaseMLEstimator):
 
         return super().fit(X, y_enc)
 
+    def partial_fit(self, X: pd.DataFrame, y: pd.Series):
+        """Update the fitted estimator with data that follows its training data."""
+        return super().partial_fit(X, y.astype(int))
+
     def predict_proba(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
         """Predict the probability of each class being the correct label."""
         return self.pipeline.predict_proba(X)
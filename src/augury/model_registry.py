@@ -0,0 +1,119 @@
+"""Process-wide cache of deserialised ML models."""
+
+from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+import os
+import threading
+
+from kedro.framework.context import KedroContext
+from mypy_extensions import TypedDict
+
+from augury.io.catalog import FILE_SIGNATURE_KEYS, data_set_file_info
+from augury.ml_estimators.base_ml_estimator import BaseMLEstimator
+
+
+# Megabytes of pickled models to keep in memory before evicting
+# the least-recently-used ones
+DEFAULT_MEMORY_LIMIT_MB = int(os.getenv("MODEL_REGISTRY_MEMORY_LIMIT_MB", "2048"))
+MEGABYTE = 1024 ** 2
+
+CachedModel = TypedDict(
+    "CachedModel",
+    {"model": BaseMLEstimator, "signature": Tuple[Any, ...], "size": int},
+)
+
+
+class ModelRegistry:
+    """Keeps deserialised models in memory, reloading them when their files change.
+
+    Models are evicted in least-recently-used order when the total size
+    of their pickle files goes over the memory limit.
+    """
+
+    def __init__(self, memory_limit_mb: int = DEFAULT_MEMORY_LIMIT_MB):
+        """Instantiate a ModelRegistry object.
+
+        Params
+        ------
+        memory_limit_mb: Maximum total size (in MB) of model files to keep in memory.
+            The most-recently-loaded model is always kept, even if it is bigger
+            than the limit.
+        """
+        self.memory_limit = memory_limit_mb * MEGABYTE
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._models: "OrderedDict[str, CachedModel]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def load(self, context: KedroContext, name: str) -> BaseMLEstimator:
+        """Load the named model, only deserialising it if it isn't already cached.
+
+        Params
+        ------
+        context: Kedro context with a catalog entry for the model.
+        name: Name of the model's data set in the catalog.
+
+        Returns
+        -------
+        The loaded model. Cached models are shared, so callers that mutate
+            the model (e.g. by fitting it) should load it from the catalog instead.
+        """
+        catalog = context.catalog
+        file_info = data_set_file_info(catalog, name)
+        signature = tuple(file_info.get(key) for key in FILE_SIGNATURE_KEYS)
+
+        with self._lock:
+            cached_model = self._models.get(name)
+
+            if cached_model is not None and cached_model["signature"] == signature:
+                self.hits += 1
+                self._models.move_to_end(name)
+                return cached_model["model"]
+
+            self.misses += 1
+            model = catalog.load(name)
+            self._models[name] = {
+                "model": model,
+                "signature": signature,
+                "size": file_info.get("size") or 0,
+            }
+            self._models.move_to_end(name)
+            self._evict_models()
+
+            return model
+
+    def clear(self, name: Optional[str] = None) -> None:
+        """Remove the named model, or all models if none is given, from the cache."""
+        with self._lock:
+            if name is None:
+                self._models.clear()
+            else:
+                self._models.pop(name, None)
+
+    @property
+    def size(self) -> int:
+        """Total size (in bytes) of the cached models' files."""
+        return sum(cached_model["size"] for cached_model in self._models.values())
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters and the names of currently-cached models."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": self.size,
+                "memory_limit": self.memory_limit,
+                "models": list(self._models.keys()),
+            }
+
+    def _evict_models(self) -> None:
+        while len(self._models) > 1 and self.size > self.memory_limit:
+            self._models.popitem(last=False)
+            self.evictions += 1
+
+
+# Each gunicorn worker gets its own registry, which lives as long as the worker
+MODEL_REGISTRY = ModelRegistry()
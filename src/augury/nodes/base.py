@@ -1,8 +1,7 @@
 """Utility functions used in various kedro node functions."""
 
 from typing import Callable, Union, Set, Sequence
-from datetime import datetime, time
-from dateutil import parser
+from datetime import datetime, timedelta
 import pytz
 
 import pandas as pd
@@ -22,20 +21,41 @@ ReplaceKwargs = TypedDict("ReplaceKwargs", {"hour": int, "minute": int})
 EARLIEST_NZ_START_TIME: ReplaceKwargs = {"hour": 13, "minute": 10}
 
 
-def _localize_dates(row: pd.Series) -> datetime:
+def _timezone_offset(timezone_label: str) -> timedelta:
+    # Match datetimes have always been localized by replacing their tzinfo
+    # with a pytz timezone, which uses the timezone's first UTC offset (i.e. local
+    # mean time) regardless of the date rather than the offset in effect at the time.
+    # We keep the same fixed offset per timezone, so UTC datetimes stay consistent
+    # with previously-saved data.
+    return datetime(2000, 1, 1, tzinfo=pytz.timezone(timezone_label)).utcoffset()
+
+
+def _localize_dates(localization_data: pd.DataFrame) -> pd.Series:
     # Defaulting to Melbourne time, when the datetime isn't location specific,
     # because the AFL has a pro-Melbourne bias, so why shouldn't we?
-    venue_timezone_label = (
-        VENUE_TIMEZONES.get(row["venue"])
-        if "venue" in row.index
-        else "Australia/Melbourne"
+    venue_timezone_labels = (
+        localization_data["venue"].map(VENUE_TIMEZONES)
+        if "venue" in localization_data.columns
+        else pd.Series("Australia/Melbourne", index=localization_data.index)
     )
 
-    assert isinstance(
-        venue_timezone_label, str
-    ), f"Could not find timezone for {row['venue']}"
+    missing_timezones = venue_timezone_labels.isna()
+    assert not missing_timezones.any(), (
+        "Could not find timezone for "
+        f"{set(localization_data.loc[missing_timezones, 'venue'])}"
+    )
+
+    match_dates = pd.to_datetime(localization_data["date"])
+
+    # Some date strings include UTC offsets, but we ignore them in favour
+    # of the venue's timezone, so we just keep the local date & time
+    if match_dates.dtype == "object":
+        match_dates = pd.to_datetime(
+            match_dates.map(lambda match_date: match_date.replace(tzinfo=None))
+        )
+    elif match_dates.dt.tz is not None:
+        match_dates = match_dates.dt.tz_localize(None)
 
-    match_date: datetime = parser.parse(row["date"])
     # For match dates without start times, we add the minimum start time that
     # (more-or-less) guarantees that converting times from local timezones to UTC
     # won't change the date as well. This should make joining data on dates
@@ -49,13 +69,23 @@ def _localize_dates(row: pd.Series) -> datetime:
     #   there since 2015 (meaning there's unlikely to be a future match there
     #   at an earlier time)
     # This may lead to specious start times, but so did defaulting to midnight.
-    match_datetime = (
-        match_date.replace(**EARLIEST_NZ_START_TIME)
-        if match_date.time() == time()
-        else match_date
+    has_no_start_time = match_dates == match_dates.dt.normalize()
+    earliest_start_time = pd.Timedelta(
+        hours=EARLIEST_NZ_START_TIME["hour"], minutes=EARLIEST_NZ_START_TIME["minute"]
+    )
+    match_datetimes = match_dates.mask(
+        has_no_start_time, match_dates + earliest_start_time
     )
 
-    return match_datetime.replace(tzinfo=pytz.timezone(venue_timezone_label))
+    # There are only a handful of timezones, so we calculate each offset once
+    # and convert all of a timezone's datetimes together
+    timezone_offsets = {
+        timezone_label: _timezone_offset(timezone_label)
+        for timezone_label in venue_timezone_labels.drop_duplicates()
+    }
+    utc_offsets = pd.to_timedelta(venue_timezone_labels.map(timezone_offsets))
+
+    return (match_datetimes - utc_offsets).dt.tz_localize("UTC")
 
 
 def _format_time(unformatted_time: str):
@@ -85,9 +115,7 @@ def _parse_dates(data_frame: pd.DataFrame, time_col=None) -> pd.Series:
             + localization_data[time_col].map(_format_time)
         )
 
-    localized_dates = localization_data.apply(_localize_dates, axis=1)
-
-    return pd.to_datetime(localized_dates, utc=True)
+    return _localize_dates(localization_data)
 
 
 def _translate_team_name(team_name: str) -> str:
@@ -160,7 +188,9 @@ def _validate_canoncial_team_names(data_frame: pd.DataFrame):
 
 def _filter_out_dodgy_data(keep="last", **kwargs) -> Callable:
     return lambda df: (
-        df.sort_values("date", ascending=True)
+        # A stable sort keeps the order of rows with the same date, so duplicates
+        # get dropped the same way whether seasons are cleaned together or apart
+        df.sort_values("date", ascending=True, kind="stable")
         # Some early matches (1800s) have fully-duplicated rows.
         # Also, drawn finals get replayed, which screws up my indexing and a bunch of other
         # data munging, so we keep the 'last' finals played, which is the one
@@ -252,6 +252,50 @@ def _validate_no_duplicated_columns(data_frame: pd.DataFrame) -> None:
     )
 
 
+def build_oppo_index(data_frame: pd.DataFrame) -> pd.Series:
+    """Map each team-match row to the position of its opponent's row.
+
+    Nodes that only add columns to team-match data keep the same rows in the same
+    order, so we can calculate this once, right after stacking, and pass it
+    to every add_oppo_features node that follows.
+
+    Params
+    ------
+    data_frame (pandas.DataFrame): Team-match data, indexed by INDEX_COLS.
+
+    Returns
+    -------
+    pandas.Series of row positions, indexed like the data frame. Positions are -1
+        for all rows if any of them doesn't have exactly one opponent row.
+    """
+    REQUIRED_COLS: List[str] = INDEX_COLS + ["oppo_team"]
+    _validate_required_columns(REQUIRED_COLS, data_frame.columns)
+
+    team_keys = pd.MultiIndex.from_arrays([data_frame[col] for col in INDEX_COLS])
+    oppo_keys = pd.MultiIndex.from_arrays(
+        [data_frame["oppo_team"], data_frame["year"], data_frame["round_number"]]
+    )
+
+    # The index must match the columns, because add_oppo_features otherwise
+    # resets the index from them (without level names). Opponent rows must be
+    # unique and complete, because otherwise it adds rows for missing teams.
+    is_valid = (
+        data_frame.index.is_unique
+        and data_frame.index.is_monotonic_increasing
+        and not any(data_frame.index.names)
+        and data_frame.index.equals(team_keys)
+        and oppo_keys.is_unique
+    )
+    oppo_positions = (
+        oppo_keys.get_indexer(team_keys) if is_valid else np.full(len(data_frame), -1)
+    )
+
+    if (oppo_positions < 0).any():
+        oppo_positions = np.full(len(data_frame), -1)
+
+    return pd.Series(oppo_positions, index=data_frame.index)
+
+
 def _oppo_features(data_frame: pd.DataFrame, cols_to_convert) -> Optional[pd.DataFrame]:
     if not any(cols_to_convert):
         return None
@@ -272,6 +316,17 @@ def _oppo_features(data_frame: pd.DataFrame, cols_to_convert) -> Optional[pd.Dat
     )
 
 
+def _gather_oppo_features(
+    data_frame: pd.DataFrame, cols_to_convert, oppo_positions: np.ndarray
+) -> pd.DataFrame:
+    return (
+        data_frame.loc[:, list(cols_to_convert)]
+        .take(oppo_positions)
+        .set_axis(data_frame.index, axis=0)
+        .rename(columns=lambda col_name: f"oppo_{col_name}")
+    )
+
+
 def _cols_to_convert_to_oppo(
     data_frame: pd.DataFrame,
     match_cols: List[str] = [],
@@ -285,6 +340,7 @@ def _cols_to_convert_to_oppo(
 
 def _add_oppo_features_node(
     data_frame: pd.DataFrame,
+    oppo_index: Optional[pd.Series] = None,
     match_cols: List[str] = [],
     oppo_feature_cols: List[str] = [],
 ) -> pd.DataFrame:
@@ -296,18 +352,42 @@ def _add_oppo_features_node(
 
     _validate_required_columns(REQUIRED_COLS, data_frame.columns)
 
-    transform_data_frame = (
-        data_frame.copy()
-        .set_index(INDEX_COLS, drop=False)
-        .rename_axis([None] * len(INDEX_COLS))
-        .sort_index()
-    )
+    if oppo_index is None:
+        oppo_index = build_oppo_index(data_frame)
 
-    concated_data_frame = pd.concat(
-        [transform_data_frame, _oppo_features(transform_data_frame, cols_to_convert)],
-        axis=1,
+    oppo_positions = oppo_index.to_numpy()
+    # Rows can only be gathered by position if they haven't changed
+    # since the index was built
+    can_gather_oppo_rows = (
+        any(cols_to_convert)
+        and data_frame.index.equals(oppo_index.index)
+        and (oppo_positions >= 0).all()
     )
 
+    if can_gather_oppo_rows:
+        concated_data_frame = pd.concat(
+            [
+                data_frame,
+                _gather_oppo_features(data_frame, cols_to_convert, oppo_positions),
+            ],
+            axis=1,
+        )
+    else:
+        transform_data_frame = (
+            data_frame.copy()
+            .set_index(INDEX_COLS, drop=False)
+            .rename_axis([None] * len(INDEX_COLS))
+            .sort_index()
+        )
+
+        concated_data_frame = pd.concat(
+            [
+                transform_data_frame,
+                _oppo_features(transform_data_frame, cols_to_convert),
+            ],
+            axis=1,
+        )
+
     _validate_no_duplicated_columns(concated_data_frame)
 
     return concated_data_frame
@@ -332,8 +412,10 @@ def add_oppo_features(
 
     Returns
     -------
-    Function that takes pandas.DataFrame and returns another pandas.DataFrame
-        with 'oppo_' columns added.
+    Function that takes pandas.DataFrame, and optionally an opponent index
+        per build_oppo_index, and returns another pandas.DataFrame
+        with 'oppo_' columns added. Passing the opponent index saves rebuilding it
+        for every call.
     """
     if any(match_cols) and any(oppo_feature_cols):
         raise ValueError(
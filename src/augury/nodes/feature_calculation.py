@@ -1,8 +1,7 @@
 """Collection of functions for performing cross-feature mathematical calculations."""
 
-from typing import List, Sequence, Dict
+from typing import Any, List, Optional, Sequence, Dict, Tuple, Union
 from functools import partial, reduce, update_wrapper
-import itertools
 import pandas as pd
 import numpy as np
 
@@ -42,15 +41,84 @@ def _calculate_feature_col(
 
 def _calculate_features(calculators: List[CalculatorPair], data_frame: pd.DataFrame):
     calculator_func_lists = [
-        _calculate_feature_col(calculator, column_sets)
+        (calculator, column_sets, _calculate_feature_col(calculator, column_sets))
         for calculator, column_sets in calculators
     ]
-    calculator_funcs = list(itertools.chain.from_iterable(calculator_func_lists))
-    calculated_cols = [calc_func(data_frame) for calc_func in calculator_funcs]
+    fused_cols = _calculate_fused_rolling_means(
+        [
+            column_set
+            for calculator, column_sets in calculators
+            if calculator is calculate_rolling_mean_by_dimension
+            for column_set in column_sets
+        ],
+        ROLLING_WINDOWS,
+        data_frame,
+    )
+    calculated_cols = [
+        fused_cols[tuple(column_set)]
+        if calculator is calculate_rolling_mean_by_dimension
+        else calc_func(data_frame)
+        for calculator, column_sets, calc_funcs in calculator_func_lists
+        for column_set, calc_func in zip(column_sets, calc_funcs)
+    ]
 
     return pd.concat([data_frame, *calculated_cols], axis=1)
 
 
+def calculate_features_with_state(
+    calculators: List[CalculatorPair],
+    data_frame: pd.DataFrame,
+    state: Optional[Dict[str, Any]] = None,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Calculate features for new rows, continuing rolling means from earlier rows.
+
+    Params
+    ------
+    calculators: Calculators & column sets, as passed to `feature_calculator`.
+    data_frame: Data for rows after those used to calculate the state.
+    state: Rolling mean state for earlier rows, as returned by an earlier call.
+        Pass None to calculate features from data_frame alone.
+
+    Returns
+    -------
+    The same data frame as `feature_calculator`'s function returns for all rows,
+        but only for the new ones, and the state for calculating later rows.
+    """
+    past_state = state or {}
+    fused_cols, next_state = _calculate_fused_rolling_means_with_state(
+        [
+            column_set
+            for calculator, column_sets in calculators
+            if calculator is calculate_rolling_mean_by_dimension
+            for column_set in column_sets
+        ],
+        ROLLING_WINDOWS,
+        data_frame,
+        past_state,
+    )
+    calculated_cols = []
+
+    for calculator, column_sets in calculators:
+        for column_set, calc_func in zip(
+            column_sets, _calculate_feature_col(calculator, column_sets)
+        ):
+            if calculator is calculate_rolling_mean_by_dimension:
+                calculated_cols.append(fused_cols[tuple(column_set)])
+                continue
+
+            if calculator is calculate_rolling_rate:
+                state_key = f"rolling_{column_set[0]}_rate"
+                rolling_rate, next_state[state_key] = _rolling_rate_with_state(
+                    column_set[0], data_frame, state=past_state.get(state_key)
+                )
+                calculated_cols.append(rolling_rate)
+                continue
+
+            calculated_cols.append(calc_func(data_frame))
+
+    return pd.concat([data_frame, *calculated_cols], axis=1), next_state
+
+
 def feature_calculator(calculators: List[CalculatorPair]) -> DataFrameTransformer:
     """Call individual feature-calculation functions."""
     return update_wrapper(
@@ -58,38 +126,376 @@ def feature_calculator(calculators: List[CalculatorPair]) -> DataFrameTransforme
     )
 
 
+def _is_group_start(group_ids: np.ndarray) -> np.ndarray:
+    return np.concatenate([[True], group_ids[1:] != group_ids[:-1]])[: len(group_ids)]
+
+
+def _is_group_end(group_ids: np.ndarray) -> np.ndarray:
+    return np.concatenate([group_ids[1:] != group_ids[:-1], [True]])[: len(group_ids)]
+
+
+def _value_totals(values: np.ndarray) -> np.ndarray:
+    is_missing = np.isnan(values)
+    # Sums and counts share a single grouped pass. Counts are whole numbers,
+    # so storing them as floats doesn't change them.
+    return np.hstack([np.where(is_missing, 0, values), ~is_missing])
+
+
+def _group_cumulative_values(totals: np.ndarray, group_ids: np.ndarray) -> np.ndarray:
+    return (
+        pd.DataFrame(totals)
+        .groupby(group_ids, sort=False)
+        .cumsum()
+        .to_numpy(dtype=float)
+    )
+
+
+def _rolling_means_from_cumulative_values(
+    group_cumulative_values: np.ndarray,
+    group_row_numbers: np.ndarray,
+    rolling_window: int,
+) -> np.ndarray:
+    row_numbers = np.arange(len(group_row_numbers))
+
+    # Subtracting the cumulative values from a window's length earlier
+    # gives the values within the window, but only once a group has that many rows
+    has_full_window = group_row_numbers >= rolling_window
+    lagged_values = np.where(
+        has_full_window[:, np.newaxis],
+        group_cumulative_values[np.maximum(row_numbers - rolling_window, 0)],
+        0,
+    )
+    window_values = group_cumulative_values - lagged_values
+
+    n_columns = group_cumulative_values.shape[1] // 2
+    cum_sums, cum_counts = np.split(group_cumulative_values, [n_columns], axis=1)
+    window_sums, window_counts = np.split(window_values, [n_columns], axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expanding_means = np.where(cum_counts >= 1, cum_sums / cum_counts, np.nan)
+
+        return np.where(
+            window_counts >= rolling_window,
+            window_sums / window_counts,
+            expanding_means,
+        )
+
+
+def _rolling_mean_filled_by_expanding_mean(
+    values: np.ndarray, group_ids: np.ndarray, rolling_window: int
+) -> np.ndarray:
+    """Calculate rolling means, using expanding means for each group's initial window.
+
+    Both means come from one pass of cumulative sums, so we don't need separate
+    rolling & expanding aggregations.
+
+    Params
+    ------
+    values: 2D array of values, with each group's rows contiguous and in order.
+        Missing values are skipped, as with pandas' rolling & expanding methods.
+    group_ids: Group identifier for each row of values.
+    rolling_window: How large a window to use for rolling mean calculations.
+
+    Returns
+    -------
+    Array of means, the same shape as values.
+    """
+    row_numbers = np.arange(len(group_ids))
+    group_start_rows = np.maximum.accumulate(
+        np.where(_is_group_start(group_ids), row_numbers, 0)
+    )
+
+    return _rolling_means_from_cumulative_values(
+        _group_cumulative_values(_value_totals(values), group_ids),
+        row_numbers - group_start_rows,
+        rolling_window,
+    )
+
+
+def _sorted_group_rows(group_ids: np.ndarray) -> np.ndarray:
+    # A stable sort keeps each group's rows in their original order.
+    # As with groupby, rows with blank group values don't belong to any group.
+    sorted_rows = np.argsort(group_ids, kind="stable")
+
+    return sorted_rows[group_ids[sorted_rows] >= 0]
+
+
+def _group_values(groups: pd.DataFrame) -> Union[pd.DataFrame, pd.Series]:
+    values = groups.obj
+
+    if isinstance(values, pd.Series):
+        return values
+
+    # As with pandas' window methods, we don't aggregate grouping
+    # or non-numeric columns
+    group_keys = groups.keys if isinstance(groups.keys, list) else [groups.keys]
+    key_columns = [key for key in group_keys if isinstance(key, str)]
+
+    return values.select_dtypes("number").drop(columns=key_columns, errors="ignore")
+
+
 def rolling_rate_filled_by_expanding_rate(
     groups: pd.DataFrame, rolling_window: int
-) -> pd.DataFrame:
+) -> Union[pd.DataFrame, pd.Series]:
     """
     Fill blank values from rolling mean with expanding mean values.
 
     Params:
     -------
-    groups: A data frame produced by pandas' groupby method
+    groups: A series or data frame grouped by pandas' groupby method
     rolling_window: How large a window to use for rolling mean calculations
 
     Returns:
     --------
-    A data frame with rolling mean values, using expanding values
-        for the initial window
+    Rolling mean values, using expanding values for the initial window,
+        indexed by group keys followed by the original index, in group order
+        (i.e. the same shape as groups.expanding().mean())
     """
-    expanding_rate = groups.expanding(1).mean()
-    rolling_rate = groups.rolling(window=rolling_window).mean()
+    values = _group_values(groups)
+    group_ids = np.nan_to_num(groups.ngroup().to_numpy(dtype=float), nan=-1).astype(int)
+    sorted_rows = _sorted_group_rows(group_ids)
+
+    rolling_rates = _rolling_mean_filled_by_expanding_mean(
+        values.to_numpy(dtype=float).reshape(len(values), -1)[sorted_rows],
+        group_ids[sorted_rows],
+        rolling_window,
+    )
 
-    # When the original data frame has a multi-index, expanding and rolling produce
-    # different index shapes:
-    # Group.expanding appends the data frame's original index at the end
-    # of the group-key index.
-    # Group.rolling drops a data frame's multi-index, using just each group's label.
-    # Since both resulting series are the same shape and maintain the same order,
-    # we can assign expanding's multi-index to rolling to enable fillna
-    rolling_rate.index = expanding_rate.index
+    group_index = groups.size().index[group_ids[sorted_rows]]
+    value_index = values.index[sorted_rows]
+    rolling_rate_index = pd.MultiIndex.from_arrays(
+        [group_index.get_level_values(level) for level in range(group_index.nlevels)]
+        + [value_index.get_level_values(level) for level in range(value_index.nlevels)],
+        names=[*group_index.names, *value_index.names],
+    )
 
-    return rolling_rate.fillna(expanding_rate)
+    if isinstance(values, pd.Series):
+        return pd.Series(
+            rolling_rates[:, 0], index=rolling_rate_index, name=values.name
+        )
 
+    return pd.DataFrame(rolling_rates, index=rolling_rate_index, columns=values.columns)
 
-def _rolling_rate(column: str, data_frame: pd.DataFrame) -> pd.Series:
+
+def _group_ids(group_keys: pd.Index) -> Tuple[np.ndarray, pd.Index]:
+    # As with groupby, rows with blank group values don't belong to any group
+    is_grouped = ~group_keys.to_frame(index=False).isna().any(axis=1).to_numpy()
+    unique_keys = group_keys[is_grouped].unique()
+
+    return np.where(is_grouped, unique_keys.get_indexer(group_keys), -1), unique_keys
+
+
+def _rolling_mean_state_columns(
+    metric_columns: Sequence[str], rolling_window: int
+) -> pd.MultiIndex:
+    return pd.MultiIndex.from_product(
+        [
+            [
+                f"{total}_{window_row}"
+                for window_row in range(rolling_window)
+                for total in ["sum", "count"]
+            ],
+            metric_columns,
+        ],
+        names=["field", "metric"],
+    )
+
+
+def _rolling_means_with_state(
+    values: np.ndarray,
+    group_ids: np.ndarray,
+    group_keys: pd.Index,
+    rolling_window: int,
+    metric_columns: Sequence[str],
+    state: Optional[pd.DataFrame] = None,
+) -> Tuple[np.ndarray, pd.DataFrame]:
+    """Calculate rolling means filled by expanding means, continuing from earlier rows.
+
+    Params
+    ------
+    values: 2D array of values, with each group's rows in order.
+    group_ids: Group identifier for each row of values, with -1 for rows
+        that don't belong to any group.
+    group_keys: Key of each group, in group_ids order.
+    rolling_window: How large a window to use for rolling mean calculations.
+    metric_columns: Names of the columns of values.
+    state: Rolling mean state for earlier rows, as returned by an earlier call.
+
+    Returns
+    -------
+    Array of means, the same shape as values, and the state for later rows:
+        a data frame with a row per group key and each group's cumulative sums
+        & counts as of its last rolling_window rows, oldest first
+        (e.g. 'sum_0' & 'count_0' for the oldest).
+    """
+    n_columns = values.shape[1]
+    state_columns = _rolling_mean_state_columns(metric_columns, rolling_window)
+    state_keys = group_keys[:0] if state is None else state.index
+    all_keys = group_keys.append(state_keys[~state_keys.isin(group_keys)])
+
+    # Each group's saved cumulative values go before its rows as seed rows.
+    # Only the last seed row adds to the cumulative sums, so they continue
+    # from where they left off, with the same additions as for a full run.
+    state_values = (
+        np.empty((0, rolling_window, 2 * n_columns))
+        if state is None
+        else state[state_columns]
+        .to_numpy(dtype=float)
+        .reshape(len(state), rolling_window, 2 * n_columns)
+    )
+    is_seed = ~np.isnan(state_values).all(axis=2)
+    seed_ids = np.repeat(all_keys.get_indexer(state_keys), rolling_window)[
+        is_seed.flatten()
+    ]
+    seed_values = state_values[is_seed]
+    is_last_seed = np.tile(
+        np.arange(rolling_window) == rolling_window - 1, len(state_values)
+    )[is_seed.flatten()]
+    n_seeds = len(seed_ids)
+
+    all_group_ids = np.concatenate([seed_ids, group_ids])
+    totals = np.vstack(
+        [
+            np.where(is_last_seed[:, np.newaxis], seed_values, 0),
+            _value_totals(values),
+        ]
+    )
+
+    sorted_rows = _sorted_group_rows(all_group_ids)
+    sorted_group_ids = all_group_ids[sorted_rows]
+    is_sorted_seed = sorted_rows < n_seeds
+
+    group_cumulative_values = _group_cumulative_values(
+        totals[sorted_rows], sorted_group_ids
+    )
+
+    if n_seeds:
+        # Earlier seed rows only stand in for the rows before a group's last one
+        # when subtracting lagged values, so they get those rows' cumulative values
+        group_cumulative_values = group_cumulative_values.copy()
+        group_cumulative_values[is_sorted_seed] = seed_values[
+            sorted_rows[is_sorted_seed]
+        ]
+
+    row_numbers = np.arange(len(sorted_rows))
+    group_start_rows = np.maximum.accumulate(
+        np.where(_is_group_start(sorted_group_ids), row_numbers, 0)
+    )
+    sorted_means = _rolling_means_from_cumulative_values(
+        group_cumulative_values, row_numbers - group_start_rows, rolling_window
+    )
+
+    means = np.full((len(values), n_columns), np.nan)
+    means[sorted_rows[~is_sorted_seed] - n_seeds] = sorted_means[~is_sorted_seed]
+
+    group_end_rows = np.minimum.accumulate(
+        np.where(_is_group_end(sorted_group_ids), row_numbers, len(row_numbers))[::-1]
+    )[::-1]
+    rows_from_end = group_end_rows - row_numbers
+    is_in_window = rows_from_end < rolling_window
+
+    next_state_values = np.full((len(all_keys), rolling_window, 2 * n_columns), np.nan)
+    next_state_values[
+        sorted_group_ids[is_in_window], rolling_window - 1 - rows_from_end[is_in_window]
+    ] = group_cumulative_values[is_in_window]
+
+    return (
+        means,
+        pd.DataFrame(
+            next_state_values.reshape(len(all_keys), -1),
+            index=all_keys,
+            columns=state_columns,
+        ),
+    )
+
+
+def rolling_prev_match_means_with_state(
+    values: pd.DataFrame,
+    group_keys: pd.Index,
+    rolling_window: int,
+    state: Optional[pd.DataFrame] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Calculate rolling means of each group's values from the previous row.
+
+    As with the full-history calculations, previous values for each group's first
+    row and missing values count as zero, and initial windows are filled
+    with expanding means.
+
+    Params
+    ------
+    values: Values to average, with each group's rows in order.
+    group_keys: Group key for each row of values.
+    rolling_window: How large a window to use for rolling mean calculations.
+    state: State for earlier rows, as returned by an earlier call. Pass None
+        to calculate means from the given rows alone.
+
+    Returns
+    -------
+    Data frame of means, with the same index & columns as values, and the state
+        for calculating means for later rows: a data frame with a row per group key,
+        with each group's last values and rolling mean state.
+    """
+    metric_columns = list(values.columns)
+    group_ids, unique_keys = _group_ids(group_keys)
+    sorted_rows = _sorted_group_rows(group_ids)
+    sorted_group_ids = group_ids[sorted_rows]
+    is_group_start = _is_group_start(sorted_group_ids)
+    metric_values = values.to_numpy(dtype=float)[sorted_rows]
+
+    prev_match_values = np.roll(metric_values, 1, axis=0)
+    prev_match_values[is_group_start] = (
+        0
+        if state is None
+        else state["last"][metric_columns]
+        .reindex(unique_keys[sorted_group_ids[is_group_start]])
+        .to_numpy(dtype=float)
+    )
+    prev_match_values = np.where(np.isnan(prev_match_values), 0, prev_match_values)
+
+    unsorted_prev_match_values = np.full(metric_values.shape, np.nan)
+    unsorted_prev_match_values[sorted_rows] = prev_match_values
+    rolling_means, next_rolling_mean_state = _rolling_means_with_state(
+        unsorted_prev_match_values,
+        group_ids,
+        unique_keys,
+        rolling_window,
+        metric_columns,
+        state=state,
+    )
+
+    is_group_end = _is_group_end(sorted_group_ids)
+    last_values = pd.DataFrame(
+        metric_values[is_group_end],
+        index=unique_keys[sorted_group_ids[is_group_end]],
+        columns=metric_columns,
+    )
+
+    if state is not None:
+        past_last_values = state["last"][metric_columns]
+        last_values = pd.concat(
+            [
+                past_last_values.loc[~past_last_values.index.isin(last_values.index)],
+                last_values,
+            ]
+        )
+
+    next_state = pd.concat(
+        [
+            pd.concat(
+                {"last": last_values.reindex(next_rolling_mean_state.index)}, axis=1
+            ),
+            next_rolling_mean_state,
+        ],
+        axis=1,
+    ).rename_axis(columns=next_rolling_mean_state.columns.names)
+
+    return (
+        pd.DataFrame(rolling_means, index=values.index, columns=metric_columns),
+        next_state,
+    )
+
+
+def _validate_rolling_rate_column(column: str, data_frame: pd.DataFrame) -> None:
     if column not in data_frame.columns:
         raise ValueError(
             f"To calculate rolling rate, '{column}' "
@@ -97,6 +503,10 @@ def _rolling_rate(column: str, data_frame: pd.DataFrame) -> pd.Series:
             f"{data_frame.columns}"
         )
 
+
+def _rolling_rate(column: str, data_frame: pd.DataFrame) -> pd.Series:
+    _validate_rolling_rate_column(column, data_frame)
+
     groups = data_frame[column].groupby(level=TEAM_LEVEL, group_keys=True)
 
     return (
@@ -108,6 +518,32 @@ def _rolling_rate(column: str, data_frame: pd.DataFrame) -> pd.Series:
     )
 
 
+def _rolling_rate_with_state(
+    column: str, data_frame: pd.DataFrame, state: Optional[pd.DataFrame] = None
+) -> Tuple[pd.Series, pd.DataFrame]:
+    _validate_rolling_rate_column(column, data_frame)
+
+    group_ids, group_keys = _group_ids(
+        pd.Index(data_frame.index.get_level_values(TEAM_LEVEL))
+    )
+    rolling_rates, next_state = _rolling_means_with_state(
+        data_frame[[column]].to_numpy(dtype=float),
+        group_ids,
+        group_keys,
+        AVG_SEASON_LENGTH,
+        [column],
+        state=state,
+    )
+
+    return (
+        pd.Series(rolling_rates[:, 0], index=data_frame.index)
+        .dropna()
+        .sort_index()
+        .rename(f"rolling_{column}_rate"),
+        next_state,
+    )
+
+
 def calculate_rolling_rate(column: Sequence[str]) -> DataFrameCalculator:
     """Calculate the rolling mean of a column."""
     if len(column) != 1:
@@ -118,18 +554,11 @@ def calculate_rolling_rate(column: Sequence[str]) -> DataFrameCalculator:
     return update_wrapper(partial(_rolling_rate, column[0]), _rolling_rate)
 
 
-def _rolling_mean_by_dimension(
-    column_pair: Sequence[str],
-    rolling_windows: Dict[str, int],
-    data_frame: pd.DataFrame,
-) -> pd.Series:
+def _validate_rolling_mean_by_dimension_columns(
+    column_pair: Sequence[str], data_frame: pd.DataFrame
+) -> None:
     dimension_column, metric_column = column_pair
     required_columns = ["team", *column_pair]
-    rolling_window = (
-        rolling_windows[dimension_column]
-        if dimension_column in rolling_windows.keys()
-        else AVG_SEASON_LENGTH
-    )
 
     if any([col not in data_frame.columns for col in required_columns]):
         raise ValueError(
@@ -138,24 +567,179 @@ def _rolling_mean_by_dimension(
             f"{data_frame.columns}"
         )
 
-    prev_match_values = (
-        data_frame.groupby(["team", dimension_column])[metric_column].shift().fillna(0)
+
+def _rolling_means_by_dimension(
+    dimension_column: str,
+    metric_columns: List[str],
+    rolling_window: int,
+    data_frame: pd.DataFrame,
+) -> pd.DataFrame:
+    team_codes, _ = pd.factorize(data_frame["team"])
+    dimension_codes, dimension_values = pd.factorize(data_frame[dimension_column])
+    # As with groupby, rows with blank group values don't belong to any group
+    is_grouped = (team_codes >= 0) & (dimension_codes >= 0)
+    group_ids = np.where(
+        is_grouped, team_codes * len(dimension_values) + dimension_codes, -1
+    )
+
+    sorted_rows = _sorted_group_rows(group_ids)
+    sorted_group_ids = group_ids[sorted_rows]
+
+    metric_values = data_frame[metric_columns].to_numpy(dtype=float)[sorted_rows]
+    prev_match_values = np.roll(metric_values, 1, axis=0)
+    prev_match_values[_is_group_start(sorted_group_ids)] = 0
+    prev_match_values = np.where(np.isnan(prev_match_values), 0, prev_match_values)
+
+    rolling_means = np.full((len(data_frame), len(metric_columns)), np.nan)
+    rolling_means[sorted_rows] = _rolling_mean_filled_by_expanding_mean(
+        prev_match_values, sorted_group_ids, rolling_window
     )
-    prev_match_values_label = f"prev_{metric_column}_by_{dimension_column}"
 
-    groups = data_frame.assign(**{prev_match_values_label: prev_match_values}).groupby(
-        ["team", dimension_column], group_keys=True
-    )[prev_match_values_label]
+    return pd.DataFrame(rolling_means, index=data_frame.index, columns=metric_columns)
+
 
+def _rolling_means_by_dimension_with_state(
+    dimension_column: str,
+    metric_columns: List[str],
+    rolling_window: int,
+    data_frame: pd.DataFrame,
+    state: Optional[pd.DataFrame] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    return rolling_prev_match_means_with_state(
+        data_frame[metric_columns],
+        pd.MultiIndex.from_arrays(
+            [data_frame["team"], data_frame[dimension_column]],
+            names=["team", dimension_column],
+        ),
+        rolling_window,
+        state=state,
+    )
+
+
+def _rolling_window_by_dimension(
+    dimension_column: str, rolling_windows: Dict[str, int]
+) -> int:
     return (
-        rolling_rate_filled_by_expanding_rate(groups, rolling_window)
-        .reset_index(level=[0, 1], drop=True)
+        rolling_windows[dimension_column]
+        if dimension_column in rolling_windows.keys()
+        else AVG_SEASON_LENGTH
+    )
+
+
+def _format_rolling_mean_by_dimension(
+    rolling_means: pd.DataFrame, column_pair: Sequence[str]
+) -> pd.Series:
+    dimension_column, metric_column = column_pair
+
+    return (
+        rolling_means[metric_column]
         .dropna()
         .sort_index()
         .rename(f"rolling_mean_{metric_column}_by_{dimension_column}")
     )
 
 
+def _rolling_mean_by_dimension(
+    column_pair: Sequence[str],
+    rolling_windows: Dict[str, int],
+    data_frame: pd.DataFrame,
+) -> pd.Series:
+    _validate_rolling_mean_by_dimension_columns(column_pair, data_frame)
+
+    dimension_column, metric_column = column_pair
+    rolling_means = _rolling_means_by_dimension(
+        dimension_column,
+        [metric_column],
+        _rolling_window_by_dimension(dimension_column, rolling_windows),
+        data_frame,
+    )
+
+    return _format_rolling_mean_by_dimension(rolling_means, column_pair)
+
+
+def _fused_rolling_mean_calcs(
+    column_pairs: List[Sequence[str]],
+    rolling_windows: Dict[str, int],
+    data_frame: pd.DataFrame,
+) -> Dict[Tuple[str, int], List[Sequence[str]]]:
+    # Rolling means by dimension that share a grouping (e.g. margin, result, & score
+    # by oppo_team) are calculated together, so we only group & sort rows once
+    # per dimension rather than once per feature
+    fused_calcs: Dict[Tuple[str, int], List[Sequence[str]]] = {}
+
+    for column_pair in column_pairs:
+        _validate_rolling_mean_by_dimension_columns(column_pair, data_frame)
+
+        dimension_column = column_pair[0]
+        rolling_window = _rolling_window_by_dimension(dimension_column, rolling_windows)
+        fused_calcs.setdefault((dimension_column, rolling_window), []).append(
+            column_pair
+        )
+
+    return fused_calcs
+
+
+def _fused_metric_columns(dimension_pairs: List[Sequence[str]]) -> List[str]:
+    return list(dict.fromkeys(column_pair[1] for column_pair in dimension_pairs))
+
+
+def _calculate_fused_rolling_means(
+    column_pairs: List[Sequence[str]],
+    rolling_windows: Dict[str, int],
+    data_frame: pd.DataFrame,
+) -> Dict[Tuple[str, ...], pd.Series]:
+    fused_cols = {}
+
+    fused_calcs = _fused_rolling_mean_calcs(column_pairs, rolling_windows, data_frame)
+
+    for (dimension_column, rolling_window), dimension_pairs in fused_calcs.items():
+        rolling_means = _rolling_means_by_dimension(
+            dimension_column,
+            _fused_metric_columns(dimension_pairs),
+            rolling_window,
+            data_frame,
+        )
+
+        for column_pair in dimension_pairs:
+            fused_cols[tuple(column_pair)] = _format_rolling_mean_by_dimension(
+                rolling_means, column_pair
+            )
+
+    return fused_cols
+
+
+def _calculate_fused_rolling_means_with_state(
+    column_pairs: List[Sequence[str]],
+    rolling_windows: Dict[str, int],
+    data_frame: pd.DataFrame,
+    state: Dict[str, Any],
+) -> Tuple[Dict[Tuple[str, ...], pd.Series], Dict[str, Any]]:
+    fused_cols = {}
+    next_state = {}
+
+    fused_calcs = _fused_rolling_mean_calcs(column_pairs, rolling_windows, data_frame)
+
+    for (dimension_column, rolling_window), dimension_pairs in fused_calcs.items():
+        state_key = f"rolling_means_by_{dimension_column}"
+        (
+            rolling_means,
+            next_state[state_key],
+        ) = _rolling_means_by_dimension_with_state(
+            dimension_column,
+            _fused_metric_columns(dimension_pairs),
+            rolling_window,
+            data_frame,
+            state=state.get(state_key),
+        )
+
+        for column_pair in dimension_pairs:
+            fused_cols[tuple(column_pair)] = _format_rolling_mean_by_dimension(
+                rolling_means, column_pair
+            )
+
+    return fused_cols, next_state
+
+
 def calculate_rolling_mean_by_dimension(
     column_pair: Sequence[str], rolling_windows: Dict[str, int] = ROLLING_WINDOWS
 ) -> DataFrameCalculator:
@@ -1,7 +1,7 @@
 """Pipeline nodes for transforming match data."""
 
-from typing import List, Tuple
-from functools import partial, reduce, update_wrapper
+from typing import List, Optional, Tuple
+from functools import partial, update_wrapper, lru_cache
 import math
 import re
 
@@ -28,16 +28,6 @@ from .base import (
 )
 
 
-EloDictionary = TypedDict(
-    "EloDictionary",
-    {
-        "home_away_elo_ratings": List[Tuple[float, float]],
-        "current_team_elo_ratings": np.ndarray,
-        "year": int,
-    },
-)
-
-
 MATCH_COL_TRANSLATIONS = {
     "home_points": "home_score",
     "away_points": "away_score",
@@ -77,6 +67,27 @@ TEAM_LEVEL = 0
 YEAR_LEVEL = 1
 WIN_POINTS = 4
 
+EloState = TypedDict(
+    "EloState",
+    {
+        "team_elo_ratings": pd.Series,
+        # Rating for teams that haven't played yet, which gets adjusted between
+        # seasons like any other
+        "new_team_elo_rating": float,
+        "year": int,
+    },
+)
+
+TeamVenueLookup = TypedDict(
+    "TeamVenueLookup",
+    {
+        "teams": pd.Index,
+        "venues": pd.Index,
+        "travel_distance": np.ndarray,
+        "out_of_state": np.ndarray,
+    },
+)
+
 
 # AFLTables has some incorrect home/away team designations for finals 2019
 def _correct_home_away_teams(match_data: pd.DataFrame) -> pd.DataFrame:
@@ -299,52 +310,67 @@ def _elo_formula(
     return prev_elo_rating + (K * (actual_outcome - expected_outcome))
 
 
-# Assumes df sorted by year & round_number with ascending=True in order to calculate
+# Assumes elo_matrix is sorted by date with ascending=True in order to calculate
 # correct Elo ratings
-def _calculate_match_elo_rating(
-    elo_ratings: EloDictionary,
-    # match_row = [year, home_team, away_team, home_margin]
-    match_row: np.ndarray,
-) -> EloDictionary:
-    match_year = match_row[0]
-
-    # It's typical for Elo models to do a small adjustment toward the baseline between
-    # seasons
-    if match_year != elo_ratings["year"]:
-        prematch_team_elo_ratings = (
-            elo_ratings["current_team_elo_ratings"] * SEASON_CARRYOVER
-        ) + BASE_RATING * (1 - SEASON_CARRYOVER)
-    else:
-        prematch_team_elo_ratings = elo_ratings["current_team_elo_ratings"].copy()
-
-    home_team = int(match_row[1])
-    away_team = int(match_row[2])
-    home_margin = match_row[3]
-
-    prematch_home_elo_rating = prematch_team_elo_ratings[home_team]
-    prematch_away_elo_rating = prematch_team_elo_ratings[away_team]
+def _calculate_match_elo_ratings(
+    elo_matrix: np.ndarray, team_elo_ratings: np.ndarray, current_year: int = 0
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    # elo_matrix rows = [year, home_team, away_team, home_margin]
+    team_elo_ratings = team_elo_ratings.astype(float)
+    # Preallocating the output (columns = [home_elo_rating, away_elo_rating])
+    # lets us walk through the matches once without copying any intermediate state
+    prematch_elo_ratings = np.empty((len(elo_matrix), 2))
+
+    # Iterating through a list of python scalars is a lot faster than iterating
+    # through numpy rows, and the float arithmetic is the same
+    for match_idx, match_row in enumerate(elo_matrix.tolist()):
+        match_year, home_team, away_team, home_margin = match_row
+
+        # It's typical for Elo models to do a small adjustment toward the baseline
+        # between seasons
+        if match_year != current_year:
+            team_elo_ratings = (
+                team_elo_ratings * SEASON_CARRYOVER
+            ) + BASE_RATING * (1 - SEASON_CARRYOVER)
+            current_year = match_year
+
+        home_team = int(home_team)
+        away_team = int(away_team)
+
+        prematch_home_elo_rating = team_elo_ratings[home_team]
+        prematch_away_elo_rating = team_elo_ratings[away_team]
+
+        prematch_elo_ratings[match_idx, 0] = prematch_home_elo_rating
+        prematch_elo_ratings[match_idx, 1] = prematch_away_elo_rating
+
+        team_elo_ratings[home_team] = _elo_formula(
+            prematch_home_elo_rating, prematch_away_elo_rating, home_margin, True
+        )
+        team_elo_ratings[away_team] = _elo_formula(
+            prematch_away_elo_rating, prematch_home_elo_rating, home_margin * -1, False
+        )
 
-    home_elo_rating = _elo_formula(
-        prematch_home_elo_rating, prematch_away_elo_rating, home_margin, True
-    )
-    away_elo_rating = _elo_formula(
-        prematch_away_elo_rating, prematch_home_elo_rating, home_margin * -1, False
-    )
+    return prematch_elo_ratings, team_elo_ratings, current_year
 
-    postmatch_team_elo_ratings = prematch_team_elo_ratings.copy()
-    postmatch_team_elo_ratings[home_team] = home_elo_rating
-    postmatch_team_elo_ratings[away_team] = away_elo_rating
 
-    return {
-        "home_away_elo_ratings": elo_ratings["home_away_elo_ratings"]
-        + [(prematch_home_elo_rating, prematch_away_elo_rating)],
-        "current_team_elo_ratings": postmatch_team_elo_ratings,
-        "year": match_year,
-    }
+def add_elo_rating_with_state(
+    data_frame_arg: pd.DataFrame, past_elo_ratings: Optional[EloState] = None
+) -> Tuple[pd.DataFrame, EloState]:
+    """Append a column for teams' prematch Elo ratings, continuing past ratings.
 
+    Params
+    ------
+    data_frame_arg (pandas.DataFrame): Match data for matches after those used
+        to calculate past_elo_ratings.
+    past_elo_ratings (EloState, optional): Teams' ratings after earlier matches,
+        as returned by an earlier call. Pass None to start all teams
+        from the base rating.
 
-def add_elo_rating(data_frame_arg: pd.DataFrame) -> pd.DataFrame:
-    """Append a column for teams' prematch Elo ratings."""
+    Returns
+    -------
+    The same data frame as `add_elo_rating` returns, and teams' ratings
+        after the given matches.
+    """
     ELO_INDEX_COLS = {"home_team", "year", "round_number"}
     REQUIRED_COLS = ELO_INDEX_COLS | {"home_score", "away_score", "away_team", "date"}
 
@@ -361,8 +387,29 @@ def add_elo_rating(data_frame_arg: pd.DataFrame) -> pd.DataFrame:
     if not data_frame.index.is_monotonic:
         data_frame.sort_index(inplace=True)
 
+    past_team_elo_ratings = (
+        pd.Series(dtype=float)
+        if past_elo_ratings is None
+        else past_elo_ratings["team_elo_ratings"]
+    )
+    new_team_elo_rating = (
+        BASE_RATING
+        if past_elo_ratings is None
+        else past_elo_ratings["new_team_elo_rating"]
+    )
+
+    # Teams' ratings are in label order, so we include teams from earlier matches
+    # as well as those that haven't played at home yet
     le = LabelEncoder()
-    le.fit(data_frame["home_team"])
+    le.fit(
+        pd.concat(
+            [
+                past_team_elo_ratings.index.to_series(),
+                data_frame["home_team"],
+                data_frame["away_team"],
+            ]
+        )
+    )
     time_sorted_data_frame = data_frame.sort_values("date")
 
     elo_matrix = (
@@ -373,16 +420,18 @@ def add_elo_rating(data_frame_arg: pd.DataFrame) -> pd.DataFrame:
         .eval("home_margin = home_score - away_score")
         .loc[:, ["year", "home_team", "away_team", "home_margin"]]
     ).values
-    current_team_elo_ratings = np.full(len(set(data_frame["home_team"])), BASE_RATING)
-    starting_elo_dictionary: EloDictionary = {
-        "home_away_elo_ratings": [],
-        "current_team_elo_ratings": current_team_elo_ratings,
-        "year": 0,
-    }
 
-    elo_columns = reduce(
-        _calculate_match_elo_rating, elo_matrix, starting_elo_dictionary
-    )["home_away_elo_ratings"]
+    # The last rating is for teams that haven't played yet
+    elo_columns, team_elo_ratings, year = _calculate_match_elo_ratings(
+        elo_matrix,
+        np.append(
+            past_team_elo_ratings.reindex(le.classes_)
+            .fillna(new_team_elo_rating)
+            .to_numpy(),
+            new_team_elo_rating,
+        ),
+        current_year=0 if past_elo_ratings is None else past_elo_ratings["year"],
+    )
 
     elo_data_frame = pd.DataFrame(
         elo_columns,
@@ -390,18 +439,21 @@ def add_elo_rating(data_frame_arg: pd.DataFrame) -> pd.DataFrame:
         index=time_sorted_data_frame.index,
     ).sort_index()
 
-    return pd.concat([data_frame, elo_data_frame], axis=1)
-
+    return (
+        pd.concat([data_frame, elo_data_frame], axis=1),
+        {
+            "team_elo_ratings": pd.Series(team_elo_ratings[:-1], index=le.classes_),
+            "new_team_elo_rating": team_elo_ratings[-1],
+            "year": year,
+        },
+    )
 
-def add_out_of_state(data_frame: pd.DataFrame) -> pd.DataFrame:
-    """Append a column for whether a team is playing out of their home state."""
-    REQUIRED_COLS = {"venue", "team"}
-    _validate_required_columns(REQUIRED_COLS, data_frame.columns)
 
-    venue_state = data_frame["venue"].map(lambda x: CITIES[VENUE_CITIES[x]]["state"])
-    team_state = data_frame["team"].map(lambda x: CITIES[TEAM_CITIES[x]]["state"])
+def add_elo_rating(data_frame_arg: pd.DataFrame) -> pd.DataFrame:
+    """Append a column for teams' prematch Elo ratings."""
+    data_frame, _ = add_elo_rating_with_state(data_frame_arg)
 
-    return data_frame.assign(out_of_state=(team_state != venue_state).astype(int))
+    return data_frame
 
 
 # Got the formula from https://www.movable-type.co.uk/scripts/latlong.html
@@ -425,23 +477,89 @@ def _haversine_formula(
     return EARTH_RADIUS * c
 
 
+@lru_cache(maxsize=None)
+def team_venue_lookup() -> TeamVenueLookup:
+    """Get matrices of travel distances and out-of-state flags per team & venue.
+
+    Teams and venues are fixed in settings, so we only calculate each pair once,
+    the first time that this is called. Rows are teams and columns are venues,
+    in the order of the returned 'teams' and 'venues' indexes.
+
+    Returns
+    -------
+    Dictionary with team & venue indexes and matrices for each feature.
+    """
+    teams = pd.Index(sorted(TEAM_CITIES.keys()))
+    venues = pd.Index(sorted(VENUE_CITIES.keys()))
+    team_cities = [CITIES[TEAM_CITIES[team]] for team in teams]
+    venue_cities = [CITIES[VENUE_CITIES[venue]] for venue in venues]
+
+    travel_distance = np.array(
+        [
+            [
+                _haversine_formula(
+                    (venue_city["lat"], venue_city["long"]),
+                    (team_city["lat"], team_city["long"]),
+                )
+                for venue_city in venue_cities
+            ]
+            for team_city in team_cities
+        ]
+    )
+    out_of_state = np.array(
+        [
+            [
+                int(team_city["state"] != venue_city["state"])
+                for venue_city in venue_cities
+            ]
+            for team_city in team_cities
+        ]
+    )
+
+    # The matrices are shared by all callers, so we protect them from changes
+    travel_distance.setflags(write=False)
+    out_of_state.setflags(write=False)
+
+    return {
+        "teams": teams,
+        "venues": venues,
+        "travel_distance": travel_distance,
+        "out_of_state": out_of_state,
+    }
+
+
+def _lookup_team_venue_values(data_frame: pd.DataFrame, feature: str) -> np.ndarray:
+    lookup = team_venue_lookup()
+    team_codes = lookup["teams"].get_indexer(data_frame["team"])
+    venue_codes = lookup["venues"].get_indexer(data_frame["venue"])
+
+    for codes, col in [(team_codes, "team"), (venue_codes, "venue")]:
+        if (codes == -1).any():
+            raise KeyError(
+                f"Unknown {col} {data_frame[col].iloc[np.argmax(codes == -1)]}. "
+                f"Check the {col} cities in settings."
+            )
+
+    return lookup[feature][team_codes, venue_codes]  # type: ignore
+
+
+def add_out_of_state(data_frame: pd.DataFrame) -> pd.DataFrame:
+    """Append a column for whether a team is playing out of their home state."""
+    REQUIRED_COLS = {"venue", "team"}
+    _validate_required_columns(REQUIRED_COLS, data_frame.columns)
+
+    return data_frame.assign(
+        out_of_state=_lookup_team_venue_values(data_frame, "out_of_state")
+    )
+
+
 def add_travel_distance(data_frame: pd.DataFrame) -> pd.DataFrame:
     """Append column for distances between teams' home cities and match venue cities."""
     required_cols = {"venue", "team"}
     _validate_required_columns(required_cols, data_frame.columns)
 
-    venue_lat_long = data_frame["venue"].map(
-        lambda x: (CITIES[VENUE_CITIES[x]]["lat"], CITIES[VENUE_CITIES[x]]["long"])
-    )
-    team_lat_long = data_frame["team"].map(
-        lambda x: (CITIES[TEAM_CITIES[x]]["lat"], CITIES[TEAM_CITIES[x]]["long"])
-    )
-
     return data_frame.assign(
-        travel_distance=[
-            _haversine_formula(*lats_longs)
-            for lats_longs in zip(venue_lat_long, team_lat_long)
-        ]
+        travel_distance=_lookup_team_venue_values(data_frame, "travel_distance")
     )
 
 
@@ -465,6 +583,35 @@ def add_margin(data_frame: pd.DataFrame) -> pd.DataFrame:
 
 
 def _shift_features(columns: List[str], shift: bool, data_frame: pd.DataFrame):
+    shifted_data_frame, _ = shift_features_with_state(columns, shift, data_frame)
+
+    return shifted_data_frame
+
+
+def shift_features_with_state(
+    columns: List[str],
+    shift: bool,
+    data_frame: pd.DataFrame,
+    past_values: Optional[pd.DataFrame] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Shift features by one match per team, continuing from earlier matches.
+
+    Params
+    ------
+    columns (list of str): Columns to shift or to leave unshifted,
+        per `add_shifted_team_features`.
+    shift (bool): Whether to shift the given columns or all the others.
+    data_frame (pandas.DataFrame): Data for matches after those used
+        to calculate past_values.
+    past_values (pandas.DataFrame, optional): Values from each team's last match,
+        as returned by an earlier call. Pass None to treat each team's first row
+        as its first match.
+
+    Returns
+    -------
+    The same data frame as `add_shifted_team_features`' function returns,
+        and values from each team's last match.
+    """
     if shift:
         columns_to_shift = columns
     else:
@@ -477,14 +624,36 @@ def _shift_features(columns: List[str], shift: bool, data_frame: pd.DataFrame):
     # Group by team (not team & year) to get final score from previous season for round 1.
     # This reduces number of rows that need to be dropped and prevents gaps
     # for cumulative features
-    shifted_features = (
-        data_frame.groupby("team")[columns_to_shift]
-        .shift()
-        .fillna(0)
-        .rename(columns=shifted_col_names)
+    shifted_features = data_frame.groupby("team")[columns_to_shift].shift()
+
+    is_first_team_match = ~data_frame["team"].duplicated().to_numpy()
+    is_last_team_match = ~data_frame["team"].duplicated(keep="last").to_numpy()
+
+    if past_values is not None:
+        first_match_values = past_values.reindex(
+            data_frame["team"].to_numpy()[is_first_team_match]
+        )
+
+        # Assigning a column at a time keeps each column's dtype
+        for col in columns_to_shift:
+            shifted_features.loc[is_first_team_match, col] = first_match_values[
+                col
+            ].to_numpy()
+
+    last_values = data_frame.loc[is_last_team_match, columns_to_shift].set_index(
+        data_frame["team"].to_numpy()[is_last_team_match]
     )
 
-    return pd.concat([data_frame, shifted_features], axis=1)
+    return (
+        pd.concat(
+            [
+                data_frame,
+                shifted_features.fillna(0).rename(columns=shifted_col_names),
+            ],
+            axis=1,
+        ),
+        _latest_team_values(past_values, last_values),
+    )
 
 
 def add_shifted_team_features(
@@ -508,18 +677,94 @@ def add_shifted_team_features(
     return update_wrapper(partial(_shift_features, columns, shift), _shift_features)
 
 
+def _latest_team_values(
+    past_values: Optional[pd.DataFrame], values: pd.DataFrame
+) -> pd.DataFrame:
+    if past_values is None:
+        return values
+
+    return pd.concat(
+        [past_values.loc[~past_values.index.isin(values.index)], values], sort=False
+    )
+
+
+def _with_team_seed_rows(
+    data_frame: pd.DataFrame, team_values: Optional[pd.DataFrame]
+) -> pd.DataFrame:
+    # Saved values from each team's last match go before its rows, so grouped
+    # calculations continue from them
+    if team_values is None:
+        return data_frame
+
+    seed_index = pd.MultiIndex.from_arrays(
+        [
+            team_values.index,
+            team_values["year"],
+            np.zeros(len(team_values), dtype=int),
+        ],
+        names=data_frame.index.names,
+    )
+
+    return pd.concat(
+        [team_values[data_frame.columns].set_index(seed_index), data_frame]
+    )
+
+
+def _last_team_values(data_frame: pd.DataFrame) -> pd.DataFrame:
+    last_rows = data_frame.groupby(level=TEAM_LEVEL).tail(1)
+
+    return last_rows.assign(
+        year=last_rows.index.get_level_values(YEAR_LEVEL)
+    ).set_index(last_rows.index.get_level_values(TEAM_LEVEL))
+
+
+def _cum_sums_by_season(
+    values: pd.DataFrame, past_sums: Optional[pd.DataFrame] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    seeded_values = _with_team_seed_rows(values, past_sums)
+    cum_sums = seeded_values.groupby(level=[TEAM_LEVEL, YEAR_LEVEL]).cumsum()
+
+    return (
+        cum_sums.iloc[len(seeded_values) - len(values) :],
+        _last_team_values(cum_sums),
+    )
+
+
 def add_cum_win_points(data_frame: pd.DataFrame) -> pd.DataFrame:
     """Append a column for teams' cumulative win points per season."""
+    cum_win_points_data_frame, _ = add_cum_win_points_with_state(data_frame)
+
+    return cum_win_points_data_frame
+
+
+def add_cum_win_points_with_state(
+    data_frame: pd.DataFrame, past_sums: Optional[pd.DataFrame] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Append a column for teams' cumulative win points, continuing from past ones.
+
+    Params
+    ------
+    data_frame (pandas.DataFrame): Data for matches after those used
+        to calculate past_sums.
+    past_sums (pandas.DataFrame, optional): Each team's season & win points
+        as of its last match, as returned by an earlier call.
+
+    Returns
+    -------
+    The same data frame as `add_cum_win_points` returns, and each team's
+        season & win points as of its last match.
+    """
     REQUIRED_COLS = {"prev_match_result"}
     _validate_required_columns(REQUIRED_COLS, data_frame.columns)
 
-    cum_win_points_col = (
-        (data_frame["prev_match_result"] * WIN_POINTS)
-        .groupby(level=[TEAM_LEVEL, YEAR_LEVEL])
-        .cumsum()
+    cum_win_points, next_sums = _cum_sums_by_season(
+        (data_frame[["prev_match_result"]] * WIN_POINTS).rename(
+            columns={"prev_match_result": "cum_win_points"}
+        ),
+        past_sums,
     )
 
-    return data_frame.assign(cum_win_points=cum_win_points_col)
+    return data_frame.assign(cum_win_points=cum_win_points["cum_win_points"]), next_sums
 
 
 def add_win_streak(data_frame: pd.DataFrame) -> pd.DataFrame:
@@ -529,43 +774,75 @@ def add_win_streak(data_frame: pd.DataFrame) -> pd.DataFrame:
     (win or draw) adds 1 (or 0.5); negative result subtracts 1. Changes in direction
     (i.e. broken streak) result in starting over at 1 or -1.
     """
+    win_streak_data_frame, _ = add_win_streak_with_state(data_frame)
+
+    return win_streak_data_frame
+
+
+def add_win_streak_with_state(
+    data_frame: pd.DataFrame, past_streaks: Optional[pd.DataFrame] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Append a column for teams' win/loss streaks, continuing from past ones.
+
+    Params
+    ------
+    data_frame (pandas.DataFrame): Data for matches after those used
+        to calculate past_streaks.
+    past_streaks (pandas.DataFrame, optional): Each team's season, result direction,
+        & streak as of its last match, as returned by an earlier call.
+
+    Returns
+    -------
+    The same data frame as `add_win_streak` returns, and each team's season,
+        result direction, & streak as of its last match.
+    """
     REQUIRED_COLS = {"prev_match_result"}
     _validate_required_columns(REQUIRED_COLS, data_frame.columns)
 
-    win_groups = data_frame["prev_match_result"].groupby(
-        level=TEAM_LEVEL, group_keys=False
-    )
-    streak_groups = []
-
-    for team_group_key, team_group in win_groups:
-        streaks: List = []
-
-        for idx, result in enumerate(team_group):
-            # 1 represents win, 0.5 represents draw
-            if result > 0:
-                if idx == 0 or streaks[idx - 1] <= 0:
-                    streaks.append(result)
-                else:
-                    streaks.append(streaks[idx - 1] + result)
-            # 0 represents loss
-            elif result == 0:
-                if idx == 0 or streaks[idx - 1] >= 0:
-                    streaks.append(-1)
-                else:
-                    streaks.append(streaks[idx - 1] - 1)
-            elif result < 0:
-                raise ValueError(
-                    f"No results should be negative, but {result} "
-                    f"is at index {idx} of group {team_group_key}"
-                )
-            else:
-                # For a team's first match in the data set or any rogue NaNs, we add 0
-                streaks.append(0)
+    results = data_frame["prev_match_result"]
+    negative_results = results[results < 0]
 
-        streak_groups.extend(streaks)
+    if not negative_results.empty:
+        raise ValueError(
+            f"No results should be negative, but {negative_results.iloc[0]} "
+            f"is at index {negative_results.index[0]}"
+        )
 
-    return data_frame.assign(
-        win_streak=pd.Series(streak_groups, index=data_frame.index)
+    # 1 represents win, 0.5 represents draw, 0 represents loss.
+    # For a team's first match in the data set or any rogue NaNs, we add 0,
+    # which also breaks any streak.
+    result_conditions = [results > 0, results == 0]
+    # A team's last streak continues from its seed row, so seeds use streaks
+    # in place of increments
+    streak_data_frame = _with_team_seed_rows(
+        pd.DataFrame(
+            {
+                "result_sign": np.select(result_conditions, [1, -1], default=0),
+                "win_streak": np.select(result_conditions, [results, -1], default=0),
+            },
+            index=data_frame.index,
+        ),
+        past_streaks,
+    )
+    result_signs = streak_data_frame["result_sign"]
+
+    # Each run of results in the same direction is a streak, so we sum increments
+    # within runs rather than looping through each team's matches
+    is_streak_start = result_signs != result_signs.groupby(level=TEAM_LEVEL).shift()
+    streak_ids = is_streak_start.groupby(level=TEAM_LEVEL).cumsum()
+    win_streaks = (
+        streak_data_frame["win_streak"]
+        .groupby([streak_data_frame.index.get_level_values(TEAM_LEVEL), streak_ids])
+        .cumsum()
+    )
+
+    next_streaks = _last_team_values(streak_data_frame.assign(win_streak=win_streaks))
+
+    return (
+        data_frame.assign(
+            win_streak=win_streaks.iloc[len(streak_data_frame) - len(data_frame) :]
+        ),
+        next_streaks,
     )
 
 
@@ -575,19 +852,42 @@ def add_cum_percent(data_frame: pd.DataFrame) -> pd.DataFrame:
     This is an official stat used as a tie-breaker for AFL ladder positions
     and is calculated as cumulative score / cumulative opponents' score.
     """
+    cum_percent_data_frame, _ = add_cum_percent_with_state(data_frame)
+
+    return cum_percent_data_frame
+
+
+def add_cum_percent_with_state(
+    data_frame: pd.DataFrame, past_sums: Optional[pd.DataFrame] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Append a column for teams' cumulative percentages, continuing past sums.
+
+    Params
+    ------
+    data_frame (pandas.DataFrame): Data for matches after those used
+        to calculate past_sums.
+    past_sums (pandas.DataFrame, optional): Each team's season & cumulative scores
+        as of its last match, as returned by an earlier call.
+
+    Returns
+    -------
+    The same data frame as `add_cum_percent` returns, and each team's season
+        & cumulative scores as of its last match.
+    """
     REQUIRED_COLS = {"prev_match_score", "prev_match_oppo_score"}
     _validate_required_columns(REQUIRED_COLS, data_frame.columns)
 
-    cum_score = (
-        data_frame["prev_match_score"].groupby(level=[TEAM_LEVEL, YEAR_LEVEL]).cumsum()
-    )
-    cum_oppo_score = (
-        data_frame["prev_match_oppo_score"]
-        .groupby(level=[TEAM_LEVEL, YEAR_LEVEL])
-        .cumsum()
+    cum_scores, next_sums = _cum_sums_by_season(
+        data_frame[["prev_match_score", "prev_match_oppo_score"]], past_sums
     )
 
-    return data_frame.assign(cum_percent=cum_score / cum_oppo_score)
+    return (
+        data_frame.assign(
+            cum_percent=cum_scores["prev_match_score"]
+            / cum_scores["prev_match_oppo_score"]
+        ),
+        next_sums,
+    )
 
 
 def add_ladder_position(data_frame: pd.DataFrame) -> pd.DataFrame:
@@ -595,35 +895,20 @@ def add_ladder_position(data_frame: pd.DataFrame) -> pd.DataFrame:
     REQUIRED_COLS = INDEX_COLS + ["cum_win_points", "cum_percent"]
     _validate_required_columns(REQUIRED_COLS, data_frame.columns)
 
-    # Pivot to get round-by-round match points and cumulative percent
-    ladder_pivot_table = data_frame[
-        INDEX_COLS + ["cum_win_points", "cum_percent"]
-    ].pivot_table(
-        index=["year", "round_number"],
-        values=["cum_win_points", "cum_percent"],
-        columns="team",
-        aggfunc={"cum_win_points": np.sum, "cum_percent": np.mean},
-    )
-
-    # To get round-by-round ladder ranks, we sort each round by win points & percent,
-    # then save index numbers
-    ladder_index = []
-    ladder_values = []
-
-    for year_round_idx, round_row in ladder_pivot_table.iterrows():
-        sorted_row = round_row.unstack(level=TEAM_LEVEL).sort_values(
-            ["cum_win_points", "cum_percent"], ascending=False
+    # To get round-by-round ladder ranks, we sort all rows by round, then by
+    # win points & percent, with ties going to teams in alphabetical order,
+    # then count rows within each round. Missing win points count as zero,
+    # and missing percents rank below all others with the same win points.
+    ladder_position_col = (
+        data_frame[REQUIRED_COLS]
+        .assign(cum_win_points=lambda df: df["cum_win_points"].fillna(0))
+        .sort_values(
+            ["year", "round_number", "cum_win_points", "cum_percent", "team"],
+            ascending=[True, True, False, False, True],
         )
-
-        for ladder_idx, team_name in enumerate(sorted_row.index.to_numpy()):
-            ladder_index.append(tuple([team_name, *year_round_idx]))
-            ladder_values.append(ladder_idx + 1)
-
-    ladder_multi_index = pd.MultiIndex.from_tuples(
-        ladder_index, names=tuple(INDEX_COLS)
-    )
-    ladder_position_col = pd.Series(
-        ladder_values, index=ladder_multi_index, name="ladder_position"
+        .groupby(["year", "round_number"])
+        .cumcount()
+        + 1
     )
 
     return data_frame.assign(ladder_position=ladder_position_col)
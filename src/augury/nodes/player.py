@@ -1,18 +1,20 @@
 """Pipeline nodes for transforming player data."""
 
-from typing import Callable, List, Dict, Union, Tuple
+from typing import Callable, List, Dict, Union, Tuple, Optional
 from functools import partial, update_wrapper
 from datetime import datetime, timedelta
 import re
 
 import pandas as pd
+import numpy as np
 
-from augury.nodes.feature_calculation import rolling_rate_filled_by_expanding_rate
+from augury.nodes.feature_calculation import rolling_prev_match_means_with_state
 from augury.settings import (
     TEAM_TRANSLATIONS,
     AVG_SEASON_LENGTH,
     INDEX_COLS,
     MELBOURNE_TIMEZONE,
+    TEAM_NAMES,
 )
 from .base import (
     _parse_dates,
@@ -57,6 +59,30 @@ UNUSED_PLAYER_COLS = [
     "group_id",
 ]
 
+RAW_PLAYER_STATS_COLS = [
+    "kicks",
+    "marks",
+    "handballs",
+    "goals",
+    "behinds",
+    "hit_outs",
+    "tackles",
+    "rebounds",
+    "inside_50s",
+    "clearances",
+    "clangers",
+    "frees_for",
+    "frees_against",
+    "contested_possessions",
+    "uncontested_possessions",
+    "contested_marks",
+    "marks_inside_50",
+    "one_percenters",
+    "bounces",
+    "goal_assists",
+    "time_on_ground",
+]
+
 PLAYER_STATS_COLS = [
     "rolling_prev_match_kicks",
     "rolling_prev_match_marks",
@@ -82,7 +108,27 @@ PLAYER_STATS_COLS = [
     "last_year_brownlow_votes",
 ]
 
+# Need to add year to the index, because there are some
+# player_id/match_id combos, decades apart, that by chance overlap
+PLAYER_INDEX_COLS = ["year", "match_id", "player_id"]
+# Player stats and scores are whole numbers well within int16 limits,
+# so we store them in a quarter of the memory of float64
+COMPACT_INT_COLS = RAW_PLAYER_STATS_COLS + [
+    "brownlow_votes",
+    "home_score",
+    "away_score",
+]
+COMPACT_INT_DTYPE = np.int16
+# Categories are sorted, so sorting & grouping by team give the same order
+# as with strings
+TEAM_DTYPE = pd.CategoricalDtype(TEAM_NAMES)
+
 SURNAME_REGEX = re.compile(r"[^\s]*\s+(.+)")
+# Aggregations that we calculate from contiguous segments of sorted rows.
+# Any others fall back to pandas' groupby aggregation.
+SEGMENT_AGGREGATIONS = ["sum", "mean", "max", "min", "skew", "std"]
+# pandas treats smaller moments as floating-point error when calculating skew
+SKEW_MOMENT_TOLERANCE = 1e-14
 
 
 def _translate_team_name(team_name: str) -> str:
@@ -93,15 +139,32 @@ def _translate_team_column(col_name: str) -> Callable[[pd.DataFrame], str]:
     return lambda data_frame: data_frame[col_name].map(_translate_team_name)
 
 
-def _player_id_col(data_frame: pd.DataFrame) -> pd.DataFrame:
-    # Need to add year to ID, because there are some
-    # player_id/match_id combos, decades apart, that by chance overlap
+def _set_player_index(data_frame: pd.DataFrame) -> pd.DataFrame:
+    # A multi-index stores each level's unique values once, with integer codes
+    # for each row, which takes much less memory than concatenated ID strings
+    return data_frame.set_index(PLAYER_INDEX_COLS, drop=False).rename_axis(
+        [None] * len(PLAYER_INDEX_COLS)
+    )
+
+
+def _is_compact_int(column: pd.Series) -> bool:
+    int_info = np.iinfo(COMPACT_INT_DTYPE)
+
     return (
-        data_frame["year"].astype(str)
-        + "."
-        + data_frame["match_id"].astype(str)
-        + "."
-        + data_frame["player_id"].astype(str)
+        pd.api.types.is_numeric_dtype(column)
+        and column.notna().all()
+        and (column % 1 == 0).all()
+        and column.between(int_info.min, int_info.max).all()
+    )
+
+
+def _compact_int_columns(data_frame: pd.DataFrame) -> pd.DataFrame:
+    return data_frame.astype(
+        {
+            col: COMPACT_INT_DTYPE
+            for col in COMPACT_INT_COLS
+            if col in data_frame.columns and _is_compact_int(data_frame[col])
+        }
     )
 
 
@@ -164,8 +227,8 @@ def clean_player_data(
         # on 29-4-1986 & 9-8-1986, but that's an acceptable loss of data
         # and easier than munging team names
         .dropna()
-        .assign(id=_player_id_col)
-        .set_index("id")
+        .pipe(_compact_int_columns)
+        .pipe(_set_player_index)
         .sort_index()
     )
 
@@ -174,10 +237,44 @@ def clean_player_data(
     return cleaned_player_data
 
 
+def build_roster_player_index(clean_player_data_frame: pd.DataFrame) -> pd.DataFrame:
+    """Create a lookup of past players by surname and team for matching roster data.
+
+    Params
+    ------
+    clean_player_data_frame: Clean player data, as returned by clean_player_data.
+
+    Returns
+    -------
+    Data frame of each distinct player name & ID, indexed by surname and team
+        ('playing_for').
+    """
+    return (
+        clean_player_data_frame[["player_name", "player_id", "playing_for"]]
+        # Each player plays many matches, but we only need to match
+        # each of them once
+        .drop_duplicates()
+        .assign(surname=lambda df: df["player_name"].str.extract(SURNAME_REGEX))
+        .set_index(["surname", "playing_for"])
+        .sort_index()
+    )
+
+
 def clean_roster_data(
-    roster_data: pd.DataFrame, clean_player_data_frame: pd.DataFrame
+    roster_data: pd.DataFrame, roster_player_index: pd.DataFrame
 ) -> pd.DataFrame:
-    """Clean data fetched from the AFL's list of team rosters."""
+    """Clean data fetched from the AFL's list of team rosters.
+
+    Params
+    ------
+    roster_data: Raw roster data.
+    roster_player_index: Lookup of past players, as returned by
+        build_roster_player_index.
+
+    Returns
+    -------
+    Clean roster data with player IDs from past player data.
+    """
     if not roster_data.any().any():
         return roster_data.assign(player_id=[])
 
@@ -206,10 +303,8 @@ def clean_roster_data(
         .drop("player_name", axis=1)
         .query("date > @start_of_week")
         .rename(columns={"season": "year"})
-        .merge(
-            clean_player_data_frame[["player_name", "player_id", "playing_for"]].assign(
-                surname=lambda df: df["player_name"].str.extract(SURNAME_REGEX)
-            ),
+        .join(
+            roster_player_index,
             # We join on surname + team name, because different data sources
             # use different versions of first names
             # (e.g. 'Mike' vs 'Michael', 'Nic' vs 'Nicholas').
@@ -222,6 +317,8 @@ def clean_roster_data(
             on=["surname", "playing_for"],
             how="left",
         )
+        # Roster rows can match multiple players, so we need a new, unique index
+        .reset_index(drop=True)
         .drop("surname", axis=1)
         .sort_values("player_id", ascending=False)
         # There are some duplicate player names over the years, so we drop the oldest,
@@ -239,7 +336,7 @@ def clean_roster_data(
 
     _validate_canoncial_team_names(roster_data_frame)
 
-    return roster_data_frame.assign(id=_player_id_col).set_index("id")
+    return _set_player_index(roster_data_frame)
 
 
 def _sort_columns(data_frame: pd.DataFrame) -> pd.DataFrame:
@@ -287,23 +384,77 @@ def convert_player_match_rows_to_player_teammatch_rows(
 
     _validate_required_columns(REQUIRED_COLS, data_frame.columns)
 
+    # Team names stay categorical until players are aggregated by team-match,
+    # and stats go back to integers after being combined with roster data,
+    # which has blank stats
+    compact_data_frame = data_frame.pipe(_compact_int_columns).astype(
+        {team_col: TEAM_DTYPE for team_col in ["playing_for", "home_team", "away_team"]}
+    )
+
     team_dfs = [
-        _team_data_frame(data_frame, "home"),
-        _team_data_frame(data_frame, "away"),
+        _team_data_frame(compact_data_frame, "home"),
+        _team_data_frame(compact_data_frame, "away"),
     ]
 
     return pd.concat(team_dfs, sort=True).drop(["match_id", "playing_for"], axis=1)
 
 
+def sum_season_brownlow_votes(data_frame: pd.DataFrame) -> pd.DataFrame:
+    """Sum each player's brownlow votes per season.
+
+    Params
+    ------
+    data_frame (pandas.DataFrame): Player data with brownlow votes per match.
+
+    Returns
+    -------
+    pandas.DataFrame with a 'brownlow_votes' column, indexed by player_id & year.
+    """
+    return (
+        data_frame[["player_id", "year", "brownlow_votes"]]
+        .groupby(["player_id", "year"], group_keys=True)
+        .sum()
+    )
+
+
 def add_last_year_brownlow_votes(data_frame: pd.DataFrame):
     """Add column for a player's total brownlow votes from the previous season."""
+    brownlow_data_frame, _ = add_last_year_brownlow_votes_with_state(data_frame)
+
+    return brownlow_data_frame
+
+
+def add_last_year_brownlow_votes_with_state(
+    data_frame: pd.DataFrame, past_season_votes: Optional[pd.DataFrame] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Add column for players' brownlow votes from the previous season.
+
+    Vote totals for the same season get added together, so data_frame can start
+    part way through a season.
+
+    Params
+    ------
+    data_frame (pandas.DataFrame): Player data with brownlow votes per match.
+    past_season_votes (pandas.DataFrame, optional): Season vote totals
+        for matches before those in data_frame, as returned by an earlier call.
+
+    Returns
+    -------
+    The same data frame as `add_last_year_brownlow_votes` returns, and vote totals
+        for each player's last two seasons.
+    """
     REQUIRED_COLS = {"player_id", "year", "brownlow_votes"}
     _validate_required_columns(REQUIRED_COLS, data_frame.columns)
 
+    season_votes = sum_season_brownlow_votes(data_frame)
+
+    if past_season_votes is not None:
+        season_votes = (
+            pd.concat([past_season_votes, season_votes]).groupby(level=[0, 1]).sum()
+        )
+
     brownlow_last_year = (
-        data_frame[["player_id", "year", "brownlow_votes"]]
-        .groupby(["player_id", "year"], group_keys=True)
-        .sum()
+        season_votes
         # Grouping by player to shift by year
         .groupby(level=0)
         .shift()
@@ -314,77 +465,98 @@ def add_last_year_brownlow_votes(data_frame: pd.DataFrame):
     return (
         data_frame.drop("brownlow_votes", axis=1)
         .merge(brownlow_last_year, on=["player_id", "year"], how="left")
-        .set_index(data_frame.index)
+        .set_index(data_frame.index),
+        # Later matches only need the totals for a player's latest season
+        # and the one before it
+        season_votes.groupby(level=0).tail(2),
     )
 
 
 def add_rolling_player_stats(data_frame: pd.DataFrame):
     """Replace players' invidual match stats with rolling averages of those stats."""
-    STATS_COLS = [
-        "kicks",
-        "marks",
-        "handballs",
-        "goals",
-        "behinds",
-        "hit_outs",
-        "tackles",
-        "rebounds",
-        "inside_50s",
-        "clearances",
-        "clangers",
-        "frees_for",
-        "frees_against",
-        "contested_possessions",
-        "uncontested_possessions",
-        "contested_marks",
-        "marks_inside_50",
-        "one_percenters",
-        "bounces",
-        "goal_assists",
-        "time_on_ground",
-    ]
+    rolling_stats_data_frame, _ = add_rolling_player_stats_with_state(data_frame)
+
+    return rolling_stats_data_frame
+
+
+def add_rolling_player_stats_with_state(
+    data_frame: pd.DataFrame, past_stats: Optional[pd.DataFrame] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Replace players' match stats with rolling averages, continuing from past ones.
+
+    Params
+    ------
+    data_frame (pandas.DataFrame): Player data with raw stats per match.
+    past_stats (pandas.DataFrame, optional): Players' last stats and running
+        sums for matches before those in data_frame, as returned by an earlier call.
 
-    REQUIRED_COLS = STATS_COLS + ["player_id"]
+    Returns
+    -------
+    The same data frame as `add_rolling_player_stats` returns, and the state
+        for calculating rolling stats for later matches.
+    """
+    REQUIRED_COLS = RAW_PLAYER_STATS_COLS + ["player_id"]
     _validate_required_columns(REQUIRED_COLS, data_frame.columns)
 
     player_data_frame = data_frame.sort_values(["player_id", "year", "round_number"])
-    player_groups = (
-        player_data_frame[STATS_COLS + ["player_id"]]
-        .groupby("player_id", group_keys=False)
-        .shift()
-        .assign(player_id=player_data_frame["player_id"])
-        .fillna(0)
-        .groupby("player_id", group_keys=True)
-    )
-
-    player_stats = (
-        rolling_rate_filled_by_expanding_rate(player_groups, AVG_SEASON_LENGTH)
-        .droplevel(level=0)
-        .sort_index()
+    player_stats, next_stats = rolling_prev_match_means_with_state(
+        player_data_frame[RAW_PLAYER_STATS_COLS],
+        pd.Index(player_data_frame["player_id"]),
+        AVG_SEASON_LENGTH,
+        state=past_stats,
     )
 
     rolling_stats_cols = {
-        stats_col: f"rolling_prev_match_{stats_col}" for stats_col in STATS_COLS
+        stats_col: f"rolling_prev_match_{stats_col}"
+        for stats_col in RAW_PLAYER_STATS_COLS
     }
 
     return (
         player_data_frame.assign(**player_stats.to_dict("series")).rename(
             columns=rolling_stats_cols
-        )
-        # Data types get inferred when assigning dictionary columns, which converts
-        # 'player_id' to float
-        .astype({"player_id": str})
+        ),
+        next_stats,
     )
 
 
 def add_cum_matches_played(data_frame: pd.DataFrame):
     """Add cumulative number of matches each player has played."""
+    cum_matches_data_frame, _ = add_cum_matches_played_with_state(data_frame)
+
+    return cum_matches_data_frame
+
+
+def add_cum_matches_played_with_state(
+    data_frame: pd.DataFrame, past_matches_played: Optional[pd.Series] = None
+) -> Tuple[pd.DataFrame, pd.Series]:
+    """Add cumulative number of matches each player has played, including past ones.
+
+    Params
+    ------
+    data_frame (pandas.DataFrame): Player data sorted by player & date.
+    past_matches_played (pandas.Series, optional): Number of matches per player_id
+        before those in data_frame, as returned by an earlier call.
+
+    Returns
+    -------
+    The same data frame as `add_cum_matches_played` returns, and the number
+        of matches per player_id, including those in data_frame.
+    """
     REQUIRED_COLS = {"player_id"}
     _validate_required_columns(REQUIRED_COLS, data_frame.columns)
 
-    return data_frame.assign(
-        cum_matches_played=data_frame.groupby("player_id").cumcount()
-    )
+    cum_matches_played = data_frame.groupby("player_id").cumcount()
+    matches_played = data_frame.groupby("player_id").size()
+
+    if past_matches_played is not None:
+        cum_matches_played += (
+            data_frame["player_id"].map(past_matches_played).fillna(0).astype(int)
+        )
+        matches_played = (
+            pd.concat([past_matches_played, matches_played]).groupby(level=0).sum()
+        )
+
+    return data_frame.assign(cum_matches_played=cum_matches_played), matches_played
 
 
 def _aggregations(
@@ -403,6 +575,120 @@ def _agg_column_name(match_stats_cols: List[str], column_pair: Tuple[str, str])
     return column_label if column_label in match_stats_cols else "_".join(column_pair)
 
 
+def _segment_statistics(
+    values: np.ndarray, segment_starts: np.ndarray, aggregations: List[str]
+) -> Dict[str, np.ndarray]:
+    """Calculate statistics for contiguous segments of rows in one pass per moment.
+
+    Results follow pandas' conventions: missing values are skipped, 'std' uses
+    one degree of freedom, and 'skew' is the adjusted Fisher-Pearson coefficient
+    (zero for constant values, blank for fewer than three values).
+
+    Params
+    ------
+    values: 2D array of values, with each group's rows contiguous.
+    segment_starts: Row number of the first row of each group.
+    aggregations: Names of statistics to calculate (from SEGMENT_AGGREGATIONS).
+
+    Returns
+    -------
+    Dictionary of aggregation names mapped to arrays with one row per group.
+    """
+    is_present = ~np.isnan(values)
+    counts = np.add.reduceat(is_present, segment_starts, axis=0)
+    sums = np.add.reduceat(np.where(is_present, values, 0), segment_starts, axis=0)
+
+    statistics = {"sum": sums}
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        statistics["mean"] = np.where(counts > 0, sums / counts, np.nan)
+
+        if "max" in aggregations:
+            statistics["max"] = np.fmax.reduceat(values, segment_starts, axis=0)
+
+        if "min" in aggregations:
+            statistics["min"] = np.fmin.reduceat(values, segment_starts, axis=0)
+
+        if "std" in aggregations or "skew" in aggregations:
+            # Central moments are calculated from deviations from the mean
+            # rather than raw power sums, which lose precision to cancellation
+            segment_sizes = np.diff(np.append(segment_starts, len(values)))
+            group_means = np.repeat(statistics["mean"], segment_sizes, axis=0)
+            deviations = np.where(is_present, values - group_means, 0)
+            m2 = np.add.reduceat(deviations ** 2, segment_starts, axis=0)
+            m3 = np.add.reduceat(deviations ** 3, segment_starts, axis=0)
+
+            statistics["std"] = np.where(counts > 1, np.sqrt(m2 / (counts - 1)), np.nan)
+
+            m2 = np.where(np.abs(m2) < SKEW_MOMENT_TOLERANCE, 0, m2)
+            m3 = np.where(np.abs(m3) < SKEW_MOMENT_TOLERANCE, 0, m3)
+            skew = (counts * (counts - 1) ** 0.5 / (counts - 2)) * (m3 / m2 ** 1.5)
+            statistics["skew"] = np.where(
+                counts < 3, np.nan, np.where(m2 == 0, 0, skew)
+            )
+
+    return {aggregation: statistics[aggregation] for aggregation in aggregations}
+
+
+def _aggregate_by_segments(
+    groups: pd.DataFrame, match_stats_cols: List[str], aggregations: List[str]
+) -> pd.DataFrame:
+    group_ids = np.nan_to_num(groups.ngroup().to_numpy(dtype=float), nan=-1).astype(int)
+    # Sorting rows by group once makes every group a contiguous segment
+    # for all columns & aggregations. As with groupby, rows with blank group values
+    # don't belong to any group.
+    sorted_rows = np.argsort(group_ids, kind="stable")
+    sorted_rows = sorted_rows[group_ids[sorted_rows] >= 0]
+    segment_starts = np.flatnonzero(np.diff(group_ids[sorted_rows], prepend=-1))
+
+    data_frame = groups.obj
+    player_stats = _segment_statistics(
+        data_frame[PLAYER_STATS_COLS].to_numpy(dtype=float)[sorted_rows],
+        segment_starts,
+        aggregations,
+    )
+    match_stats = _segment_statistics(
+        data_frame[match_stats_cols].to_numpy(dtype=float)[sorted_rows],
+        segment_starts,
+        ["mean"],
+    )
+
+    agg_columns = {}
+
+    for col_idx, stats_col in enumerate(PLAYER_STATS_COLS):
+        for aggregation in aggregations:
+            agg_values = player_stats[aggregation][:, col_idx]
+
+            # As with pandas, aggregations that select or add up integers
+            # return integers
+            if aggregation in ["sum", "max", "min"] and pd.api.types.is_integer_dtype(
+                data_frame[stats_col]
+            ):
+                agg_values = agg_values.astype(data_frame[stats_col].dtype)
+
+            agg_columns[f"{stats_col}_{aggregation}"] = agg_values
+
+    for col_idx, match_stats_col in enumerate(match_stats_cols):
+        agg_columns[match_stats_col] = match_stats["mean"][:, col_idx]
+
+    return pd.DataFrame(agg_columns, index=groups.size().index)
+
+
+def _aggregate_with_pandas(
+    groups: pd.DataFrame, match_stats_cols: List[str], aggregations: List[str]
+) -> pd.DataFrame:
+    agg_data_frame = groups.aggregate(
+        _aggregations(match_stats_cols, aggregations=aggregations)
+    )
+
+    agg_data_frame.columns = [
+        _agg_column_name(match_stats_cols, column_pair)
+        for column_pair in agg_data_frame.columns.values
+    ]
+
+    return agg_data_frame
+
+
 def _aggregate_player_stats_by_team_match_node(
     player_data_frame: pd.DataFrame, aggregations: List[str] = []
 ) -> pd.DataFrame:
@@ -422,19 +708,21 @@ def _aggregate_player_stats_by_team_match_node(
         if col not in PLAYER_STATS_COLS + INDEX_COLS
     ]
 
-    agg_data_frame = (
+    # Adding some non-index columns in the groupby, because it doesn't change
+    # the grouping and makes it easier to keep for the final data frame.
+    # Only observed teams are grouped, because categorical team columns would
+    # otherwise produce every combination of teams.
+    groups = (
         player_data_frame.drop(["player_id", "player_name"], axis=1)
         .sort_values(INDEX_COLS)
-        # Adding some non-index columns in the groupby, because it doesn't change
-        # the grouping and makes it easier to keep for the final data frame.
-        .groupby(INDEX_COLS + ["oppo_team", "date"])
-        .aggregate(_aggregations(match_stats_cols, aggregations=aggregations))
+        .groupby(INDEX_COLS + ["oppo_team", "date"], observed=True)
     )
-
-    agg_data_frame.columns = [
-        _agg_column_name(match_stats_cols, column_pair)
-        for column_pair in agg_data_frame.columns.values
-    ]
+    aggregate = (
+        _aggregate_by_segments
+        if set(aggregations) <= set(SEGMENT_AGGREGATIONS)
+        else _aggregate_with_pandas
+    )
+    agg_data_frame = aggregate(groups, match_stats_cols, aggregations)
 
     # Various finals matches have been draws and replayed,
     # and sometimes home/away is switched requiring us to drop duplicates
@@ -448,6 +736,9 @@ def _aggregate_player_stats_by_team_match_node(
         .sort_values("date")
         .drop_duplicates(subset=INDEX_COLS, keep="last")
         .astype({match_col: int for match_col in match_stats_cols})
+        # Converting categorical team names back to strings for joining
+        # with other data sources
+        .astype({"team": str, "oppo_team": str})
         .set_index(INDEX_COLS, drop=False)
         .rename_axis([None] * len(INDEX_COLS))
         .sort_index()
@@ -0,0 +1,339 @@
+"""Season-partitioned execution of the player pipeline.
+
+Processing every season of player data at once takes several times the memory
+of the raw data, so instead we clean, stack, and aggregate a batch of seasons
+at a time. The only nodes that depend on earlier seasons are those for
+last year's brownlow votes, rolling stats, and cumulative matches played,
+so we carry over just the state they need from one batch to the next
+(i.e. players' vote totals for their last seasons, running sums of their stats,
+and their match counts). Every other node runs unchanged
+from the player pipeline, which guarantees identical results.
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import os
+
+import pandas as pd
+from kedro.framework.context import KedroContext
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline
+from mypy_extensions import TypedDict
+
+from augury.runner import run_in_memory
+from augury.nodes import player
+from augury.pipelines import create_pipelines
+
+
+# Maximum memory for each batch of raw player data. Intermediate data sets
+# take a few times more than this, but don't grow with the number of seasons.
+PLAYER_PARTITION_MAX_MB = float(os.getenv("PLAYER_PARTITION_MAX_MB", "256"))
+BYTES_PER_MEGABYTE = 1024 ** 2
+# Raw player data saved in a file per season
+PARTITIONS_DATA_SET = "player_data_partitions"
+# Data sets that are shared by all partitions, so we only load them once
+SHARED_DATA_SETS = [
+    "clean_past_match_data",
+    "remote_player_data_frame",
+    "roster_data_frame",
+]
+ROSTER_NAME_COLS = ["player_name", "player_id", "playing_for"]
+# First data set after all features that depend on earlier seasons
+STATE_INPUT = "player_data_c"
+PLAYER_OUTPUT = "final_player_data"
+
+PlayerPartitionState = TypedDict(
+    "PlayerPartitionState",
+    {
+        "player_names": Optional[pd.DataFrame],
+        "season_brownlow_votes": Optional[pd.DataFrame],
+        "rolling_player_stats": Optional[pd.DataFrame],
+        "matches_played": Optional[pd.Series],
+    },
+)
+PlayerPartitions = Dict[str, Callable[[], pd.DataFrame]]
+
+
+def _initial_state() -> PlayerPartitionState:
+    return {
+        "player_names": None,
+        "season_brownlow_votes": None,
+        "rolling_player_stats": None,
+        "matches_played": None,
+    }
+
+
+def _append_rows(
+    past_data: Optional[Union[pd.DataFrame, pd.Series]],
+    data: Union[pd.DataFrame, pd.Series],
+) -> Union[pd.DataFrame, pd.Series]:
+    return data if past_data is None else pd.concat([past_data, data], sort=False)
+
+
+def _run_segment(pipeline: Pipeline, input_data: Dict[str, Any], output_name: str):
+    catalog = run_in_memory(
+        pipeline,
+        DataCatalog(
+            {
+                data_set_name: MemoryDataSet(data=data)
+                for data_set_name, data in input_data.items()
+            }
+        ),
+    )
+
+    return catalog.load(output_name)
+
+
+def split_by_season(player_data: pd.DataFrame) -> PlayerPartitions:
+    """Split raw player data into per-season partitions.
+
+    Params
+    ------
+    player_data: Raw player data for any number of seasons.
+
+    Returns
+    -------
+    Functions that return each season's data, keyed by season, in the same form
+        as those loaded from a PartitionedDataSet.
+    """
+    return {
+        str(season): (lambda season_data=season_data: season_data)
+        for season, season_data in player_data.groupby("season")
+    }
+
+
+def _season_batches(
+    partitions: PlayerPartitions, max_partition_mb: float
+) -> Iterator[Tuple[pd.DataFrame, bool]]:
+    batch: List[pd.DataFrame] = []
+    batch_mb = 0.0
+
+    for partition_id in sorted(partitions.keys()):
+        season_data = partitions[partition_id]()
+        season_mb = (
+            season_data.memory_usage(index=True, deep=True).sum() / BYTES_PER_MEGABYTE
+        )
+
+        if batch and batch_mb + season_mb > max_partition_mb:
+            yield pd.concat(batch, sort=False), False
+            batch, batch_mb = [], 0.0
+
+        batch.append(season_data)
+        batch_mb += season_mb
+
+    if batch:
+        yield pd.concat(batch, sort=False), True
+
+
+def append_player_partition(
+    pipeline: Pipeline,
+    state: PlayerPartitionState,
+    player_data: pd.DataFrame,
+    shared_data: Dict[str, pd.DataFrame],
+    is_last: bool,
+) -> Tuple[Optional[pd.DataFrame], PlayerPartitionState]:
+    """Calculate player features for a batch of seasons, using state from earlier ones.
+
+    Params
+    ------
+    pipeline: The player pipeline.
+    state: State carried over from earlier batches of seasons, as returned
+        by an earlier call.
+    player_data: Raw player data for the batch of seasons.
+    shared_data: Data sets used by all batches, keyed by data set name.
+    is_last: Whether this is the most-recent batch of seasons. Remote player data
+        and roster data only get combined with the last batch, because they're
+        for matches after all those in the raw player data.
+
+    Returns
+    -------
+    Final player data for the batch (None if no matches are within the pipeline's
+        date range) and the state for the next batch.
+    """
+    blank_data_frame = pd.DataFrame()
+
+    clean_player_data = _run_segment(
+        pipeline.only_nodes_with_outputs(
+            "combined_past_player_data", "clean_player_data"
+        ),
+        {
+            "player_data": player_data,
+            "remote_player_data_frame": (
+                shared_data["remote_player_data_frame"] if is_last else blank_data_frame
+            ),
+            "clean_past_match_data": shared_data["clean_past_match_data"],
+        },
+        "clean_player_data",
+    )
+
+    # Roster players get matched against everyone who has played before,
+    # so we keep each distinct player name until the last batch
+    player_names = _append_rows(
+        state["player_names"], clean_player_data[ROSTER_NAME_COLS]
+    ).drop_duplicates()
+    clean_roster_data = (
+        _run_segment(
+            pipeline.only_nodes_with_outputs(
+                "roster_player_index", "clean_roster_data"
+            ),
+            {
+                "clean_player_data": player_names,
+                "roster_data_frame": shared_data["roster_data_frame"],
+            },
+            "clean_roster_data",
+        )
+        if is_last
+        else blank_data_frame
+    )
+
+    filtered_player_data = _run_segment(
+        pipeline.only_nodes_with_outputs(
+            "combined_player_data", "filtered_player_data"
+        ),
+        {
+            "clean_player_data": clean_player_data,
+            "clean_roster_data": clean_roster_data,
+        },
+        "filtered_player_data",
+    )
+
+    if filtered_player_data.empty:
+        return None, {**state, "player_names": player_names}  # type: ignore
+
+    stacked_player_data = _run_segment(
+        pipeline.only_nodes_with_outputs("stacked_player_data"),
+        {"filtered_player_data": filtered_player_data},
+        "stacked_player_data",
+    )
+
+    player_data_a, brownlow_votes = player.add_last_year_brownlow_votes_with_state(
+        stacked_player_data, state["season_brownlow_votes"]
+    )
+    player_data_b, rolling_player_stats = player.add_rolling_player_stats_with_state(
+        player_data_a, state["rolling_player_stats"]
+    )
+    player_data_c, matches_played = player.add_cum_matches_played_with_state(
+        player_data_b, state["matches_played"]
+    )
+
+    final_data = _run_segment(
+        pipeline.from_inputs(STATE_INPUT),
+        {STATE_INPUT: player_data_c},
+        PLAYER_OUTPUT,
+    )
+
+    next_state: PlayerPartitionState = {
+        "player_names": player_names,
+        "season_brownlow_votes": brownlow_votes,
+        "rolling_player_stats": rolling_player_stats,
+        "matches_played": matches_played,
+    }
+
+    return final_data, next_state
+
+
+def process_player_partitions(
+    pipeline: Pipeline,
+    partitions: PlayerPartitions,
+    shared_data: Dict[str, pd.DataFrame],
+    max_partition_mb: float = PLAYER_PARTITION_MAX_MB,
+) -> pd.DataFrame:
+    """Run the player pipeline on batches of seasons, in order.
+
+    Params
+    ------
+    pipeline: The player pipeline.
+    partitions: Functions that load raw player data per season, keyed by season.
+    shared_data: Data sets used by all batches, keyed by data set name.
+    max_partition_mb: Maximum memory for each batch of raw player data.
+        Seasons are batched together until they reach this limit, but each batch
+        has at least one season.
+
+    Returns
+    -------
+    Final player data, identical to that of the full player pipeline.
+    """
+    state = _initial_state()
+    final_data = []
+
+    for player_data, is_last in _season_batches(partitions, max_partition_mb):
+        partition_final_data, state = append_player_partition(
+            pipeline, state, player_data, shared_data, is_last
+        )
+
+        if partition_final_data is not None:
+            final_data.append(partition_final_data)
+
+    # Final data is indexed by team-match, so batches of seasons never overlap
+    return pd.concat(final_data, sort=False).sort_index()
+
+
+def without_player_pipeline(pipeline: Pipeline) -> Pipeline:
+    """Remove the nodes that are only needed for final player data from a pipeline.
+
+    Params
+    ------
+    pipeline: Pipeline that includes the player pipeline (e.g. the full pipeline).
+
+    Returns
+    -------
+    The rest of the pipeline, which takes final player data as an input.
+    """
+    player_pipeline = pipeline.to_outputs(PLAYER_OUTPUT)
+    other_pipeline = pipeline - player_pipeline
+    # Other branches also use some of the player pipeline's data sets
+    # (e.g. clean match data), so we keep the nodes for those
+    shared_data_sets = other_pipeline.inputs() & (
+        player_pipeline.all_outputs() - {PLAYER_OUTPUT}
+    )
+
+    return (
+        other_pipeline + pipeline.to_outputs(*shared_data_sets)
+        if shared_data_sets
+        else other_pipeline
+    )
+
+
+def run_partitioned_player_pipeline(
+    context: KedroContext, max_partition_mb: float = PLAYER_PARTITION_MAX_MB
+) -> pd.DataFrame:
+    """Create final player data by running the player pipeline on batches of seasons.
+
+    Params
+    ------
+    context: Kedro context with catalog entries for the player pipeline's data sets.
+        Raw player data gets loaded one season at a time from 'player_data_partitions'
+        if it has any saved partitions, otherwise it gets split from 'player_data'.
+    max_partition_mb: Maximum memory for each batch of raw player data.
+
+    Returns
+    -------
+    Final player data, which also gets saved to the catalog if it has
+        a 'final_player_data' data set.
+    """
+    catalog = context.catalog
+    # Ignoring, because ProjectContext has project-specific attributes,
+    # and importing it to use as a type tends to create circular dependencies
+    pipeline = create_pipelines(context.start_date, context.end_date)[  # type: ignore
+        "player"
+    ]
+
+    shared_catalog = run_in_memory(pipeline.to_outputs(*SHARED_DATA_SETS), catalog)
+    shared_data = {
+        data_set_name: shared_catalog.load(data_set_name)
+        for data_set_name in SHARED_DATA_SETS
+    }
+
+    partitions = (
+        catalog.load(PARTITIONS_DATA_SET)
+        if catalog.exists(PARTITIONS_DATA_SET)
+        else split_by_season(catalog.load("player_data"))
+    )
+
+    final_data = process_player_partitions(
+        pipeline, partitions, shared_data, max_partition_mb=max_partition_mb
+    )
+
+    if PLAYER_OUTPUT in catalog.list():
+        catalog.save(PLAYER_OUTPUT, final_data)
+
+    return final_data
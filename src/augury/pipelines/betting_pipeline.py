@@ -30,6 +30,9 @@ def create_betting_pipeline(start_date: str, end_date: str, **_kwargs):
                 "filtered_betting_data",
                 "stacked_betting_data",
             ),
+            node(
+                common.build_oppo_index, "stacked_betting_data", "betting_oppo_index"
+            ),
             node(
                 betting.add_betting_pred_win, ["stacked_betting_data"], "betting_data_a"
             ),
@@ -52,7 +55,7 @@ def create_betting_pipeline(start_date: str, end_date: str, **_kwargs):
                         "rolling_betting_pred_win_rate",
                     ]
                 ),
-                "betting_data_b",
+                ["betting_data_b", "betting_oppo_index"],
                 "betting_data_c",
             ),
             node(common.finalize_data, "betting_data_c", "final_betting_data",),
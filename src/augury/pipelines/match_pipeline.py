@@ -96,6 +96,7 @@ def create_match_pipeline(
                 "filtered_past_match_data",
                 "match_data_a",
             ),
+            node(common.build_oppo_index, "match_data_a", "match_oppo_index"),
             node(match.add_out_of_state, "match_data_a", "match_data_b"),
             node(match.add_travel_distance, "match_data_b", "match_data_c"),
             node(match.add_result, "match_data_c", "match_data_d"),
@@ -143,7 +144,7 @@ def create_match_pipeline(
             ),
             node(
                 common.add_oppo_features(match_cols=MATCH_OPPO_COLS),
-                "match_data_i",
+                ["match_data_i", "match_oppo_index"],
                 "match_data_j",
             ),
             # Features dependent on oppo columns
@@ -153,7 +154,7 @@ def create_match_pipeline(
                 common.add_oppo_features(
                     oppo_feature_cols=["cum_percent", "ladder_position"]
                 ),
-                "match_data_l",
+                ["match_data_l", "match_oppo_index"],
                 "match_data_m",
             ),
             node(common.finalize_data, "match_data_m", "final_match_data"),
@@ -201,6 +202,7 @@ def create_legacy_match_pipeline(
                 "match_data_a",
                 "match_data_b",
             ),
+            node(common.build_oppo_index, "match_data_b", "match_oppo_index"),
             node(match.add_out_of_state, "match_data_b", "match_data_c"),
             node(match.add_travel_distance, "match_data_c", "match_data_d"),
             node(match.add_result, "match_data_d", "match_data_e"),
@@ -248,7 +250,7 @@ def create_legacy_match_pipeline(
                 common.add_oppo_features(
                     match_cols=MATCH_OPPO_COLS + ["elo_rating", "oppo_elo_rating"]
                 ),
-                "match_data_j",
+                ["match_data_j", "match_oppo_index"],
                 "match_data_k",
             ),
             # Features dependent on oppo columns
@@ -275,7 +277,7 @@ def create_legacy_match_pipeline(
                 common.add_oppo_features(
                     oppo_feature_cols=["cum_percent", "ladder_position"]
                 ),
-                "match_data_o",
+                ["match_data_o", "match_oppo_index"],
                 "match_data_p",
             ),
             node(common.finalize_data, "match_data_p", "final_legacy_match_data"),
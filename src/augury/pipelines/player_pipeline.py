@@ -36,6 +36,11 @@ def create_past_player_pipeline():
                 ["combined_past_player_data", "clean_past_match_data"],
                 "clean_player_data",
             ),
+            node(
+                player.build_roster_player_index,
+                "clean_player_data",
+                "roster_player_index",
+            ),
         ]
     )
 
@@ -47,7 +52,7 @@ def create_roster_pipeline():
             node(common.convert_to_data_frame, "roster_data", "roster_data_frame"),
             node(
                 player.clean_roster_data,
-                ["roster_data_frame", "clean_player_data"],
+                ["roster_data_frame", "roster_player_index"],
                 "clean_roster_data",
             ),
         ]
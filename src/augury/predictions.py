@@ -1,14 +1,26 @@
 """Generates predictions with the given models for the given inputs."""
 
-from typing import List, Optional, Dict
-import itertools
+from typing import Any, Callable, Iterator, List, Optional, Dict, Set, Tuple, Type
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+import copy
+import os
+import time
 
 import pandas as pd
 import numpy as np
 from kedro.framework.context import KedroContext
+from mlxtend.regressor import StackingRegressor
+from mypy_extensions import TypedDict
+from sklearn.base import BaseEstimator
+from xgboost import XGBModel
 
+from augury.data_cache import MLDataCache
 from augury.ml_data import MLData
 from augury.ml_estimators.base_ml_estimator import BaseMLEstimator
+from augury.model_registry import MODEL_REGISTRY
+from augury.sklearn.models import EloRegressor, TimeSeriesRegressor
 from augury.types import YearRange, MLModelDict
 from augury.settings import SEED, PREDICTION_TYPES
 
@@ -23,6 +35,132 @@ PREDICTION_COLS = [
     "at_home",
     "ml_model",
 ] + [f"predicted_{pred_type}" for pred_type in PREDICTION_TYPES]
+# 'serial' makes predictions with one model at a time, 'thread' uses a thread pool,
+# and 'process' uses a pool of forked processes
+EXECUTOR_TYPES = ("serial", "thread", "process")
+DEFAULT_EXECUTOR_TYPE = os.getenv("PREDICTION_EXECUTOR", "thread")
+# Estimators that continue from their fitted state when refit with warm_start=True,
+# and end up the same as when they're fit from scratch
+EXACT_WARM_START_ESTIMATORS = (EloRegressor,)
+# Estimators whose warm starts only approximate fitting them from scratch
+APPROXIMATE_WARM_START_ESTIMATORS = (TimeSeriesRegressor,)
+
+# Positions of models in the list of models, and the years to predict with them
+PredictionTask = Tuple[List[int], List[int]]
+FoldTime = TypedDict(
+    "FoldTime", {"ml_model": str, "year": int, "warm_start": bool, "seconds": float}
+)
+FoldPredictions = TypedDict(
+    "FoldPredictions",
+    {
+        "model_position": int,
+        "year": int,
+        "predictions": pd.DataFrame,
+        # Only training folds get timed
+        "fold_time": Optional[FoldTime],
+    },
+)
+
+# Worker processes get the predictor from their parent when they're forked,
+# so we don't have to pickle it (and its Kedro context) for each task
+_WORKER_PREDICTOR: Optional["Predictor"] = None
+
+
+def _set_worker_predictor(predictor: "Predictor") -> None:
+    global _WORKER_PREDICTOR  # pylint: disable=global-statement
+    _WORKER_PREDICTOR = predictor
+
+
+def _run_worker_task(task: PredictionTask) -> List["FoldPredictions"]:
+    assert _WORKER_PREDICTOR is not None
+    # pylint: disable=protected-access
+    return _WORKER_PREDICTOR._run_task(task)
+
+
+def _sub_estimators(
+    estimator: Any, estimator_types: Tuple[Type, ...], visited_ids: Set[int]
+) -> Iterator[Any]:
+    if id(estimator) in visited_ids:
+        return
+
+    visited_ids.add(id(estimator))
+
+    if isinstance(estimator, estimator_types):
+        yield estimator
+        return
+
+    # Fitted meta-estimators (e.g. bagging) keep their sub-estimators in lists
+    # or dicts of fitted clones, rather than in their params
+    if isinstance(estimator, (list, tuple)):
+        children = estimator
+    elif isinstance(estimator, dict):
+        children = estimator.values()
+    elif isinstance(estimator, BaseEstimator):
+        children = vars(estimator).values()
+    else:
+        return
+
+    for child in children:
+        yield from _sub_estimators(child, estimator_types, visited_ids)
+
+
+def _has_pinned_xgboost_threads(ml_model: BaseEstimator, n_threads: int) -> bool:
+    return all(
+        xgboost_model.get_params()["n_jobs"] == n_threads
+        for xgboost_model in _sub_estimators(ml_model, (XGBModel,), set())
+    )
+
+
+def _pin_xgboost_threads(ml_model: BaseEstimator, n_threads: int) -> None:
+    # This changes the model in place, so it's only for models that belong
+    # to the calling task
+    for xgboost_model in _sub_estimators(ml_model, (XGBModel,), set()):
+        xgboost_model.set_params(n_jobs=n_threads)
+
+
+def _with_pinned_xgboost_threads(
+    ml_model: BaseMLEstimator, n_threads: int
+) -> BaseMLEstimator:
+    # Loaded models are shared by every task and request in the process,
+    # so we only change the number of threads on a copy
+    if _has_pinned_xgboost_threads(ml_model, n_threads):
+        return ml_model
+
+    pinned_model = copy.deepcopy(ml_model)
+    _pin_xgboost_threads(pinned_model, n_threads)
+
+    return pinned_model
+
+
+def _supports_warm_start(
+    ml_model: BaseMLEstimator, approximate_warm_start: bool
+) -> bool:
+    if approximate_warm_start and ml_model.supports_partial_fit:
+        return True
+
+    return any(
+        _sub_estimators(ml_model, _warm_start_estimators(approximate_warm_start), set())
+    )
+
+
+def _warm_start_estimators(approximate_warm_start: bool) -> Tuple[Type, ...]:
+    return EXACT_WARM_START_ESTIMATORS + (
+        APPROXIMATE_WARM_START_ESTIMATORS if approximate_warm_start else ()
+    )
+
+
+def _prepare_warm_start(ml_model: BaseMLEstimator) -> None:
+    # Stacking regressors fit clones of their regressors by default,
+    # which would throw away any state from fitting them for previous years
+    for stacking_regressor in _sub_estimators(ml_model, (StackingRegressor,), set()):
+        stacking_regressor.set_params(refit=False)
+
+
+def _enable_warm_start(ml_model: BaseMLEstimator, approximate_warm_start: bool) -> None:
+    for estimator in _sub_estimators(
+        ml_model, _warm_start_estimators(approximate_warm_start), set()
+    ):
+        estimator.set_params(warm_start=True)
 
 
 class Predictor:
@@ -35,6 +173,9 @@ class Predictor:
         round_number: Optional[int] = None,
         train=False,
         verbose: int = 1,
+        executor_type: str = DEFAULT_EXECUTOR_TYPE,
+        max_workers: Optional[int] = None,
+        approximate_warm_start=False,
         **data_kwargs,
     ):
         """Instantiate Predictor object.
@@ -47,8 +188,24 @@ class Predictor:
         round_number: Round number for which to make predictions. If omitted,
             predictions are made for entire seasons.
         train: Whether to train each model on data from previous years
-            before making predictions on a given year's matches.
+            before making predictions on a given year's matches. Each year is a fold
+            of a walk-forward backtest. Models whose warm starts give the same
+            results as a full refit (i.e. Elo models) are warm-started
+            from the previous year's fold rather than refit from scratch.
         verbose: (1 or 0) Whether to print information while making predictions.
+        executor_type: How to run predictions for different models concurrently.
+            One of 'serial', 'thread', or 'process' (defaults to the
+            PREDICTION_EXECUTOR env var, or 'thread'). Processes are forked,
+            so they share the data and models loaded by the parent process.
+        max_workers: Maximum number of models (or training folds) to make
+            predictions with at once. Defaults to the number of CPUs.
+            Each XGBoost model gets an equal share of the CPUs, so workers
+            don't compete for them.
+        approximate_warm_start: Whether to also warm-start training folds for models
+            whose results differ from a full refit: pipelines that end in XGBoost
+            add boosting rounds for each new year's data, and time-series models
+            start fitting from their previous params. This is faster,
+            but it changes backtest results, so it's off by default.
         data_kwargs: Keyword arguments to pass to MLData on instantiation.
         """
         self.context = context
@@ -56,6 +213,22 @@ class Predictor:
         self.round_number = round_number
         self.train = train
         self.verbose = verbose
+
+        assert executor_type in EXECUTOR_TYPES, (
+            f"executor_type must be one of {EXECUTOR_TYPES}, "
+            f"but received '{executor_type}'."
+        )
+        self.executor_type = executor_type
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.approximate_warm_start = approximate_warm_start
+        # Wall-clock time of each training fold from the last call
+        # to make_predictions with train=True
+        self.fold_times: List[FoldTime] = []
+        self._n_threads_per_model = 1
+        self._ml_models: List[MLModelDict] = []
+        self._training_models: Dict[int, BaseMLEstimator] = {}
+        # Loaded data for each data set and label column used by the current models
+        self._loaded_data: Dict[Tuple[str, str], MLData] = {}
         self._data = MLData(
             context=context,
             train_year_range=(min(year_range),),
@@ -67,33 +240,259 @@ class Predictor:
         """Predict margins or confidence percentages for matches."""
         assert any(ml_models), "No ML model info was given."
 
-        predictions = [
-            self._make_predictions_by_year(ml_models, year)
+        self._ml_models = ml_models
+        # Loading all the data up front means that concurrent tasks and folds
+        # share it rather than each getting their own copy
+        self._load_model_data(ml_models)
+
+        tasks = self._training_tasks() if self.train else self._prediction_tasks()
+        n_workers = (
+            1 if self.executor_type == "serial" else min(self.max_workers, len(tasks))
+        )
+        self._n_threads_per_model = max((os.cpu_count() or 1) // n_workers, 1)
+
+        predictions_by_fold: Dict[Tuple[int, int], FoldPredictions] = {}
+        for task_predictions in self._map_tasks(tasks, n_workers):
+            for fold in task_predictions:
+                predictions_by_fold[(fold["model_position"], fold["year"])] = fold
+
+        self._training_models = {}
+        self._loaded_data = {}
+        self._data.request_cache = None
+
+        # Predictions are ordered by year, then by model, regardless of which
+        # model finished first
+        fold_keys = [
+            (model_position, year)
             for year in range(*self.year_range)
+            for model_position in range(len(ml_models))
+        ]
+        predictions = [
+            predictions_by_fold[fold_key]["predictions"] for fold_key in fold_keys
+        ]
+        self.fold_times = [
+            predictions_by_fold[fold_key]["fold_time"]
+            for fold_key in fold_keys
+            if predictions_by_fold[fold_key]["fold_time"] is not None
         ]
 
         if self.verbose == 1:
             print("Finished making predictions!")
 
-        return pd.concat(list(itertools.chain.from_iterable(predictions)), sort=False)
+        return pd.concat(predictions, sort=False)
+
+    def _prediction_tasks(self) -> List[PredictionTask]:
+        # Models with the same name share a cached copy, so we make predictions
+        # with each of them in the same task to avoid using one model
+        # in two threads at once
+        model_positions: "OrderedDict[str, List[int]]" = OrderedDict()
+        for model_position, ml_model in enumerate(self._ml_models):
+            model_positions.setdefault(ml_model["name"], []).append(model_position)
+
+        years = list(range(*self.year_range))
+
+        return [(positions, years) for positions in model_positions.values()]
+
+    def _training_tasks(self) -> List[PredictionTask]:
+        years = list(range(*self.year_range))
+        warm_start_tasks: List[PredictionTask] = []
+        cold_start_tasks: List[PredictionTask] = []
+
+        for model_position, ml_model in enumerate(self._ml_models):
+            # Tasks train copies of these models, so forked worker processes
+            # can get them from the parent instead of each loading their own
+            training_model = self.context.catalog.load(ml_model["name"])
+            self._training_models[model_position] = training_model
+
+            # Warm-started folds depend on the previous year's fold, so they
+            # have to run in order, but other folds can all run at once
+            if len(years) > 1 and _supports_warm_start(
+                training_model, self.approximate_warm_start
+            ):
+                warm_start_tasks.append(([model_position], years))
+            else:
+                cold_start_tasks.extend(([model_position], [year]) for year in years)
+
+        # Sequences of warm-started folds take the longest, so they go first
+        return warm_start_tasks + cold_start_tasks
+
+    def _map_tasks(
+        self, tasks: List[PredictionTask], n_workers: int
+    ) -> List[List[FoldPredictions]]:
+        if n_workers == 1:
+            return [self._run_task(task) for task in tasks]
+
+        executor: Executor
+        run_task: Callable[[PredictionTask], List[FoldPredictions]]
+
+        if self.executor_type == "process":
+            executor = ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=get_context("fork"),
+                initializer=_set_worker_predictor,
+                initargs=(self,),
+            )
+            run_task = _run_worker_task
+        else:
+            executor = ThreadPoolExecutor(max_workers=n_workers)
+            run_task = self._run_task
+
+        with executor:
+            return list(executor.map(run_task, tasks))
+
+    def _run_task(self, task: PredictionTask) -> List[FoldPredictions]:
+        model_positions, years = task
+
+        return [
+            fold_predictions
+            for model_position in model_positions
+            for fold_predictions in (
+                self._make_walk_forward_predictions(model_position, years)
+                if self.train
+                else self._make_model_predictions(model_position, years)
+            )
+        ]
+
+    def _load_model_data(self, ml_models: List[MLModelDict]) -> None:
+        # Data sets that only exist in memory can change between requests,
+        # so each call gets a new cache for them
+        self._data.request_cache = MLDataCache(max_entries=len(ml_models))
+
+        self._loaded_data = {}
+
+        for ml_model in ml_models:
+            data_key = (ml_model["data_set"], ml_model["label_col"])
+
+            if data_key in self._loaded_data:
+                continue
+
+            model_data = copy.copy(self._data)
+            model_data.data_set = ml_model["data_set"]
+            model_data.label_col = ml_model["label_col"]
+            # The predictor's year ranges cover all the years of every fold,
+            # so this loads all the features and labels that tasks will need
+            model_data.test_data  # pylint: disable=pointless-statement
+            self._loaded_data[data_key] = model_data
+
+    def _model_data(self, ml_model: MLModelDict, **year_ranges: YearRange) -> MLData:
+        # Copies share the loaded data frames, which tasks only read,
+        # and selecting train or test data only copies the rows for its years
+        model_data = copy.copy(
+            self._loaded_data[(ml_model["data_set"], ml_model["label_col"])]
+        )
+
+        for year_range_name, year_range in year_ranges.items():
+            setattr(model_data, year_range_name, year_range)
+
+        return model_data
 
-    def _make_predictions_by_year(self, ml_models, year: int) -> List[pd.DataFrame]:
-        return [self._make_model_predictions(year, ml_model) for ml_model in ml_models]
+    def _make_model_predictions(
+        self, model_position: int, years: List[int]
+    ) -> List[FoldPredictions]:
+        ml_model = self._ml_models[model_position]
 
-    def _make_model_predictions(self, year: int, ml_model) -> pd.DataFrame:
         if self.verbose == 1:
             print(f"Making predictions with {ml_model['name']}")
 
-        loaded_model = self.context.catalog.load(ml_model["name"])
-        self._data.data_set = ml_model["data_set"]
-        self._data.label_col = ml_model["label_col"]
+        loaded_model = _with_pinned_xgboost_threads(
+            MODEL_REGISTRY.load(self.context, ml_model["name"]),
+            self._n_threads_per_model,
+        )
 
-        trained_model = self._train_model(loaded_model) if self.train else loaded_model
-        X_test, _ = self._data.test_data
+        X_test, _ = self._model_data(ml_model).test_data
+        # Models aren't trained between years, so one set of predictions
+        # covers all of them
+        model_predictions = self._predict(loaded_model, ml_model, X_test, years)
+
+        return [
+            {
+                "model_position": model_position,
+                "year": year,
+                "predictions": self._year_predictions(model_predictions, year),
+                "fold_time": None,
+            }
+            for year in years
+        ]
 
+    def _make_walk_forward_predictions(
+        self, model_position: int, years: List[int]
+    ) -> List[FoldPredictions]:
+        ml_model = self._ml_models[model_position]
+        # Each task trains its own copy, so folds for the same model
+        # can run at the same time
+        training_model = copy.deepcopy(self._training_models[model_position])
+        _pin_xgboost_threads(training_model, self._n_threads_per_model)
+
+        is_warm_start_sequence = len(years) > 1
+        if is_warm_start_sequence:
+            _prepare_warm_start(training_model)
+
+        all_fold_predictions: List[FoldPredictions] = []
+        previous_year: Optional[int] = None
+
+        for year in years:
+            start_time = time.perf_counter()
+            # Each fold trains on all years before the one it predicts
+            model_data = self._model_data(
+                ml_model, train_year_range=(year,), test_year_range=(year, year + 1)
+            )
+            is_warm_start = previous_year is not None
+
+            is_partial_fit = (
+                self.approximate_warm_start and training_model.supports_partial_fit
+            )
+
+            if previous_year is not None and is_partial_fit:
+                new_model_data = self._model_data(
+                    ml_model, train_year_range=(previous_year, year)
+                )
+                self._partial_fit_model(training_model, new_model_data)
+            else:
+                self._train_model(training_model, model_data)
+
+            # The first fold is always fit from scratch, because loaded models
+            # can have state from training on later years
+            if previous_year is None and is_warm_start_sequence:
+                _enable_warm_start(training_model, self.approximate_warm_start)
+
+            X_test, _ = model_data.test_data
+            model_predictions = self._predict(training_model, ml_model, X_test, [year])
+            fold_time: FoldTime = {
+                "ml_model": ml_model["name"],
+                "year": year,
+                "warm_start": is_warm_start,
+                "seconds": time.perf_counter() - start_time,
+            }
+
+            if self.verbose == 1:
+                print(
+                    f"Trained {ml_model['name']} and made predictions for {year} "
+                    f"in {fold_time['seconds']:.2f}s"
+                    f"{' (warm start)' if is_warm_start else ''}"
+                )
+
+            all_fold_predictions.append(
+                {
+                    "model_position": model_position,
+                    "year": year,
+                    "predictions": self._year_predictions(model_predictions, year),
+                    "fold_time": fold_time,
+                }
+            )
+            previous_year = year
+
+        return all_fold_predictions
+
+    def _predict(
+        self,
+        trained_model: BaseMLEstimator,
+        ml_model: MLModelDict,
+        X_test: pd.DataFrame,
+        years: List[int],
+    ) -> pd.DataFrame:
         assert X_test.any().any(), (
             "X_test doesn't have any rows, likely due to no data being available for "
-            f"{year}."
+            f"{years}."
         )
 
         y_pred = trained_model.predict(X_test)
@@ -103,35 +502,39 @@ class Predictor:
             f"{y_pred}."
         )
 
+        return X_test.assign(**self._prediction_data(ml_model, y_pred)).set_index(
+            "ml_model", append=True, drop=False
+        )
+
+    def _year_predictions(
+        self, model_predictions: pd.DataFrame, year: int
+    ) -> pd.DataFrame:
         data_row_slice = (
             slice(None),
             year,
             slice(self.round_number, self.round_number),
         )
 
-        model_predictions = (
-            X_test.assign(**self._prediction_data(ml_model, y_pred))
-            .set_index("ml_model", append=True, drop=False)
-            .loc[data_row_slice, PREDICTION_COLS]
-        )
+        year_predictions = model_predictions.loc[data_row_slice, PREDICTION_COLS]
 
-        assert model_predictions.any().any(), (
+        assert year_predictions.any().any(), (
             "Model predictions data frame is empty, possibly due to a bad row slice:\n"
             f"{data_row_slice}"
         )
 
-        return model_predictions
+        return year_predictions
 
-    def _train_model(self, ml_model: BaseMLEstimator) -> BaseMLEstimator:
-        assert max(self._data.train_year_range) <= min(self._data.test_year_range)
+    @staticmethod
+    def _train_model(ml_model: BaseMLEstimator, model_data: MLData) -> BaseMLEstimator:
+        assert max(model_data.train_year_range) <= min(model_data.test_year_range)
 
-        X_train, y_train = self._data.train_data
+        X_train, y_train = model_data.train_data
 
         # On the off chance that we try to run predictions for years that have
         # no relevant prediction data
         assert not X_train.empty and not y_train.empty, (
             "Some required data was missing for training for year range "
-            f"{self._data.train_year_range}.\n"
+            f"{model_data.train_year_range}.\n"
             f"{'X_train is empty' if X_train.empty else ''}"
             f"{'and ' if X_train.empty and y_train.empty else ''}"
             f"{'y_train is empty' if y_train.empty else ''}"
@@ -141,6 +544,15 @@ class Predictor:
 
         return ml_model
 
+    @staticmethod
+    def _partial_fit_model(
+        ml_model: BaseMLEstimator, new_model_data: MLData
+    ) -> BaseMLEstimator:
+        X_new, y_new = new_model_data.train_data
+        ml_model.partial_fit(X_new, y_new)
+
+        return ml_model
+
     @staticmethod
     def _prediction_data(
         ml_model: MLModelDict, y_pred: np.array
@@ -0,0 +1,143 @@
+"""Process-wide cache of API responses, with coalescing of identical requests."""
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future
+import os
+import threading
+import time
+
+
+# Number of distinct requests to keep responses for. Each request's response
+# is small, but we only expect a handful of year range/round/model combinations.
+DEFAULT_MAX_RESULTS = 32
+# Remote data (e.g. team rosters) can change without anything in the process
+# noticing, so results expire after this many seconds
+DEFAULT_TTL_SECONDS = float(os.getenv("PREDICTION_CACHE_TTL_SECONDS", "3600"))
+
+
+class ResultCache:
+    """Caches results by request parameters and a digest of their input data.
+
+    Only one computation runs at a time for any given key: identical requests
+    that arrive while it's running wait for, and share, its result.
+    """
+
+    def __init__(
+        self,
+        max_results: int = DEFAULT_MAX_RESULTS,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+    ):
+        """Instantiate a ResultCache object.
+
+        Params
+        ------
+        max_results: Maximum number of results to keep. The least-recently-used
+            results are dropped first.
+        ttl_seconds: Number of seconds for which results are valid. Results
+            never expire if this is None.
+        """
+        self.max_results = max_results
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.expirations = 0
+        # Results are stored with the input digest and the time they were computed
+        self._results: "OrderedDict[Hashable, Tuple[str, Any, float]]" = OrderedDict()
+        self._in_flight: Dict[Tuple[Hashable, str], Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self, key: Hashable, input_digest: str, compute: Callable[[], Any]
+    ) -> Any:
+        """Return the cached result for the key, computing it if necessary.
+
+        Params
+        ------
+        key: Hashable representation of the request parameters.
+        input_digest: Digest of the input data for the request. A cached result
+            with a different digest is stale (e.g. new match results have landed
+            since it was computed), so it gets replaced, as do results that
+            have expired.
+        compute: Function that calculates the result.
+
+        Returns
+        -------
+        The result of calling `compute`, whether now or in an earlier request.
+        """
+        flight_key = (key, input_digest)
+
+        with self._lock:
+            cached_result = self._results.get(key)
+
+            if cached_result is not None and self._is_expired(cached_result):
+                self.expirations += 1
+                del self._results[key]
+                cached_result = None
+
+            if cached_result is not None and cached_result[0] == input_digest:
+                self.hits += 1
+                self._results.move_to_end(key)
+                return cached_result[1]
+
+            in_flight_result = self._in_flight.get(flight_key)
+
+            if in_flight_result is None:
+                self.misses += 1
+                result_future: Future = Future()
+                self._in_flight[flight_key] = result_future
+            else:
+                self.coalesced += 1
+
+        if in_flight_result is not None:
+            return in_flight_result.result()
+
+        try:
+            result = compute()
+        except Exception as err:
+            with self._lock:
+                self._in_flight.pop(flight_key, None)
+
+            result_future.set_exception(err)
+            raise
+
+        # Storing the result while still holding the in-flight slot means that
+        # no identical request can slip in between and start a new computation
+        with self._lock:
+            self._in_flight.pop(flight_key, None)
+            self._results[key] = (input_digest, result, time.monotonic())
+            self._results.move_to_end(key)
+
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+
+        result_future.set_result(result)
+
+        return result
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            self._results.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Cache counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "expirations": self.expirations,
+                "results": len(self._results),
+            }
+
+    def _is_expired(self, cached_result: Tuple[str, Any, float]) -> bool:
+        return (
+            self.ttl_seconds is not None
+            and time.monotonic() - cached_result[2] > self.ttl_seconds
+        )
+
+
+PREDICTION_CACHE = ResultCache()
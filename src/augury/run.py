@@ -1,17 +1,28 @@
 """Application entry point."""
 
 from pathlib import Path
-from typing import Iterable, Dict, Optional
+from typing import Iterable, Dict, Optional, Any
 from datetime import date
 import os
 
+import pandas as pd
 from kedro.framework.context import KedroContext, load_context
-from kedro.runner import AbstractRunner
+from kedro.runner import AbstractRunner, SequentialRunner
 from kedro.pipeline import Pipeline
-from kedro.io import DataCatalog
+from kedro.io import DataCatalog, MemoryDataSet
 
 from augury.pipelines import create_pipelines, create_full_pipeline
 from augury.io import JSONRemoteDataSet
+from augury.partitioned import (
+    PLAYER_OUTPUT,
+    PLAYER_PARTITION_MAX_MB,
+    run_partitioned_player_pipeline,
+    without_player_pipeline,
+)
+from augury.incremental import INCREMENTAL_PIPELINE_SPECS, calculate_new_rounds
+from augury.runner import run_in_memory
+from augury.types import YearRange
+from augury.hooks import NodeProfilingHooks
 
 
 class ProjectContext(KedroContext):
@@ -19,6 +30,9 @@ class ProjectContext(KedroContext):
 
     project_name = "augury"
     project_version = "0.16.1"
+    # Kedro registers hooks globally, so we share one instance across contexts
+    # to avoid registering duplicates every time a context is loaded
+    hooks = (NodeProfilingHooks(),)
 
     def __init__(
         self,
@@ -45,12 +59,117 @@ class ProjectContext(KedroContext):
         self.round_number = round_number
         self.start_date = start_date
         self.end_date = end_date
+        self._memory_data: Dict[str, Any] = {}
 
     @property
     def pipeline(self):
         """Create the default pipeline for the Augury app."""
         return create_full_pipeline(self.start_date, self.end_date)
 
+    def run_prediction_slice(
+        self,
+        pipeline_name: str,
+        data_set_name: str,
+        year_range: YearRange,
+        include_history: bool = False,
+    ) -> pd.DataFrame:
+        """Run a pipeline for only the data needed to make predictions.
+
+        Features for matches already in the persisted final data sets don't change,
+        so we only calculate features for matches since the last update,
+        continuing from the saved state of rolling, cumulative, and Elo features
+        (see `augury.incremental`). The rest of the pipeline joins those
+        final data sets for the prediction years. Neither the result nor
+        any intermediate data sets are saved to file. Instead, the result is held
+        in memory, replacing the given data set for the rest of this context's
+        lifetime.
+
+        Params
+        ------
+        pipeline_name: Name of the pipeline to run.
+        data_set_name: Name of the data set that the pipeline's output replaces.
+        year_range: Years for which predictions will be made (first year inclusive,
+            last year exclusive, per `range` function).
+        include_history: Whether to include rows for seasons before the prediction
+            years (e.g. for training models).
+
+        Returns
+        -------
+        Data frame with the calculated data.
+        """
+        self._memory_data.pop(data_set_name, None)
+
+        pipeline = self._get_pipeline(name=pipeline_name)
+        assert len(pipeline.outputs()) == 1, (
+            f"Pipeline {pipeline_name} must have exactly one final output, "
+            f"but has {pipeline.outputs()}."
+        )
+        final_output = list(pipeline.outputs())[0]
+
+        prediction_years = range(*year_range)
+        catalog = self.catalog
+        incremental_data_sets = []
+
+        for spec in INCREMENTAL_PIPELINE_SPECS:
+            if spec["final_data_set"] not in pipeline.all_outputs():
+                continue
+
+            final_data, _ = calculate_new_rounds(self, spec)
+            is_in_slice = (
+                final_data["year"] < prediction_years.stop
+                if include_history
+                else final_data["year"].isin(prediction_years)
+            )
+            catalog.add(
+                spec["final_data_set"],
+                MemoryDataSet(data=final_data.loc[is_in_slice]),
+                replace=True,
+            )
+            incremental_data_sets.append(spec["final_data_set"])
+
+        if incremental_data_sets:
+            pipeline = pipeline.from_inputs(*incremental_data_sets)
+
+        slice_data = run_in_memory(pipeline, catalog).load(final_output)
+        self._memory_data[data_set_name] = slice_data
+
+        return slice_data
+
+    def run_with_player_partitions(
+        self,
+        pipeline_name: Optional[str] = None,
+        runner: Optional[AbstractRunner] = None,
+        max_partition_mb: float = PLAYER_PARTITION_MAX_MB,
+    ) -> Dict[str, Any]:
+        """Run a pipeline, calculating its player data a batch of seasons at a time.
+
+        Player features for all of history take several times the memory
+        of the raw player data, so pipelines that include the player pipeline
+        get final player data from `run_partitioned_player_pipeline` instead.
+        The rest of the pipeline runs as usual.
+
+        Params
+        ------
+        pipeline_name: Name of the pipeline to run. Defaults to the default pipeline.
+        runner: Runner for the rest of the pipeline. Defaults to SequentialRunner.
+        max_partition_mb: Maximum memory for each batch of raw player data.
+
+        Returns
+        -------
+        Any of the pipeline's outputs that aren't saved in the catalog.
+        """
+        pipeline = self._get_pipeline(name=pipeline_name)
+        catalog = self.catalog
+
+        if PLAYER_OUTPUT in pipeline.all_outputs():
+            player_data = run_partitioned_player_pipeline(
+                self, max_partition_mb=max_partition_mb
+            )
+            pipeline = without_player_pipeline(pipeline)
+            catalog.add(PLAYER_OUTPUT, MemoryDataSet(data=player_data), replace=True)
+
+        return (runner or SequentialRunner()).run(pipeline, catalog)
+
     def _get_pipelines(self) -> Dict[str, Pipeline]:
         return create_pipelines(self.start_date, self.end_date)
 
@@ -68,6 +187,9 @@ class ProjectContext(KedroContext):
             ),
         )
 
+        for data_set_name, data in self._memory_data.items():
+            catalog.add(data_set_name, MemoryDataSet(data=data), replace=True)
+
         return catalog
 
 
@@ -82,6 +204,7 @@ def main(
     round_number: Optional[int] = None,
     start_date: str = "1897-01-01",
     end_date: str = f"{date.today().year}-12-31",
+    partition_player_data: bool = False,
 ):
     """Application main entry point.
 
@@ -103,6 +226,8 @@ def main(
         end point of the new ``Pipeline``.
     from_inputs: An optional list of input datasets which should be used as a
         starting point of the new ``Pipeline``.
+    partition_player_data: Whether to calculate player data a batch of seasons at a time
+        to save memory. It can't be combined with options that filter the pipeline.
     """
     project_context = load_context(
         Path.cwd(),
@@ -111,6 +236,17 @@ def main(
         start_date=start_date,
         end_date=end_date,
     )
+
+    if partition_player_data:
+        if any([tags, node_names, from_nodes, to_nodes, from_inputs]):
+            raise ValueError(
+                "Running with partitioned player data doesn't support filtering "
+                "the pipeline's nodes."
+            )
+
+        project_context.run_with_player_partitions(runner=runner)
+        return
+
     project_context.run(
         tags=tags,
         runner=runner,
@@ -0,0 +1,205 @@
+"""Kedro runner that runs independent branches of a pipeline concurrently."""
+
+from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter
+from multiprocessing import get_context
+from multiprocessing.pool import ThreadPool
+import re
+import resource
+import time
+
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline
+from kedro.runner import AbstractRunner, SequentialRunner
+from mypy_extensions import TypedDict
+
+# Each data-source-specific pipeline (betting, match, player) ends in a data set
+# of this form, and they only depend on each other once these are joined
+BRANCH_OUTPUT_REGEX = re.compile(r"^final_\w+_data$")
+KILOBYTES_PER_MEGABYTE = 1024
+
+BranchStats = TypedDict(
+    "BranchStats",
+    {"seconds": float, "peak_memory_mb": Optional[float]},
+)
+
+
+def run_in_memory(pipeline: Pipeline, catalog: DataCatalog) -> DataCatalog:
+    """Run a pipeline, keeping all of its outputs in memory.
+
+    Replacing all outputs with memory data sets keeps the run from overwriting
+    any persisted data sets.
+
+    Params
+    ------
+    pipeline: Pipeline to run.
+    catalog: Catalog with the pipeline's inputs. Its output data sets
+        are replaced in place.
+
+    Returns
+    -------
+    The catalog, from which the pipeline's outputs can be loaded.
+    """
+    for output_name in pipeline.all_outputs():
+        catalog.add(output_name, MemoryDataSet(), replace=True)
+
+    SequentialRunner().run(pipeline, catalog)
+
+    return catalog
+
+
+def peak_memory_mb() -> float:
+    """Get the peak resident memory of the current process in megabytes."""
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / KILOBYTES_PER_MEGABYTE
+
+
+def _run_branch(
+    pipeline: Pipeline, catalog: DataCatalog, output_name: str, in_process: bool
+) -> Tuple[Any, BranchStats]:
+    start_time = time.perf_counter()
+
+    outputs = SequentialRunner().run(pipeline, catalog)
+    output_data = (
+        outputs[output_name] if output_name in outputs else catalog.load(output_name)
+    )
+
+    return (
+        output_data,
+        {
+            "seconds": time.perf_counter() - start_time,
+            # Threads share memory, so we can only measure a branch's memory usage
+            # when it has a process to itself
+            "peak_memory_mb": peak_memory_mb() if in_process else None,
+        },
+    )
+
+
+class ParallelBranchRunner(AbstractRunner):
+    """Runs each branch that leads to a 'final_<source>_data' data set concurrently.
+
+    Nodes that more than one branch depends on run once, before the branches
+    split, and the rest of the pipeline (i.e. nodes that join the branches'
+    outputs) runs sequentially once all branches are finished. Wall time and peak memory
+    for each branch are logged and saved to `branch_stats`.
+    """
+
+    def __init__(
+        self,
+        branch_outputs: Optional[List[str]] = None,
+        use_threads: bool = False,
+        is_async: bool = False,
+    ):
+        """Instantiate a ParallelBranchRunner object.
+
+        Params
+        ------
+        branch_outputs: Names of the data sets at the end of each branch.
+            Defaults to all 'final_<source>_data' data sets that are inputs
+            to other nodes.
+        use_threads: Whether to run branches in threads rather than processes.
+            Threads avoid copying data between processes, but pandas rarely
+            releases the GIL, and per-branch memory can't be measured.
+        is_async: Whether to load and save node inputs and outputs asynchronously.
+        """
+        super().__init__(is_async=is_async)
+        self.branch_outputs = branch_outputs
+        self.use_threads = use_threads
+        self.branch_stats: Dict[str, BranchStats] = {}
+
+    def create_default_data_set(self, ds_name: str) -> MemoryDataSet:
+        """Create a default data set for unregistered node outputs."""
+        return MemoryDataSet()
+
+    @staticmethod
+    def _shared_pipeline(branch_pipelines: List[Pipeline]) -> Pipeline:
+        node_counts = Counter(
+            branch_node
+            for branch_pipeline in branch_pipelines
+            for branch_node in branch_pipeline.nodes
+        )
+
+        # Anything upstream of a shared node is also shared, so this is always
+        # a prefix of each branch
+        return Pipeline(
+            [branch_node for branch_node, count in node_counts.items() if count > 1]
+        )
+
+    def _run_shared_nodes(self, shared_pipeline: Pipeline, catalog: DataCatalog):
+        # Running one node at a time keeps every output as a free output,
+        # so the runner doesn't release memory data sets that branches still need
+        for shared_node in shared_pipeline.nodes:
+            SequentialRunner().run(Pipeline([shared_node]), catalog)
+
+        if shared_pipeline.nodes:
+            self._logger.info(
+                "Ran %s nodes shared between branches before splitting",
+                len(shared_pipeline.nodes),
+            )
+
+    def _run(
+        self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
+    ) -> None:
+        branch_outputs = self.branch_outputs or [
+            data_set_name
+            for data_set_name in sorted(pipeline.all_outputs() & pipeline.all_inputs())
+            if BRANCH_OUTPUT_REGEX.match(data_set_name)
+        ]
+
+        if len(branch_outputs) < 2:
+            SequentialRunner().run(pipeline, catalog)
+            return None
+
+        full_branch_pipelines = {
+            output_name: pipeline.to_outputs(output_name)
+            for output_name in branch_outputs
+        }
+        shared_pipeline = self._shared_pipeline(list(full_branch_pipelines.values()))
+        self._run_shared_nodes(shared_pipeline, catalog)
+
+        branch_pipelines = {
+            output_name: branch_pipeline - shared_pipeline
+            for output_name, branch_pipeline in full_branch_pipelines.items()
+        }
+        # Spawned processes start without the parent's memory (unlike forked ones,
+        # which inherit its peak RSS), so each branch gets its own measurement
+        pool = (
+            ThreadPool(processes=len(branch_pipelines))
+            if self.use_threads
+            else get_context("spawn").Pool(
+                processes=len(branch_pipelines), maxtasksperchild=1
+            )
+        )
+
+        with pool:
+            branch_results = {
+                output_name: pool.apply_async(
+                    _run_branch,
+                    (branch_pipeline, catalog, output_name, not self.use_threads),
+                )
+                for output_name, branch_pipeline in branch_pipelines.items()
+            }
+
+            for output_name, branch_result in branch_results.items():
+                output_data, self.branch_stats[output_name] = branch_result.get()
+
+                # Persisted outputs have already been saved by the branch's process,
+                # but memory data sets only exist in that process
+                if not catalog.exists(output_name):
+                    catalog.save(output_name, output_data)
+
+                self._logger.info(
+                    "Branch %s finished in %.1f seconds with peak memory of %s MB",
+                    output_name,
+                    self.branch_stats[output_name]["seconds"],
+                    self.branch_stats[output_name]["peak_memory_mb"],
+                )
+
+        joined_pipeline = (
+            pipeline - shared_pipeline - Pipeline(list(branch_pipelines.values()))
+        )
+
+        if joined_pipeline.nodes:
+            SequentialRunner().run(joined_pipeline, catalog)
+
+        return None
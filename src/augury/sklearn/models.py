@@ -1,7 +1,6 @@
 """Classes and functions based on existing Scikit-learn functionality."""
 
 from typing import Sequence, Type, List, Union, Optional, Any, Tuple, Dict, Callable
-import copy
 import warnings
 import tempfile
 
@@ -146,6 +145,7 @@ class EloRegressor(BaseEstimator, RegressorMixin):
         home_ground_advantage=DEFAULT_HOME_GROUND_ADVANTAGE,
         s=DEFAULT_S,
         season_carryover=DEFAULT_SEASON_CARRYOVER,
+        warm_start=False,
     ):
         """
         Instantiate an EloRegressor object.
@@ -160,6 +160,10 @@ class EloRegressor(BaseEstimator, RegressorMixin):
         s: Elo model param.
         season_carryover: The percentage of a team's end-of-season Elo score
             that is kept for the next season.
+        warm_start: Whether to continue from the fitted Elo ratings when refitting
+            on the same data plus later matches (e.g. when training on an expanding
+            window of seasons). The resulting ratings are the same as for fitting
+            from scratch.
         """
         self.k = k
         self.x = x
@@ -167,13 +171,14 @@ class EloRegressor(BaseEstimator, RegressorMixin):
         self.home_ground_advantage = home_ground_advantage
         self.s = s
         self.season_carryover = season_carryover
+        self.warm_start = warm_start
         self._running_elo_ratings: self.EloDictionary = {
             "previous_elo": np.array([]),
             "current_elo": np.array([]),
             "year": 0,
             "round_number": 0,
         }
-        self._fitted_elo_ratings: self.EloDictionary = copy.deepcopy(
+        self._fitted_elo_ratings: self.EloDictionary = self._copy_elo_state(
             self._running_elo_ratings
         )
         self._first_fitted_year = 0
@@ -188,37 +193,44 @@ class EloRegressor(BaseEstimator, RegressorMixin):
 
     def fit(self, X: pd.DataFrame, _y: pd.Series = None) -> Type[R]:
         """Fit estimator to data."""
-        REQUIRED_COLS = set(self.ELO_INDEX_COLS) | set(self.MATRIX_COLS)
-        _validate_required_columns(REQUIRED_COLS, X.columns)
-
-        data_frame: pd.DataFrame = (
-            X.set_index(self.ELO_INDEX_COLS, drop=False)
-            .rename_axis([None] * len(self.ELO_INDEX_COLS))
-            .assign(
-                home_team=lambda df: self._team_encoder.transform(df["home_team"]),
-                away_team=lambda df: self._team_encoder.transform(df["away_team"]),
-                home_prev_match_oppo_team=lambda df: self._team_encoder.transform(
-                    df["home_prev_match_oppo_team"].astype(str)
-                ),
-                away_prev_match_oppo_team=lambda df: self._team_encoder.transform(
-                    df["away_prev_match_oppo_team"].astype(str)
-                ),
-            )
-            .sort_index(level=[self.YEAR_LVL, self.ROUND_NUMBER_LVL], ascending=True)
-        )
+        if self.warm_start and self._is_fitted:
+            # Only data that starts where the last fit started includes all of
+            # the matches that the fitted ratings are based on
+            if X["year"].min() == self._first_fitted_year:
+                X_new = self._matches_after_fitted_round(X)
+                return self if X_new.empty else self.partial_fit(X_new, _y)
 
         self._reset_elo_state()
 
-        elo_matrix = (data_frame.loc[:, self.MATRIX_COLS]).to_numpy()
-
-        for match_row in elo_matrix:
-            self._update_current_elo_ratings(match_row)
+        data_frame = self._update_elo_ratings_with_matches(X)
 
-        self._fitted_elo_ratings = copy.deepcopy(self._running_elo_ratings)
+        self._fitted_elo_ratings = self._copy_elo_state(self._running_elo_ratings)
         self._first_fitted_year = data_frame["year"].min()
 
         return self
 
+    def __setstate__(self, state):
+        # Models pickled before warm starts were supported don't have the param
+        super().__setstate__({"warm_start": False, **state})
+
+    def partial_fit(self, X: pd.DataFrame, _y: pd.Series = None) -> Type[R]:
+        """Update the fitted Elo ratings with matches from subsequent rounds.
+
+        Unlike `fit`, this continues from the current fitted state instead
+        of recalculating ratings from the beginning of the training data, so X
+        must start with the round that follows the last fitted round.
+        """
+        if not self._is_fitted:
+            return self.fit(X, _y)
+
+        self._running_elo_ratings = self._copy_elo_state(self._fitted_elo_ratings)
+
+        self._update_elo_ratings_with_matches(X)
+
+        self._fitted_elo_ratings = self._copy_elo_state(self._running_elo_ratings)
+
+        return self
+
     def predict(self, X: pd.DataFrame) -> np.ndarray:
         """Make predictions.
 
@@ -237,16 +249,7 @@ class EloRegressor(BaseEstimator, RegressorMixin):
         )
 
         data_frame = (
-            X.assign(
-                home_team=lambda df: self._team_encoder.transform(df["home_team"]),
-                away_team=lambda df: self._team_encoder.transform(df["away_team"]),
-                home_prev_match_oppo_team=lambda df: self._team_encoder.transform(
-                    df["home_prev_match_oppo_team"].astype(str)
-                ),
-                away_prev_match_oppo_team=lambda df: self._team_encoder.transform(
-                    df["away_prev_match_oppo_team"].astype(str)
-                ),
-            )
+            X.pipe(self._encode_team_columns)
             .set_index(self.ELO_INDEX_COLS, drop=False)
             .sort_index(level=[self.YEAR_LVL, self.ROUND_NUMBER_LVL], ascending=True)
         )
@@ -256,15 +259,16 @@ class EloRegressor(BaseEstimator, RegressorMixin):
         if data_frame["year"].min() == self._first_fitted_year:
             self._reset_elo_state()
         else:
-            self._running_elo_ratings = copy.deepcopy(self._fitted_elo_ratings)
+            self._running_elo_ratings = self._copy_elo_state(self._fitted_elo_ratings)
 
-        elo_predictions = [
-            self._calculate_current_elo_predictions(match_row)
-            for match_row in elo_matrix
+        round_predictions = [
+            self._calculate_current_elo_predictions(round_matrix)
+            for round_matrix in self._split_by_round(elo_matrix)
         ]
-        # Need to zip predictions to group by home/away instead of match,
-        # then transpose to convert from rows to columns
-        home_away_columns = np.array(list(zip(*elo_predictions))).T
+        # Columns are home & away predictions, rows are matches
+        home_away_columns = (
+            np.concatenate(round_predictions) if round_predictions else np.empty((0, 2))
+        )
 
         elo_data_frame = pd.DataFrame(
             home_away_columns,
@@ -287,41 +291,95 @@ class EloRegressor(BaseEstimator, RegressorMixin):
             .to_numpy()
         )
 
-    def _calculate_current_elo_predictions(self, match_row: np.ndarray):
-        home_team = int(match_row[self.HOME_TEAM_IDX])
-        away_team = int(match_row[self.AWAY_TEAM_IDX])
+    @property
+    def _is_fitted(self) -> bool:
+        return len(self._fitted_elo_ratings["current_elo"]) > 0
+
+    def _matches_after_fitted_round(self, X: pd.DataFrame) -> pd.DataFrame:
+        fitted_year = self._fitted_elo_ratings["year"]
+        fitted_round = self._fitted_elo_ratings["round_number"]
+
+        return X[
+            (X["year"] > fitted_year)
+            | ((X["year"] == fitted_year) & (X["round_number"] > fitted_round))
+        ]
+
+    def _update_elo_ratings_with_matches(self, X: pd.DataFrame) -> pd.DataFrame:
+        REQUIRED_COLS = set(self.ELO_INDEX_COLS) | set(self.MATRIX_COLS)
+        _validate_required_columns(REQUIRED_COLS, X.columns)
+
+        data_frame: pd.DataFrame = (
+            X.set_index(self.ELO_INDEX_COLS, drop=False)
+            .rename_axis([None] * len(self.ELO_INDEX_COLS))
+            .pipe(self._encode_team_columns)
+            .sort_index(level=[self.YEAR_LVL, self.ROUND_NUMBER_LVL], ascending=True)
+        )
+
+        elo_matrix = (data_frame.loc[:, self.MATRIX_COLS]).to_numpy()
+
+        for round_matrix in self._split_by_round(elo_matrix):
+            self._update_current_elo_ratings(round_matrix)
+
+        return data_frame
+
+    def _encode_team_columns(self, data_frame: pd.DataFrame) -> pd.DataFrame:
+        return data_frame.assign(
+            home_team=lambda df: self._team_encoder.transform(df["home_team"]),
+            away_team=lambda df: self._team_encoder.transform(df["away_team"]),
+            home_prev_match_oppo_team=lambda df: self._team_encoder.transform(
+                df["home_prev_match_oppo_team"].astype(str)
+            ),
+            away_prev_match_oppo_team=lambda df: self._team_encoder.transform(
+                df["away_prev_match_oppo_team"].astype(str)
+            ),
+        )
+
+    # Assumes elo_matrix sorted by year & round_number with ascending=True
+    def _split_by_round(self, elo_matrix: np.ndarray) -> List[np.ndarray]:
+        if len(elo_matrix) == 0:
+            return []
+
+        year_rounds = elo_matrix[:, [self.YEAR_IDX, self.ROUND_NUMBER_IDX]]
+        is_new_round = (np.diff(year_rounds, axis=0) != 0).any(axis=1)
+
+        return np.split(elo_matrix, np.flatnonzero(is_new_round) + 1)
+
+    def _calculate_current_elo_predictions(self, round_matrix: np.ndarray):
+        home_teams = round_matrix[:, self.HOME_TEAM_IDX].astype(int)
+        away_teams = round_matrix[:, self.AWAY_TEAM_IDX].astype(int)
 
-        self._update_current_elo_ratings(match_row)
+        self._update_current_elo_ratings(round_matrix)
 
-        home_elo_rating = self._running_elo_ratings["current_elo"][home_team]
-        away_elo_rating = self._running_elo_ratings["current_elo"][away_team]
+        home_elo_ratings = self._running_elo_ratings["current_elo"][home_teams]
+        away_elo_ratings = self._running_elo_ratings["current_elo"][away_teams]
 
-        home_elo_prediction = self._calculate_team_elo_prediction(
-            home_elo_rating, away_elo_rating, True
+        home_elo_predictions = self._calculate_team_elo_prediction(
+            home_elo_ratings, away_elo_ratings, 1
         )
-        away_elo_prediction = self._calculate_team_elo_prediction(
-            away_elo_rating, home_elo_rating, False
+        away_elo_predictions = self._calculate_team_elo_prediction(
+            away_elo_ratings, home_elo_ratings, 0
         )
 
-        return home_elo_prediction, away_elo_prediction
+        return np.column_stack([home_elo_predictions, away_elo_predictions])
 
-    # Assumes df sorted by year & round_number with ascending=True in order to calculate
-    # correct Elo ratings
-    def _update_current_elo_ratings(self, match_row: np.ndarray) -> None:
-        home_team = int(match_row[self.HOME_TEAM_IDX])
-        away_team = int(match_row[self.AWAY_TEAM_IDX])
+    # Assumes all matches in round_matrix are from the same year & round.
+    # Ratings for a round only depend on ratings from the end of the previous round,
+    # so we can calculate all of a round's matches at once.
+    def _update_current_elo_ratings(self, round_matrix: np.ndarray) -> None:
+        home_teams = round_matrix[:, self.HOME_TEAM_IDX].astype(int)
+        away_teams = round_matrix[:, self.AWAY_TEAM_IDX].astype(int)
 
-        self._update_prev_elo_ratings(match_row)
+        self._update_prev_elo_ratings(round_matrix[0])
 
-        home_elo_rating = self._calculate_current_elo_rating(
-            self.HOME_TEAM_IDX, match_row
+        home_elo_ratings = self._calculate_current_elo_rating(
+            self.HOME_TEAM_IDX, round_matrix
         )
-        away_elo_rating = self._calculate_current_elo_rating(
-            self.AWAY_TEAM_IDX, match_row
+        away_elo_ratings = self._calculate_current_elo_rating(
+            self.AWAY_TEAM_IDX, round_matrix
         )
 
-        self._running_elo_ratings["current_elo"][home_team] = home_elo_rating
-        self._running_elo_ratings["current_elo"][away_team] = away_elo_rating
+        self._running_elo_ratings["current_elo"][home_teams] = home_elo_ratings
+        self._running_elo_ratings["current_elo"][away_teams] = away_elo_ratings
 
     def _update_prev_elo_ratings(self, match_row: np.ndarray):
         match_year = match_row[self.YEAR_IDX]
@@ -348,36 +406,41 @@ class EloRegressor(BaseEstimator, RegressorMixin):
 
             self._running_elo_ratings["year"] = match_year
 
-    def _calculate_current_elo_rating(self, team_idx: int, match_row: np.ndarray):
-        team = int(match_row[team_idx])
-        was_at_home = int(match_row[team_idx + self.PREV_AT_HOME_OFFSET])
-        prev_oppo_team = int(match_row[team_idx + self.PREV_OPPO_OFFSET])
-        prev_margin = match_row[team_idx + self.PREV_MARGIN_OFFSET]
+    def _calculate_current_elo_rating(
+        self, team_idx: int, round_matrix: np.ndarray
+    ) -> np.ndarray:
+        teams = round_matrix[:, team_idx].astype(int)
+        were_at_home = round_matrix[:, team_idx + self.PREV_AT_HOME_OFFSET].astype(int)
+        prev_oppo_teams = round_matrix[:, team_idx + self.PREV_OPPO_OFFSET].astype(int)
+        prev_margins = round_matrix[:, team_idx + self.PREV_MARGIN_OFFSET]
+
+        prev_elo_ratings = self._running_elo_ratings["previous_elo"][teams]
+        prev_oppo_elo_ratings = self._running_elo_ratings["previous_elo"][
+            prev_oppo_teams
+        ]
+        prev_elo_predictions = self._calculate_team_elo_prediction(
+            prev_elo_ratings, prev_oppo_elo_ratings, were_at_home
+        )
+        elo_ratings = self._calculate_team_elo_rating(
+            prev_elo_ratings, prev_elo_predictions, prev_margins
+        )
 
         # If a previous oppo team has the null team value, that means this is
         # the given team's first match, so they start with the default Elo rating
-        if prev_oppo_team == self._null_team:
-            return self._running_elo_ratings["previous_elo"][team]
-
-        prev_elo_rating = self._running_elo_ratings["previous_elo"][team]
-        prev_oppo_elo_rating = self._running_elo_ratings["previous_elo"][prev_oppo_team]
-        prev_elo_prediction = self._calculate_team_elo_prediction(
-            prev_elo_rating, prev_oppo_elo_rating, was_at_home
-        )
-
-        return self._calculate_team_elo_rating(
-            prev_elo_rating, prev_elo_prediction, prev_margin
+        return np.where(
+            prev_oppo_teams == self._null_team, prev_elo_ratings, elo_ratings
         )
 
     # Basing Elo calculations on:
     # http://www.matterofstats.com/mafl-stats-journal/2013/10/13/building-your-own-team-rating-system.html
     def _calculate_team_elo_prediction(
-        self, elo_rating: int, oppo_elo_rating: int, at_home: int
-    ) -> float:
-        home_ground_advantage = (
-            self.home_ground_advantage
-            if at_home == 1
-            else self.home_ground_advantage * -1
+        self,
+        elo_rating: Union[float, np.ndarray],
+        oppo_elo_rating: Union[float, np.ndarray],
+        at_home: Union[int, np.ndarray],
+    ) -> Union[float, np.ndarray]:
+        home_ground_advantage = np.where(
+            at_home == 1, self.home_ground_advantage, self.home_ground_advantage * -1
         )
 
         return 1 / (
@@ -385,12 +448,23 @@ class EloRegressor(BaseEstimator, RegressorMixin):
         )
 
     def _calculate_team_elo_rating(
-        self, elo_rating: float, elo_prediction: float, margin: int
-    ) -> float:
+        self,
+        elo_rating: Union[float, np.ndarray],
+        elo_prediction: Union[float, np.ndarray],
+        margin: Union[int, np.ndarray],
+    ) -> Union[float, np.ndarray]:
         actual_outcome = self.x + 0.5 - self.x ** (1 + (margin / self.m))
 
         return elo_rating + (self.k * (actual_outcome - elo_prediction))
 
+    @staticmethod
+    def _copy_elo_state(elo_ratings: EloDictionary) -> EloDictionary:
+        return {
+            **elo_ratings,
+            "previous_elo": np.copy(elo_ratings["previous_elo"]),
+            "current_elo": np.copy(elo_ratings["current_elo"]),
+        }
+
     def _reset_elo_state(self):
         self._running_elo_ratings["previous_elo"] = np.full(
             len(TEAM_NAMES) + 1, self.BASE_RATING
@@ -446,6 +520,7 @@ class TimeSeriesRegressor(BaseEstimator, RegressorMixin):
         fit_solver: Optional[str] = None,
         confidence=False,
         verbose=0,
+        warm_start=False,
         **sm_kwargs,
     ):
         """Instantiate a StatsModelsRegressor.
@@ -462,6 +537,9 @@ class TimeSeriesRegressor(BaseEstimator, RegressorMixin):
         confidence: Whether to return predictions as percentage confidence
             of an outcome (e.g. win) or float value (e.g. predicted margin).
         verbose: How much information to print during the fitting of the statsmodel.
+        warm_start: Whether to start fitting each team's model from the parameters
+            of its previous fit, which usually takes fewer iterations to converge
+            when the training data has only grown a little.
         sm_kwargs: Any other keyword arguments to pass directly to the instantiation
             of the given stats_model.
         """
@@ -473,7 +551,9 @@ class TimeSeriesRegressor(BaseEstimator, RegressorMixin):
         self.confidence = confidence
         self.sm_kwargs = sm_kwargs
         self.verbose = verbose
+        self.warm_start = warm_start
         self._team_models: Dict[str, TimeSeriesModel] = {}
+        self._team_orders: Dict[str, Tuple[int, int, int]] = {}
 
     def fit(self, X: pd.DataFrame, y: Union[pd.DataFrame, np.array]):
         """Fit the model to the training data."""
@@ -488,6 +568,10 @@ class TimeSeriesRegressor(BaseEstimator, RegressorMixin):
 
         return self
 
+    def __setstate__(self, state):
+        # Models pickled before warm starts were supported don't have these
+        super().__setstate__({"warm_start": False, "_team_orders": {}, **state})
+
     def predict(self, X: pd.DataFrame) -> pd.Series:
         """Make predictions."""
         team_predictions = [
@@ -531,12 +615,29 @@ class TimeSeriesRegressor(BaseEstimator, RegressorMixin):
                 "solver": self.fit_solver,
                 "method": self.fit_method,
                 "disp": self.verbose,
+                "start_params": self._start_params(team_name, order_param),
             }
             fit_kwargs = {k: v for k, v in fit_kwargs.items() if v is not None}
 
             self._team_models[team_name] = self.stats_model(
                 y, order=order_param, exog=self._exog_arg(team_df), **self.sm_kwargs
             ).fit(**fit_kwargs)
+            self._team_orders[team_name] = order_param
+
+    def _start_params(
+        self, team_name: str, order: Tuple[int, int, int]
+    ) -> Optional[np.ndarray]:
+        previous_team_model = self._team_models.get(team_name)
+
+        # Params from a model with a different order have a different shape
+        if (
+            not self.warm_start
+            or previous_team_model is None
+            or self._team_orders.get(team_name) != order
+        ):
+            return None
+
+        return np.asarray(previous_team_model.params)
 
     def _predict_with_team_model(
         self,
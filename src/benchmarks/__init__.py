@@ -0,0 +1,4 @@
+"""Reference implementations and synthetic data for benchmarks and tests.
+
+These are development tools, so they aren't part of the installed package.
+"""
@@ -0,0 +1,478 @@
+"""Straightforward implementations of node functions that have been optimised.
+
+These are kept as references for what the optimised versions must reproduce,
+both in tests (to check that outputs are identical) and in benchmarks
+(to measure speed-ups).
+"""
+
+from typing import List, Tuple, Sequence, Dict
+from functools import reduce, partial, update_wrapper
+from datetime import datetime, time, timedelta
+
+import pandas as pd
+import numpy as np
+from sklearn.preprocessing import LabelEncoder
+from mypy_extensions import TypedDict
+from dateutil import parser
+import pytz
+
+from augury.nodes.base import EARLIEST_NZ_START_TIME, _format_time
+from augury.nodes.match import (
+    _elo_formula,
+    _haversine_formula,
+    _validate_required_columns,
+    BASE_RATING,
+    SEASON_CARRYOVER,
+    TEAM_LEVEL,
+)
+from augury.nodes.feature_calculation import ROLLING_WINDOWS
+from augury.nodes import base
+from augury.nodes.player import (
+    PLAYER_STATS_COLS,
+    SURNAME_REGEX,
+    _aggregations,
+    _agg_column_name,
+    _set_player_index,
+    _translate_team_column,
+)
+from augury.settings import (
+    AVG_SEASON_LENGTH,
+    VENUE_TIMEZONES,
+    INDEX_COLS,
+    MELBOURNE_TIMEZONE,
+    CITIES,
+    TEAM_CITIES,
+    VENUE_CITIES,
+)
+
+
+EloDictionary = TypedDict(
+    "EloDictionary",
+    {
+        "home_away_elo_ratings": List[Tuple[float, float]],
+        "current_team_elo_ratings": np.ndarray,
+        "year": int,
+    },
+)
+
+
+def _calculate_match_elo_rating(
+    elo_ratings: EloDictionary,
+    # match_row = [year, home_team, away_team, home_margin]
+    match_row: np.ndarray,
+) -> EloDictionary:
+    match_year = match_row[0]
+
+    if match_year != elo_ratings["year"]:
+        prematch_team_elo_ratings = (
+            elo_ratings["current_team_elo_ratings"] * SEASON_CARRYOVER
+        ) + BASE_RATING * (1 - SEASON_CARRYOVER)
+    else:
+        prematch_team_elo_ratings = elo_ratings["current_team_elo_ratings"].copy()
+
+    home_team = int(match_row[1])
+    away_team = int(match_row[2])
+    home_margin = match_row[3]
+
+    prematch_home_elo_rating = prematch_team_elo_ratings[home_team]
+    prematch_away_elo_rating = prematch_team_elo_ratings[away_team]
+
+    home_elo_rating = _elo_formula(
+        prematch_home_elo_rating, prematch_away_elo_rating, home_margin, True
+    )
+    away_elo_rating = _elo_formula(
+        prematch_away_elo_rating, prematch_home_elo_rating, home_margin * -1, False
+    )
+
+    postmatch_team_elo_ratings = prematch_team_elo_ratings.copy()
+    postmatch_team_elo_ratings[home_team] = home_elo_rating
+    postmatch_team_elo_ratings[away_team] = away_elo_rating
+
+    return {
+        "home_away_elo_ratings": elo_ratings["home_away_elo_ratings"]
+        + [(prematch_home_elo_rating, prematch_away_elo_rating)],
+        "current_team_elo_ratings": postmatch_team_elo_ratings,
+        "year": match_year,
+    }
+
+
+def add_elo_rating(data_frame_arg: pd.DataFrame) -> pd.DataFrame:
+    """Append a column for teams' prematch Elo ratings, one match at a time."""
+    ELO_INDEX_COLS = {"home_team", "year", "round_number"}
+
+    data_frame = (
+        data_frame_arg.set_index(list(ELO_INDEX_COLS), drop=False).rename_axis(
+            [None] * len(ELO_INDEX_COLS)
+        )
+        if ELO_INDEX_COLS != {*data_frame_arg.index.names}
+        else data_frame_arg.copy()
+    )
+
+    if not data_frame.index.is_monotonic:
+        data_frame.sort_index(inplace=True)
+
+    le = LabelEncoder()
+    le.fit(data_frame["home_team"])
+    time_sorted_data_frame = data_frame.sort_values("date")
+
+    elo_matrix = (
+        time_sorted_data_frame.assign(
+            home_team=lambda df: le.transform(df["home_team"]),
+            away_team=lambda df: le.transform(df["away_team"]),
+        )
+        .eval("home_margin = home_score - away_score")
+        .loc[:, ["year", "home_team", "away_team", "home_margin"]]
+    ).values
+    current_team_elo_ratings = np.full(len(set(data_frame["home_team"])), BASE_RATING)
+    starting_elo_dictionary: EloDictionary = {
+        "home_away_elo_ratings": [],
+        "current_team_elo_ratings": current_team_elo_ratings,
+        "year": 0,
+    }
+
+    elo_columns = reduce(
+        _calculate_match_elo_rating, elo_matrix, starting_elo_dictionary
+    )["home_away_elo_ratings"]
+
+    elo_data_frame = pd.DataFrame(
+        elo_columns,
+        columns=["home_elo_rating", "away_elo_rating"],
+        index=time_sorted_data_frame.index,
+    ).sort_index()
+
+    return pd.concat([data_frame, elo_data_frame], axis=1)
+
+
+def _localize_dates(row: pd.Series) -> datetime:
+    venue_timezone_label = (
+        VENUE_TIMEZONES.get(row["venue"])
+        if "venue" in row.index
+        else "Australia/Melbourne"
+    )
+
+    match_date: datetime = parser.parse(row["date"])
+    match_datetime = (
+        match_date.replace(**EARLIEST_NZ_START_TIME)
+        if match_date.time() == time()
+        else match_date
+    )
+
+    return match_datetime.replace(tzinfo=pytz.timezone(venue_timezone_label))
+
+
+def _parse_dates(data_frame: pd.DataFrame, time_col=None) -> pd.Series:
+    """Convert dates to UTC datetimes, one row at a time."""
+    localization_columns = list(
+        set(["date", "venue", time_col]) & set(data_frame.columns)
+    )
+    localization_data = data_frame[localization_columns].astype(str)
+
+    if time_col is not None:
+        localization_data.loc[:, "date"] = (
+            localization_data["date"]
+            + " "
+            + localization_data[time_col].map(_format_time)
+        )
+
+    localized_dates = localization_data.apply(_localize_dates, axis=1)
+
+    return pd.to_datetime(localized_dates, utc=True)
+
+
+def add_win_streak(data_frame: pd.DataFrame) -> pd.DataFrame:
+    """Append a column for teams' running win/loss streaks, one match at a time."""
+    REQUIRED_COLS = {"prev_match_result"}
+    _validate_required_columns(REQUIRED_COLS, data_frame.columns)
+
+    win_groups = data_frame["prev_match_result"].groupby(
+        level=TEAM_LEVEL, group_keys=False
+    )
+    streak_groups = []
+
+    for team_group_key, team_group in win_groups:
+        streaks: List = []
+
+        for idx, result in enumerate(team_group):
+            # 1 represents win, 0.5 represents draw
+            if result > 0:
+                if idx == 0 or streaks[idx - 1] <= 0:
+                    streaks.append(result)
+                else:
+                    streaks.append(streaks[idx - 1] + result)
+            # 0 represents loss
+            elif result == 0:
+                if idx == 0 or streaks[idx - 1] >= 0:
+                    streaks.append(-1)
+                else:
+                    streaks.append(streaks[idx - 1] - 1)
+            elif result < 0:
+                raise ValueError(
+                    f"No results should be negative, but {result} "
+                    f"is at index {idx} of group {team_group_key}"
+                )
+            else:
+                # For a team's first match in the data set or any rogue NaNs, we add 0
+                streaks.append(0)
+
+        streak_groups.extend(streaks)
+
+    return data_frame.assign(
+        win_streak=pd.Series(streak_groups, index=data_frame.index)
+    )
+
+
+def add_ladder_position(data_frame: pd.DataFrame) -> pd.DataFrame:
+    """Append a column for teams' current ladder position, one round at a time."""
+    REQUIRED_COLS = INDEX_COLS + ["cum_win_points", "cum_percent"]
+    _validate_required_columns(REQUIRED_COLS, data_frame.columns)
+
+    # Pivot to get round-by-round match points and cumulative percent
+    ladder_pivot_table = data_frame[
+        INDEX_COLS + ["cum_win_points", "cum_percent"]
+    ].pivot_table(
+        index=["year", "round_number"],
+        values=["cum_win_points", "cum_percent"],
+        columns="team",
+        aggfunc={"cum_win_points": np.sum, "cum_percent": np.mean},
+    )
+
+    # To get round-by-round ladder ranks, we sort each round by win points & percent,
+    # then save index numbers
+    ladder_index = []
+    ladder_values = []
+
+    for year_round_idx, round_row in ladder_pivot_table.iterrows():
+        sorted_row = round_row.unstack(level=TEAM_LEVEL).sort_values(
+            ["cum_win_points", "cum_percent"], ascending=False
+        )
+
+        for ladder_idx, team_name in enumerate(sorted_row.index.to_numpy()):
+            ladder_index.append(tuple([team_name, *year_round_idx]))
+            ladder_values.append(ladder_idx + 1)
+
+    ladder_multi_index = pd.MultiIndex.from_tuples(
+        ladder_index, names=tuple(INDEX_COLS)
+    )
+    ladder_position_col = pd.Series(
+        ladder_values, index=ladder_multi_index, name="ladder_position"
+    )
+
+    return data_frame.assign(ladder_position=ladder_position_col)
+
+
+def add_out_of_state(data_frame: pd.DataFrame) -> pd.DataFrame:
+    """Append a column for whether a team is playing out of their home state."""
+    REQUIRED_COLS = {"venue", "team"}
+    _validate_required_columns(REQUIRED_COLS, data_frame.columns)
+
+    venue_state = data_frame["venue"].map(lambda x: CITIES[VENUE_CITIES[x]]["state"])
+    team_state = data_frame["team"].map(lambda x: CITIES[TEAM_CITIES[x]]["state"])
+
+    return data_frame.assign(out_of_state=(team_state != venue_state).astype(int))
+
+
+def add_travel_distance(data_frame: pd.DataFrame) -> pd.DataFrame:
+    """Append column for distances between teams' home cities and match venue cities."""
+    required_cols = {"venue", "team"}
+    _validate_required_columns(required_cols, data_frame.columns)
+
+    venue_lat_long = data_frame["venue"].map(
+        lambda x: (CITIES[VENUE_CITIES[x]]["lat"], CITIES[VENUE_CITIES[x]]["long"])
+    )
+    team_lat_long = data_frame["team"].map(
+        lambda x: (CITIES[TEAM_CITIES[x]]["lat"], CITIES[TEAM_CITIES[x]]["long"])
+    )
+
+    return data_frame.assign(
+        travel_distance=[
+            _haversine_formula(*lats_longs)
+            for lats_longs in zip(venue_lat_long, team_lat_long)
+        ]
+    )
+
+
+def rolling_rate_filled_by_expanding_rate(
+    groups: pd.DataFrame, rolling_window: int
+) -> pd.DataFrame:
+    """Fill blank values from rolling mean with expanding mean values."""
+    expanding_rate = groups.expanding(1).mean()
+    rolling_rate = groups.rolling(window=rolling_window).mean()
+
+    # Both resulting series are the same shape and maintain the same order,
+    # so we can assign expanding's multi-index to rolling to enable fillna
+    rolling_rate.index = expanding_rate.index
+
+    return rolling_rate.fillna(expanding_rate)
+
+
+def _rolling_mean_by_dimension(
+    column_pair: Sequence[str],
+    rolling_windows: Dict[str, int],
+    data_frame: pd.DataFrame,
+) -> pd.Series:
+    dimension_column, metric_column = column_pair
+    rolling_window = (
+        rolling_windows[dimension_column]
+        if dimension_column in rolling_windows.keys()
+        else AVG_SEASON_LENGTH
+    )
+
+    prev_match_values = (
+        data_frame.groupby(["team", dimension_column])[metric_column].shift().fillna(0)
+    )
+    prev_match_values_label = f"prev_{metric_column}_by_{dimension_column}"
+
+    groups = data_frame.assign(**{prev_match_values_label: prev_match_values}).groupby(
+        ["team", dimension_column], group_keys=True
+    )[prev_match_values_label]
+
+    return (
+        rolling_rate_filled_by_expanding_rate(groups, rolling_window)
+        .reset_index(level=[0, 1], drop=True)
+        .dropna()
+        .sort_index()
+        .rename(f"rolling_mean_{metric_column}_by_{dimension_column}")
+    )
+
+
+def calculate_rolling_mean_by_dimension(
+    column_pair: Sequence[str], rolling_windows: Dict[str, int] = ROLLING_WINDOWS
+):
+    """Calculate the rolling mean of a column by dimension, one feature at a time."""
+    return update_wrapper(
+        partial(_rolling_mean_by_dimension, column_pair, rolling_windows),
+        _rolling_mean_by_dimension,
+    )
+
+
+def _aggregate_player_stats_by_team_match_node(
+    player_data_frame: pd.DataFrame, aggregations: List[str] = []
+) -> pd.DataFrame:
+    match_stats_cols = [
+        col
+        for col in player_data_frame.select_dtypes("number")
+        if col not in PLAYER_STATS_COLS + INDEX_COLS
+    ]
+
+    agg_data_frame = (
+        player_data_frame.drop(["player_id", "player_name"], axis=1)
+        .sort_values(INDEX_COLS)
+        .groupby(INDEX_COLS + ["oppo_team", "date"])
+        .aggregate(_aggregations(match_stats_cols, aggregations=aggregations))
+    )
+
+    agg_data_frame.columns = [
+        _agg_column_name(match_stats_cols, column_pair)
+        for column_pair in agg_data_frame.columns.values
+    ]
+
+    return (
+        agg_data_frame.dropna()
+        .reset_index()
+        .sort_values("date")
+        .drop_duplicates(subset=INDEX_COLS, keep="last")
+        .astype({match_col: int for match_col in match_stats_cols})
+        .set_index(INDEX_COLS, drop=False)
+        .rename_axis([None] * len(INDEX_COLS))
+        .sort_index()
+    )
+
+
+def aggregate_player_stats_by_team_match(aggregations: List[str]):
+    """Aggregate player stats with pandas' groupby aggregations."""
+    return update_wrapper(
+        partial(_aggregate_player_stats_by_team_match_node, aggregations=aggregations),
+        _aggregate_player_stats_by_team_match_node,
+    )
+
+
+def clean_roster_data(
+    roster_data: pd.DataFrame, clean_player_data_frame: pd.DataFrame
+) -> pd.DataFrame:
+    """Clean roster data, matching players against the full player history."""
+    if not roster_data.any().any():
+        return roster_data.assign(player_id=[])
+
+    start_of_today = datetime.now(tz=MELBOURNE_TIMEZONE)
+    start_of_week = start_of_today - timedelta(  # pylint: disable=unused-variable
+        days=start_of_today.weekday()
+    )
+
+    roster_data_frame = (
+        roster_data.assign(
+            date=base._parse_dates,  # pylint: disable=protected-access
+            home_team=_translate_team_column("home_team"),
+            away_team=_translate_team_column("away_team"),
+            playing_for=_translate_team_column("playing_for"),
+            surname=lambda df: df["player_name"].str.extract(SURNAME_REGEX),
+        )
+        .drop("player_name", axis=1)
+        .query("date > @start_of_week")
+        .rename(columns={"season": "year"})
+        .merge(
+            clean_player_data_frame[["player_name", "player_id", "playing_for"]].assign(
+                surname=lambda df: df["player_name"].str.extract(SURNAME_REGEX)
+            ),
+            on=["surname", "playing_for"],
+            how="left",
+        )
+        .drop("surname", axis=1)
+        .sort_values("player_id", ascending=False)
+        .drop_duplicates(subset=["player_name"], keep="first")
+    )
+
+    roster_data_frame["player_id"].fillna(
+        roster_data_frame["player_name"], inplace=True
+    )
+
+    return _set_player_index(roster_data_frame)
+
+
+def _oppo_features(data_frame: pd.DataFrame, cols_to_convert) -> pd.DataFrame:
+    oppo_cols = {col_name: f"oppo_{col_name}" for col_name in cols_to_convert}
+    column_translations = {**{"oppo_team": "team"}, **oppo_cols}
+
+    return (
+        data_frame.reset_index(drop=True)
+        .loc[:, ["year", "round_number", "oppo_team"] + list(cols_to_convert)]
+        .rename(columns=column_translations)
+        .set_index(INDEX_COLS)
+        .sort_index()
+        .loc[:, list(oppo_cols.values())]
+    )
+
+
+def _add_oppo_features_node(
+    data_frame: pd.DataFrame,
+    match_cols: List[str] = [],
+    oppo_feature_cols: List[str] = [],
+) -> pd.DataFrame:
+    cols_to_convert = (
+        oppo_feature_cols
+        if any(oppo_feature_cols)
+        else [col for col in data_frame.columns if col not in match_cols]
+    )
+
+    transform_data_frame = (
+        data_frame.copy()
+        .set_index(INDEX_COLS, drop=False)
+        .rename_axis([None] * len(INDEX_COLS))
+        .sort_index()
+    )
+
+    return pd.concat(
+        [transform_data_frame, _oppo_features(transform_data_frame, cols_to_convert)],
+        axis=1,
+    )
+
+
+def add_oppo_features(match_cols: List[str] = [], oppo_feature_cols: List[str] = []):
+    """Add oppo columns by re-indexing a copy of the data on opponent team."""
+    return update_wrapper(
+        partial(
+            _add_oppo_features_node,
+            match_cols=match_cols,
+            oppo_feature_cols=oppo_feature_cols,
+        ),
+        _add_oppo_features_node,
+    )
@@ -0,0 +1,110 @@
+"""Generate realistic synthetic raw data for benchmarking pipelines."""
+
+from typing import Any, Dict, List
+
+import pandas as pd
+from candystore import CandyStore
+
+from augury.types import YearRange
+from augury.settings import TEAM_NAMES, TEAM_TRANSLATIONS
+
+
+ROSTER_COLS = [
+    "player_name",
+    "playing_for",
+    "home_team",
+    "away_team",
+    "date",
+    "match_id",
+    "season",
+]
+# Data sets that are fetched from remote sources when running pipelines
+REMOTE_DATA_SETS = ["remote_betting_data", "remote_match_data", "remote_player_data"]
+
+
+def _translate_team(team_name: str) -> str:
+    return TEAM_TRANSLATIONS.get(team_name, team_name)
+
+
+def _filter_teams(data_frame: pd.DataFrame, teams: List[str]) -> pd.DataFrame:
+    # Both teams have to be included to keep full matches, which keeps data sets
+    # valid for joining home & away rows
+    return data_frame.loc[
+        data_frame["home_team"].map(_translate_team).isin(teams)
+        & data_frame["away_team"].map(_translate_team).isin(teams)
+    ]
+
+
+def _fake_roster_data(
+    fixture_data: pd.DataFrame, player_data: pd.DataFrame
+) -> pd.DataFrame:
+    last_season_players = (
+        player_data.query("season == season.max()")
+        .assign(
+            player_name=lambda df: df["first_name"] + " " + df["surname"],
+            team=lambda df: df["playing_for"].map(_translate_team),
+        )
+        .drop_duplicates(subset=["player_name", "team"])
+        .loc[:, ["player_name", "playing_for", "team"]]
+    )
+
+    # Rosters are only announced for the next round
+    next_round_fixture_data = fixture_data.query("round == round.min()")
+
+    return (
+        pd.concat(
+            [
+                next_round_fixture_data.assign(
+                    team=next_round_fixture_data[team_col].map(_translate_team),
+                    match_id=next_round_fixture_data.index.astype(str),
+                )
+                for team_col in ["home_team", "away_team"]
+            ],
+            sort=False,
+        )
+        .merge(last_season_players, on="team", how="inner")
+        .astype({"date": str})
+        .loc[:, ROSTER_COLS]
+    )
+
+
+def fake_raw_data(seasons: YearRange, n_teams: int = len(TEAM_NAMES)) -> Dict[str, Any]:
+    """Generate realistic raw data for all of the pipelines' input data sets.
+
+    Params
+    ------
+    seasons: Seasons with played matches (first year inclusive, last year exclusive,
+        per `range` function). The fixture is for the season after,
+        and the rosters are for the fixture's first round.
+    n_teams: Maximum number of teams to include. We keep the teams that play
+        the most matches, and only matches between them.
+
+    Returns
+    -------
+    Dictionary of input data set names mapped to their data.
+    """
+    candy = CandyStore(seasons=seasons)
+    match_data = candy.match_results()
+    team_match_counts = (
+        pd.concat([match_data["home_team"], match_data["away_team"]])
+        .map(_translate_team)
+        .value_counts()
+    )
+    teams = list(team_match_counts.index[:n_teams])
+
+    player_data = candy.players().pipe(_filter_teams, teams)
+    fixture_data = (
+        CandyStore(seasons=(max(seasons), max(seasons) + 1))
+        .fixtures()
+        .pipe(_filter_teams, teams)
+        .reset_index(drop=True)
+    )
+
+    return {
+        "match_data": match_data.pipe(_filter_teams, teams),
+        "betting_data": candy.betting_odds().pipe(_filter_teams, teams),
+        "player_data": player_data,
+        "fixture_data": fixture_data.to_dict("records"),
+        "roster_data": _fake_roster_data(fixture_data, player_data).to_dict("records"),
+        **{data_set_name: [] for data_set_name in REMOTE_DATA_SETS},
+    }
@@ -39,7 +39,7 @@ with open("requirements.txt", "r", encoding="utf-8") as f:
 setup(
     name="Augury",
     version="0.1",
-    packages=find_packages(exclude=["tests"]),
+    packages=find_packages(exclude=["tests", "benchmarks"]),
     entry_points={"console_scripts": [entry_point]},
     install_requires=requires,
     extras_require={
@@ -10,6 +10,7 @@ from kedro.pipeline import Pipeline, node
 from augury.nodes import common, match
 from augury.ml_estimators.base_ml_estimator import BaseMLEstimator
 from augury.sklearn.preprocessing import ColumnDropper
+from augury.data_cache import MLDataCache
 from augury.ml_data import MLData
 from augury.settings import (
     TEAM_NAMES,
@@ -77,6 +78,9 @@ class FakeEstimatorData(MLData):
                 "data_set": data_set,
                 "train_year_range": (max_year,),
                 "test_year_range": (max_year, max_year + 1),
+                # We change the loaded data's years, so features calculated from it
+                # can't be shared with objects that have a different max year
+                "cache": MLDataCache(),
             },
             **kwargs,
         }
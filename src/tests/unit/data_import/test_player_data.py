@@ -40,3 +40,23 @@ class TestPlayerData(TestCase):
         open.assert_called_with(PLAYER_DATA_PATH, "w")
         dump_args, _dump_kwargs = json.dump.call_args
         self.assertIn(self.fake_player_data, dump_args)
+
+    @patch(f"{PLAYER_DATA_MODULE_PATH}.fetch_player_data")
+    @patch("os.makedirs")
+    @patch("builtins.open", mock_open())
+    @patch("json.dump")
+    def test_save_player_data_by_season(
+        self, _mock_json_dump, _mock_makedirs, mock_fetch_data
+    ):
+        mock_fetch_data.return_value = self.fake_player_data.to_dict("records")
+
+        save_player_data(
+            start_date=START_DATE, end_date=END_DATE, verbose=0, by_season=True
+        )
+
+        self.assertEqual(json.dump.call_count, END_YEAR - START_YEAR)
+        open.assert_called_with(
+            os.path.join(RAW_DATA_DIR, "player-data", f"{END_YEAR - 1}.json"), "w"
+        )
+        dump_args, _dump_kwargs = json.dump.call_args
+        self.assertEqual({row["season"] for row in dump_args[0]}, {END_YEAR - 1})
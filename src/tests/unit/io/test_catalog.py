@@ -0,0 +1,88 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from unittest import TestCase
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.io.core import DataSetError
+
+from augury.io.catalog import (
+    data_set_signature,
+    is_partitioned_by_year,
+    load_year_partitions,
+)
+from augury.io.columnar_data_set import ColumnarDataSet
+
+
+YEARS = [2015, 2016, 2017]
+ROWS_PER_YEAR = 4
+
+
+class TestCatalog(TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+
+        self.data_frame = pd.DataFrame(
+            {
+                "year": np.repeat(YEARS, ROWS_PER_YEAR),
+                "score": np.random.randint(40, 150, len(YEARS) * ROWS_PER_YEAR),
+            }
+        )
+
+        columnar_data_set = ColumnarDataSet(
+            filepath=os.path.join(temp_dir.name, "model-data")
+        )
+        columnar_data_set.save(self.data_frame)
+
+        self.catalog = DataCatalog(
+            {
+                "columnar_data": columnar_data_set,
+                "memory_data": MemoryDataSet(data=self.data_frame),
+            }
+        )
+
+    def test_load_year_partitions(self):
+        with self.subTest("with a data set partitioned by year"):
+            self.assertTrue(is_partitioned_by_year(self.catalog, "columnar_data"))
+
+            pd.testing.assert_frame_equal(
+                load_year_partitions(self.catalog, "columnar_data", [2016]),
+                self.data_frame.query("year == 2016").reset_index(drop=True),
+            )
+
+        with self.subTest("with a data set that isn't partitioned"):
+            self.assertFalse(is_partitioned_by_year(self.catalog, "memory_data"))
+
+            pd.testing.assert_frame_equal(
+                load_year_partitions(self.catalog, "memory_data", [2016]),
+                self.data_frame,
+            )
+
+    def test_data_set_signature(self):
+        signature = data_set_signature(self.catalog, "columnar_data")
+        self.assertIsNotNone(signature)
+
+        with self.subTest("when the data set's files change"):
+            self.catalog.save("columnar_data", self.data_frame.query("year > 2015"))
+
+            self.assertNotEqual(
+                data_set_signature(self.catalog, "columnar_data"), signature
+            )
+
+        with self.subTest("with a data set that isn't saved as files"):
+            self.assertIsNone(data_set_signature(self.catalog, "memory_data"))
+
+        with self.subTest("with a columnar data set that hasn't been saved"):
+            self.catalog.add(
+                "unsaved_data",
+                ColumnarDataSet(filepath=os.path.join(self.temp_dir, "unsaved-data")),
+            )
+
+            with self.assertRaises(DataSetError):
+                data_set_signature(self.catalog, "unsaved_data")
@@ -0,0 +1,110 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from unittest import TestCase
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from kedro.io.core import DataSetError
+
+from augury.io.columnar_data_set import ColumnarDataSet, SCHEMA_FILENAME
+
+
+YEARS = [2015, 2016, 2017]
+ROWS_PER_YEAR = 4
+
+
+class TestColumnarDataSet(TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        self.filepath = os.path.join(temp_dir.name, "model-data")
+        self.data_set = ColumnarDataSet(filepath=self.filepath)
+
+        row_count = len(YEARS) * ROWS_PER_YEAR
+        teams = np.random.choice(["Richmond", "Carlton"], row_count).astype(object)
+        teams[0] = np.nan
+
+        self.data_frame = pd.DataFrame(
+            {
+                "team": teams,
+                "year": np.repeat(YEARS, ROWS_PER_YEAR),
+                "round_number": np.tile(np.arange(1, ROWS_PER_YEAR + 1), len(YEARS)),
+                "date": pd.date_range(
+                    "2015-03-20 19:40",
+                    periods=row_count,
+                    freq="7D",
+                    tz="Australia/Melbourne",
+                ),
+                "score": np.random.randint(40, 150, row_count),
+                "elo_rating": np.random.random(row_count),
+                "at_home": np.random.choice([True, False], row_count),
+                "round_type": pd.Categorical(
+                    np.random.choice(["Regular", "Finals"], row_count)
+                ),
+            }
+        )
+
+    def test_save(self):
+        self.data_set.save(self.data_frame)
+
+        self.assertTrue(self.data_set.exists())
+        self.assertTrue(os.path.isfile(os.path.join(self.filepath, SCHEMA_FILENAME)))
+
+        for year in YEARS:
+            self.assertTrue(os.path.isdir(os.path.join(self.filepath, f"year={year}")))
+
+        with self.subTest("when data for some years is no longer there"):
+            self.data_set.save(self.data_frame.query("year > @YEARS[0]"))
+
+            self.assertFalse(
+                os.path.exists(os.path.join(self.filepath, f"year={YEARS[0]}"))
+            )
+
+        with self.subTest("without a partition column"):
+            with self.assertRaises(DataSetError):
+                ColumnarDataSet(
+                    filepath=self.filepath, partition_col="season"
+                ).save(self.data_frame)
+
+    def test_load(self):
+        self.assertFalse(self.data_set.exists())
+
+        self.data_set.save(self.data_frame)
+        loaded_data_frame = self.data_set.load()
+
+        pd.testing.assert_frame_equal(loaded_data_frame, self.data_frame)
+
+        with self.subTest("with data saved out of partition order"):
+            shuffled_data_frame = self.data_frame.sample(frac=1)
+            self.data_set.save(shuffled_data_frame)
+
+            # Rows are in partition order, but otherwise in their original order
+            pd.testing.assert_frame_equal(
+                self.data_set.load(),
+                shuffled_data_frame.sort_values("year", kind="mergesort").reset_index(
+                    drop=True
+                ),
+            )
+
+    def test_load_partitions(self):
+        self.data_set.save(self.data_frame)
+
+        with self.subTest("with a range of years"):
+            loaded_data_frame = self.data_set.load_partitions(range(2016, 2020))
+
+            pd.testing.assert_frame_equal(
+                loaded_data_frame,
+                self.data_frame.query("year >= 2016").reset_index(drop=True),
+            )
+
+        with self.subTest("with years without partitions"):
+            loaded_data_frame = self.data_set.load_partitions([1990])
+
+            self.assertEqual(len(loaded_data_frame), 0)
+            pd.testing.assert_series_equal(
+                loaded_data_frame.dtypes, self.data_frame.dtypes
+            )
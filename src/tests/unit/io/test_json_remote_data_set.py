@@ -4,7 +4,11 @@
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
-from augury.io.json_remote_data_set import JSONRemoteDataSet, DATE_RANGE_TYPE
+from augury.io.json_remote_data_set import (
+    JSONRemoteDataSet,
+    DATE_RANGE_TYPE,
+    REMOTE_DATA_VERSIONS,
+)
 
 
 class TestJSONRemoteDataSet(TestCase):
@@ -41,6 +45,23 @@ class TestJSONRemoteDataSet(TestCase):
             data_set.load()
             self.data_source.assert_called_with()
 
+        with self.subTest("when the remote data changes"):
+            data_source = MagicMock(return_value=[{"team": "Richmond"}])
+            data_set = JSONRemoteDataSet(data_source=data_source, round_number=1)
+            data_set.load()
+            version = REMOTE_DATA_VERSIONS.version
+
+            data_set.load()
+            self.assertEqual(REMOTE_DATA_VERSIONS.version, version)
+
+            # Different arguments fetch different data, so it isn't a change
+            JSONRemoteDataSet(data_source=data_source, round_number=2).load()
+            self.assertEqual(REMOTE_DATA_VERSIONS.version, version)
+
+            data_source.return_value = [{"team": "Carlton"}]
+            data_set.load()
+            self.assertEqual(REMOTE_DATA_VERSIONS.version, version + 1)
+
         with self.subTest("when date_range_type is unknown"):
             with self.assertRaisesRegex(
                 AssertionError, "Argument date_range_type must be None or one of"
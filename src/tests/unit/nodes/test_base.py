@@ -0,0 +1,63 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from unittest import TestCase
+import os
+from datetime import time
+
+import pandas as pd
+import numpy as np
+import pytz
+
+from benchmarks import reference_nodes
+from augury.nodes import base
+from augury.settings import BASE_DIR
+
+
+TEST_DATA_DIR = os.path.join(BASE_DIR, "src/tests/fixtures")
+
+
+class TestBase(TestCase):
+    def setUp(self):
+        self.data_frame = pd.read_csv(
+            os.path.join(TEST_DATA_DIR, "fitzroy_match_results.csv")
+        )
+
+    def test_parse_dates(self):
+        parsed_dates = base._parse_dates(self.data_frame)
+
+        self.assertEqual(parsed_dates.dt.tz, pytz.UTC)
+        self.assertFalse((parsed_dates.dt.time == time()).any())
+        pd.testing.assert_series_equal(
+            parsed_dates,
+            reference_nodes._parse_dates(self.data_frame),
+            check_names=False,
+        )
+
+        with self.subTest("with a separate time column"):
+            data_frame = self.data_frame.assign(
+                local_start_time=np.random.choice(
+                    ["1310", "1445", "1920", "19:40"], len(self.data_frame)
+                )
+            )
+
+            pd.testing.assert_series_equal(
+                base._parse_dates(data_frame, time_col="local_start_time"),
+                reference_nodes._parse_dates(data_frame, time_col="local_start_time"),
+                check_names=False,
+            )
+
+        with self.subTest("without a venue column"):
+            data_frame = self.data_frame.drop("venue", axis=1)
+
+            pd.testing.assert_series_equal(
+                base._parse_dates(data_frame),
+                reference_nodes._parse_dates(data_frame),
+                check_names=False,
+            )
+
+        with self.subTest("with an unknown venue"):
+            data_frame = self.data_frame.assign(venue="Not a Real Stadium")
+
+            with self.assertRaisesRegex(AssertionError, "Could not find timezone"):
+                base._parse_dates(data_frame)
@@ -10,6 +10,7 @@ import numpy as np
 from candystore import CandyStore
 from dateutil import parser
 
+from benchmarks import reference_nodes
 from tests.helpers import ColumnAssertionMixin
 from augury.nodes import common, base, match
 from augury.settings import INDEX_COLS
@@ -255,6 +256,35 @@ class TestCommon(TestCase, ColumnAssertionMixin):
                 0,
             )
 
+        with self.subTest("with an opponent index"):
+            oppo_index = common.build_oppo_index(valid_data_frame)
+
+            for transform_kwargs in [
+                {"match_cols": match_cols},
+                {"oppo_feature_cols": oppo_feature_cols},
+            ]:
+                pd.testing.assert_frame_equal(
+                    common.add_oppo_features(**transform_kwargs)(
+                        valid_data_frame, oppo_index
+                    ),
+                    reference_nodes.add_oppo_features(**transform_kwargs)(
+                        valid_data_frame
+                    ),
+                )
+
+        with self.subTest("with rows that don't match the opponent index"):
+            oppo_index = common.build_oppo_index(valid_data_frame)
+            # Missing an opponent row, and no longer in index order
+            changed_data_frame = valid_data_frame.iloc[1:].sample(frac=1)
+            transform_func = common.add_oppo_features(match_cols=match_cols)
+
+            pd.testing.assert_frame_equal(
+                transform_func(changed_data_frame, oppo_index),
+                reference_nodes.add_oppo_features(match_cols=match_cols)(
+                    changed_data_frame
+                ),
+            )
+
         with self.subTest(match_cols=match_cols, oppo_feature_cols=oppo_feature_cols):
             with self.assertRaises(ValueError):
                 transform_func = common.add_oppo_features(
@@ -267,6 +297,36 @@ class TestCommon(TestCase, ColumnAssertionMixin):
             feature_function=transform_func,
         )
 
+    def test_build_oppo_index(self):
+        oppo_index = common.build_oppo_index(self.data_frame)
+
+        self.assertTrue(oppo_index.index.equals(self.data_frame.index))
+
+        # Each row's opponent row has it as its opponent
+        oppo_data_frame = self.data_frame.iloc[oppo_index]
+        self.assertTrue(
+            (oppo_data_frame["team"].to_numpy() == self.data_frame["oppo_team"]).all()
+        )
+        self.assertTrue(
+            (oppo_index.iloc[oppo_index].to_numpy() == np.arange(len(oppo_index))).all()
+        )
+
+        with self.subTest("with a missing opponent row"):
+            oppo_index = common.build_oppo_index(self.data_frame.iloc[1:])
+
+            self.assertTrue((oppo_index == -1).all())
+
+        with self.subTest("when not sorted by index"):
+            oppo_index = common.build_oppo_index(self.data_frame.iloc[::-1])
+
+            self.assertTrue((oppo_index == -1).all())
+
+        self._assert_required_columns(
+            req_cols=INDEX_COLS + ["oppo_team"],
+            valid_data_frame=self.data_frame,
+            feature_function=common.build_oppo_index,
+        )
+
     def test_finalize_data(self):
         data_frame = self.data_frame.assign(nans=None).astype({"year": "str"})
 
@@ -6,11 +6,20 @@ from faker import Faker
 import pandas as pd
 from candystore import CandyStore
 
+from benchmarks import reference_nodes
 from augury.nodes import feature_calculation, match, common
 
 
 FAKE = Faker()
 YEAR_RANGE = (2015, 2016)
+DIMENSION_COLUMN_PAIRS = [
+    ("oppo_team", "margin"),
+    ("oppo_team", "result"),
+    ("oppo_team", "score"),
+    ("venue", "margin"),
+    ("venue", "result"),
+    ("venue", "score"),
+]
 
 
 def assert_required_columns(
@@ -68,6 +77,46 @@ class TestFeatureCalculations(TestCase):
         # It doesn't have any blank values
         self.assertFalse(rolling_values.isna().any().any())
 
+        data_frame = self.data_frame.set_index(
+            ["team", "year", "round_number"], drop=False
+        )
+        # Missing values get skipped by rolling & expanding means
+        data_frame.loc[data_frame.index[::7], "score"] = None
+
+        group_cases = [
+            ("with a series", data_frame["score"].groupby(level=0)),
+            (
+                "with a data frame",
+                data_frame[["score", "oppo_score"]].groupby(data_frame["team"]),
+            ),
+            (
+                "with multiple group keys",
+                data_frame[["score", "oppo_score"]].groupby(
+                    [data_frame["team"], data_frame["venue"]]
+                ),
+            ),
+        ]
+
+        for case_label, case_groups in group_cases:
+            with self.subTest(f"matches the pandas rolling calculation {case_label}"):
+                expected_values = reference_nodes.rolling_rate_filled_by_expanding_rate(
+                    case_groups, window
+                )
+                rolling_values = (
+                    feature_calculation.rolling_rate_filled_by_expanding_rate(
+                        case_groups, window
+                    )
+                )
+
+                if isinstance(expected_values, pd.Series):
+                    pd.testing.assert_series_equal(
+                        rolling_values, expected_values, check_exact=True
+                    )
+                else:
+                    pd.testing.assert_frame_equal(
+                        rolling_values, expected_values, check_exact=True
+                    )
+
     def test_calculate_rolling_rate(self):
         calc_function = feature_calculation.calculate_rolling_rate(("score",))
 
@@ -130,6 +179,46 @@ class TestFeatureCalculations(TestCase):
             rolling_oppo_team_score.name, "rolling_mean_score_by_oppo_team"
         )
 
+        with self.subTest("matches the pandas rolling calculation"):
+            pd.testing.assert_series_equal(
+                rolling_oppo_team_score,
+                reference_nodes.calculate_rolling_mean_by_dimension(
+                    ("oppo_team", "score")
+                )(self.data_frame),
+                check_exact=True,
+            )
+
+        with self.subTest("with multiple metrics fused in a feature calculator"):
+            data_frame = self.data_frame.pipe(match.add_result).pipe(match.add_margin)
+            # Missing values get excluded from groups
+            data_frame.loc[data_frame.index[::10], "venue"] = None
+            calculators = [
+                (
+                    feature_calculation.calculate_rolling_mean_by_dimension,
+                    DIMENSION_COLUMN_PAIRS,
+                )
+            ]
+
+            calculated_data_frame = feature_calculation.feature_calculator(calculators)(
+                data_frame
+            )
+            expected_data_frame = pd.concat(
+                [
+                    data_frame,
+                    *[
+                        reference_nodes.calculate_rolling_mean_by_dimension(
+                            column_pair
+                        )(data_frame)
+                        for column_pair in DIMENSION_COLUMN_PAIRS
+                    ],
+                ],
+                axis=1,
+            )
+
+            pd.testing.assert_frame_equal(
+                calculated_data_frame, expected_data_frame, check_exact=True
+            )
+
     def test_calculate_addition(self):
         calc_function = feature_calculation.calculate_addition(("score", "oppo_score"))
 
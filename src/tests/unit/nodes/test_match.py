@@ -13,6 +13,7 @@ from candystore import CandyStore
 
 from tests.helpers import ColumnAssertionMixin
 from tests.fixtures import data_factories
+from benchmarks import reference_nodes
 from augury.nodes import match, common
 from augury.settings import BASE_DIR
 
@@ -22,6 +23,7 @@ FAKE = Faker()
 TEST_DATA_DIR = os.path.join(BASE_DIR, "src/tests/fixtures")
 YEAR_RANGE = (2015, 2016)
 MAX_MATCHES_PER_ROUND = 9
+N_RANDOM_RESULT_SETS = 20
 
 
 class TestMatch(TestCase, ColumnAssertionMixin):
@@ -135,6 +137,14 @@ class TestMatch(TestCase, ColumnAssertionMixin):
             col_diff=2,
         )
 
+        with self.subTest("matches the match-by-match calculation"):
+            elo_data_frame = match.add_elo_rating(valid_data_frame)
+            reference_elo_data_frame = reference_nodes.add_elo_rating(valid_data_frame)
+
+            pd.testing.assert_frame_equal(
+                elo_data_frame, reference_elo_data_frame, check_exact=True
+            )
+
     def test_add_out_of_state(self):
         feature_function = match.add_out_of_state
         valid_data_frame = self.data_frame
@@ -146,6 +156,19 @@ class TestMatch(TestCase, ColumnAssertionMixin):
             feature_function=feature_function,
         )
 
+        with self.subTest("matches the row-by-row calculation"):
+            pd.testing.assert_frame_equal(
+                match.add_out_of_state(valid_data_frame),
+                reference_nodes.add_out_of_state(valid_data_frame),
+                check_exact=True,
+            )
+
+        with self.subTest("with an unknown venue"):
+            with self.assertRaises(KeyError):
+                match.add_out_of_state(
+                    valid_data_frame.assign(venue="Not a real place")
+                )
+
     def test_add_travel_distance(self):
         feature_function = match.add_travel_distance
         valid_data_frame = self.data_frame
@@ -157,6 +180,19 @@ class TestMatch(TestCase, ColumnAssertionMixin):
             feature_function=feature_function,
         )
 
+        with self.subTest("matches the row-by-row calculation"):
+            pd.testing.assert_frame_equal(
+                match.add_travel_distance(valid_data_frame),
+                reference_nodes.add_travel_distance(valid_data_frame),
+                check_exact=True,
+            )
+
+        with self.subTest("with an unknown team"):
+            with self.assertRaises(KeyError):
+                match.add_travel_distance(
+                    valid_data_frame.assign(team="Not a real place")
+                )
+
     def test_add_result(self):
         feature_function = match.add_result
         valid_data_frame = self.data_frame
@@ -247,6 +283,35 @@ class TestMatch(TestCase, ColumnAssertionMixin):
             feature_function=feature_function,
         )
 
+        with self.subTest("matches the match-by-match calculation"):
+            sorted_data_frame = self.data_frame.sort_index()
+
+            for _ in range(N_RANDOM_RESULT_SETS):
+                # Random mixes of wins, draws, losses, and missing results,
+                # with the rate of each varying between result sets
+                result_rates = np.random.dirichlet(np.ones(4))
+                random_data_frame = sorted_data_frame.assign(
+                    prev_match_result=np.random.choice(
+                        [1.0, 0.5, 0.0, np.nan], len(sorted_data_frame), p=result_rates
+                    )
+                )
+
+                pd.testing.assert_frame_equal(
+                    match.add_win_streak(random_data_frame),
+                    reference_nodes.add_win_streak(random_data_frame),
+                    check_exact=True,
+                )
+
+        with self.subTest("with a negative result"):
+            invalid_data_frame = valid_data_frame.assign(
+                prev_match_result=lambda df: df["prev_match_result"].where(
+                    df.index != df.index[-1], -1
+                )
+            )
+
+            with self.assertRaises(ValueError):
+                match.add_win_streak(invalid_data_frame)
+
     def test_add_cum_percent(self):
         feature_function = match.add_cum_percent
         valid_data_frame = self.data_frame.assign(
@@ -276,6 +341,32 @@ class TestMatch(TestCase, ColumnAssertionMixin):
             feature_function=feature_function,
         )
 
+        with self.subTest("matches the round-by-round calculation"):
+            ladder_position = match.add_ladder_position(valid_data_frame)
+            reference_ladder_position = reference_nodes.add_ladder_position(
+                valid_data_frame
+            )
+
+            pd.testing.assert_frame_equal(
+                ladder_position, reference_ladder_position, check_exact=True
+            )
+
+        with self.subTest("with ties and missing values"):
+            tied_data_frame = valid_data_frame.assign(
+                cum_percent=lambda df: df["cum_percent"]
+                .round(1)
+                .where(np.random.ranf(len(df)) > 0.1),
+                cum_win_points=lambda df: (df["cum_win_points"] // 20)
+                .astype(float)
+                .where(np.random.ranf(len(df)) > 0.1),
+            )
+
+            pd.testing.assert_frame_equal(
+                match.add_ladder_position(tied_data_frame),
+                reference_nodes.add_ladder_position(tied_data_frame),
+                check_exact=True,
+            )
+
     def test_add_elo_pred_win(self):
         feature_function = match.add_elo_pred_win
         valid_data_frame = self.data_frame.assign(
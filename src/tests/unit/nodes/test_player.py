@@ -3,7 +3,7 @@
 
 from unittest import TestCase
 import os
-from datetime import time
+from datetime import time, date
 
 import pandas as pd
 from faker import Faker
@@ -12,6 +12,7 @@ import pytz
 from candystore import CandyStore
 
 from tests.helpers import ColumnAssertionMixin
+from benchmarks import reference_nodes
 from augury.nodes import player, common
 from augury.settings import INDEX_COLS, BASE_DIR
 
@@ -58,7 +59,9 @@ class TestPlayer(TestCase, ColumnAssertionMixin):
             .rename(columns={"id": "player_id"})
         )
 
-        clean_data = player.clean_roster_data(roster_data, dummy_player_data)
+        clean_data = player.clean_roster_data(
+            roster_data, player.build_roster_player_index(dummy_player_data)
+        )
 
         self.assertIsInstance(clean_data, pd.DataFrame)
 
@@ -70,6 +73,59 @@ class TestPlayer(TestCase, ColumnAssertionMixin):
         self.assertEqual(clean_data["date"].dt.tz, pytz.UTC)
         self.assertFalse((clean_data["date"].dt.time == time()).any())
 
+        with self.subTest("matches players the same way as the full player history"):
+            next_year = str(date.today().year + 1)
+            # Past rosters get filtered out
+            future_roster_data = roster_data.assign(
+                date=roster_data["date"].str.replace("2019", next_year),
+                season=int(next_year),
+            )
+            # Leaving out some roster players to make them new to the league,
+            # and duplicating others to give them multiple matches
+            # and older namesakes
+            roster_players = roster_data.iloc[::2].assign(
+                playing_for=lambda df: df["playing_for"].map(
+                    player._translate_team_name  # pylint: disable=protected-access
+                ),
+                player_id=lambda df: (df.index.values + 1000).astype(str),
+            )
+            player_history = pd.concat(
+                [
+                    roster_players,
+                    roster_players,
+                    roster_players.iloc[::3].assign(
+                        player_id=lambda df: (df.index.values + 100).astype(str)
+                    ),
+                ]
+            ).loc[:, ["player_name", "player_id", "playing_for"]]
+
+            pd.testing.assert_frame_equal(
+                player.clean_roster_data(
+                    future_roster_data,
+                    player.build_roster_player_index(player_history),
+                ).sort_index(),
+                reference_nodes.clean_roster_data(
+                    future_roster_data, player_history
+                ).sort_index(),
+            )
+
+    def test_build_roster_player_index(self):
+        player_data = pd.DataFrame(
+            {
+                "player_name": ["Nic Naitanui", "Nic Naitanui", "Tom Hawkins"],
+                "player_id": ["1", "1", "2"],
+                "playing_for": ["West Coast", "West Coast", "Geelong"],
+            }
+        )
+
+        roster_player_index = player.build_roster_player_index(player_data)
+
+        # It has one row per player
+        self.assertEqual(len(roster_player_index), 2)
+        self.assertEqual(
+            roster_player_index.loc[("Naitanui", "West Coast"), "player_id"], "1"
+        )
+
     def test_add_last_year_brownlow_votes(self):
         valid_data_frame = self.data_frame.rename(
             columns={"season": "year", "id": "player_id"}
@@ -226,3 +282,41 @@ class TestPlayer(TestCase, ColumnAssertionMixin):
             valid_data_frame=valid_data_frame,
             feature_function=aggregation_func,
         )
+
+        float_data_frame = valid_data_frame.assign(
+            **{
+                stats_col: np.random.exponential(5, len(valid_data_frame))
+                for stats_col in player.PLAYER_STATS_COLS
+            }
+        ).assign(
+            # Constant values should get a skew of zero, despite floating-point error
+            last_year_brownlow_votes=0.1
+        )
+
+        pipeline_aggregations = ["sum", "max", "min", "skew", "std"]
+        aggregation_cases = [
+            ("with integer stats", valid_data_frame, pipeline_aggregations),
+            ("with float stats", float_data_frame, pipeline_aggregations),
+            ("with a pandas-only aggregation", valid_data_frame, ["sum", "median"]),
+        ]
+
+        with self.subTest("with categorical team names"):
+            categorical_data_frame = valid_data_frame.astype(
+                {"team": player.TEAM_DTYPE, "oppo_team": player.TEAM_DTYPE}
+            )
+
+            pd.testing.assert_frame_equal(
+                aggregation_func(categorical_data_frame),
+                aggregation_func(valid_data_frame),
+            )
+
+        for case_label, data_frame, aggregations in aggregation_cases:
+            with self.subTest(f"matches pandas' aggregations {case_label}"):
+                pd.testing.assert_frame_equal(
+                    player.aggregate_player_stats_by_team_match(aggregations)(
+                        data_frame
+                    ),
+                    reference_nodes.aggregate_player_stats_by_team_match(aggregations)(
+                        data_frame
+                    ),
+                )
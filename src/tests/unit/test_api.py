@@ -12,8 +12,10 @@ from candystore import CandyStore
 from tests.fixtures.fake_estimator import create_fake_pipeline
 from tests.fixtures import data_factories
 from augury.data_import import match_data
+from augury.io import JSONRemoteDataSet
 from augury import api
 from augury import settings
+from augury.result_cache import PREDICTION_CACHE
 from augury.types import MLModelDict
 
 
@@ -42,6 +44,9 @@ REQUIRED_MATCH_COLUMNS = {
 
 
 class TestApi(TestCase):
+    def setUp(self):
+        PREDICTION_CACHE.clear()
+
     # It doesn't matter what data Predictor returns since this method doesn't check
     @patch("augury.api.Predictor.make_predictions")
     @patch("augury.api.ML_MODELS", FAKE_ML_MODELS)
@@ -65,11 +70,55 @@ class TestApi(TestCase):
         self.assertGreater(len(data[0].keys()), 0)
         mock_make_predictions.assert_called_with(FAKE_ML_MODELS)
 
+        with self.subTest("when the same predictions were already made"):
+            mock_make_predictions.reset_mock()
+            cached_response = api.make_predictions(
+                YEAR_RANGE, ml_model_names=["fake_estimator"]
+            )
+            mock_make_predictions.assert_not_called()
+            self.assertEqual(cached_response, response)
+
         with self.subTest(ml_model_names=None):
+            PREDICTION_CACHE.clear()
             mock_make_predictions.reset_mock()
             api.make_predictions(YEAR_RANGE, ml_model_names=None)
             mock_make_predictions.assert_called_with(FAKE_ML_MODELS)
 
+    @patch("augury.api.Predictor.make_predictions")
+    @patch("augury.api.ML_MODELS", FAKE_ML_MODELS)
+    @patch("augury.api.PIPELINE_NAMES", {"fake_data": "fake"})
+    @patch(
+        "augury.run.create_pipelines",
+        MagicMock(return_value={"fake": create_fake_pipeline()}),
+    )
+    def test_make_predictions_with_changed_remote_data(self, mock_make_predictions):
+        mock_make_predictions.return_value = CandyStore(seasons=YEAR_RANGE).fixtures()
+
+        for data_set_name in ["roster_data", "remote_match_data"]:
+            with self.subTest(data_set_name=data_set_name):
+                PREDICTION_CACHE.clear()
+                mock_make_predictions.reset_mock()
+                remote_data = MagicMock(return_value=[{"data_set": data_set_name}])
+                remote_data_set = JSONRemoteDataSet(data_source=remote_data)
+
+                # Running the pipelines is the only time that requests fetch
+                # remote data
+                with patch(
+                    "augury.api._run_pipelines",
+                    side_effect=lambda *_args: remote_data_set.load(),
+                ):
+                    api.make_predictions(YEAR_RANGE)
+                    api.make_predictions(YEAR_RANGE)
+                    self.assertEqual(mock_make_predictions.call_count, 1)
+
+                    # Another request fetches the remote data after it changes
+                    remote_data.return_value = [{"data_set": f"new_{data_set_name}"}]
+                    api.make_predictions(YEAR_RANGE, train=True)
+                    self.assertEqual(mock_make_predictions.call_count, 2)
+
+                    api.make_predictions(YEAR_RANGE)
+                    self.assertEqual(mock_make_predictions.call_count, 3)
+
     def test_fetch_fixture_data(self):
         PROCESSED_FIXTURE_FIELDS = [
             "date",
@@ -137,6 +186,7 @@ class TestApi(TestCase):
 
         data_importer = match_data
         data_importer.fetch_match_results_data = Mock(return_value=fake_match_results)
+        PREDICTION_CACHE.get_or_compute("request_key", "digest", lambda: {"data": []})
 
         response = api.fetch_match_results_data(
             round_number, data_import=data_importer, verbose=0
@@ -144,6 +194,9 @@ class TestApi(TestCase):
 
         match_results = response["data"]
 
+        # New match results make cached predictions stale
+        self.assertEqual(PREDICTION_CACHE.stats["results"], 0)
+
         # It returns all available match results for the round
         self.assertEqual(
             len(match_results),
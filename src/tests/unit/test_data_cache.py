@@ -0,0 +1,139 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from augury.data_cache import MLDataCache
+
+
+SIGNATURE = ("model-data.json", 1024, 1600000000.0)
+YEARS = {2017, 2018}
+
+
+class TestMLDataCache(TestCase):
+    def setUp(self):
+        self.data_cache = MLDataCache(max_entries=2)
+        self.data_frame = pd.DataFrame(
+            {"year": [2017, 2018], "margin": [10, -10], "result": [1, 0]}
+        )
+        self.cached_data = {
+            "signature": SIGNATURE,
+            "loaded_years": None,
+            "data": self.data_frame,
+            "X": self.data_frame[["year"]],
+            "y": self.data_frame["margin"],
+            "row_years": np.array([2017, 2018]),
+        }
+
+    def test_get(self):
+        self.assertIsNone(self.data_cache.get("model_data", "margin", SIGNATURE, YEARS))
+        self.assertEqual(self.data_cache.misses, 1)
+
+        self.data_cache.set("model_data", "margin", self.cached_data)
+        cached_data = self.data_cache.get("model_data", "margin", SIGNATURE, YEARS)
+
+        pd.testing.assert_frame_equal(cached_data["data"], self.data_frame)
+        self.assertEqual(self.data_cache.hits, 1)
+
+        with self.subTest("when the returned data is modified in place"):
+            cached_data["data"].loc[:, "margin"] = 0
+            cached_data["row_years"][:] = 0
+
+            cached_data = self.data_cache.get("model_data", "margin", SIGNATURE, YEARS)
+
+            pd.testing.assert_frame_equal(cached_data["data"], self.data_frame)
+            np.testing.assert_array_equal(
+                cached_data["row_years"], self.cached_data["row_years"]
+            )
+
+        with self.subTest("with a different label column"):
+            cached_data = self.data_cache.get("model_data", "result", SIGNATURE, YEARS)
+
+            # Data and features are shared, but labels have to be recalculated
+            pd.testing.assert_frame_equal(cached_data["data"], self.data_frame)
+            pd.testing.assert_frame_equal(cached_data["X"], self.cached_data["X"])
+            self.assertIsNone(cached_data["y"])
+
+        with self.subTest("when the data set has changed"):
+            new_signature = ("model-data.json", 2048, 1700000000.0)
+
+            self.assertIsNone(
+                self.data_cache.get("model_data", "margin", new_signature, YEARS)
+            )
+
+        with self.subTest("when the cached data is missing years"):
+            self.data_cache.set(
+                "partitioned_data",
+                "margin",
+                {**self.cached_data, "loaded_years": {2018}},
+            )
+
+            self.assertIsNone(
+                self.data_cache.get("partitioned_data", "margin", SIGNATURE, YEARS)
+            )
+            self.assertIsNotNone(
+                self.data_cache.get("partitioned_data", "margin", SIGNATURE, {2018})
+            )
+
+    def test_set(self):
+        for label_col in ["margin", "result", "win_probability"]:
+            self.data_cache.set("model_data", label_col, self.cached_data)
+
+        # Least-recently-used entries get evicted first
+        self.assertEqual(self.data_cache.evictions, 1)
+        self.assertEqual(
+            self.data_cache.stats["entries"],
+            [["model_data", "result"], ["model_data", "win_probability"]],
+        )
+
+    def test_set_with_partial_data(self):
+        self.data_cache.set(
+            "model_data", "margin", {**self.cached_data, "X": None, "y": None}
+        )
+
+        with self.subTest("with the same signature"):
+            self.data_cache.set(
+                "model_data",
+                "margin",
+                {**self.cached_data, "data": None, "row_years": None},
+            )
+            cached_data = self.data_cache.get("model_data", "margin", SIGNATURE, YEARS)
+
+            # Data passed earlier is kept when later data is added
+            pd.testing.assert_frame_equal(cached_data["data"], self.data_frame)
+            pd.testing.assert_series_equal(cached_data["y"], self.cached_data["y"])
+
+        with self.subTest("with a different signature"):
+            new_signature = ("model-data.json", 2048, 1700000000.0)
+            self.data_cache.set(
+                "model_data",
+                "margin",
+                {**self.cached_data, "signature": new_signature, "data": None},
+            )
+            cached_data = self.data_cache.get(
+                "model_data", "margin", new_signature, YEARS
+            )
+
+            self.assertIsNone(cached_data["data"])
+
+        with self.subTest("when modifying data after caching it"):
+            self.data_cache.set("model_data", "margin", self.cached_data)
+            self.data_frame.loc[:, "margin"] = 0
+            cached_data = self.data_cache.get("model_data", "margin", SIGNATURE, YEARS)
+
+            self.assertEqual(cached_data["data"]["margin"].tolist(), [10, -10])
+
+    def test_clear(self):
+        self.data_cache.set("model_data", "margin", self.cached_data)
+        self.data_cache.set("legacy_model_data", "margin", self.cached_data)
+
+        self.data_cache.clear("model_data")
+        self.assertEqual(
+            self.data_cache.stats["entries"], [["legacy_model_data", "margin"]]
+        )
+
+        self.data_cache.clear()
+        self.assertEqual(self.data_cache.stats["entries"], [])
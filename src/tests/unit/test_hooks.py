@@ -0,0 +1,95 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from unittest import TestCase
+import json
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+from kedro.pipeline import node
+
+from augury.hooks import NodeProfilingHooks, NodeBudgetExceeded
+
+N_ROWS = 10
+RUN_ID = "test-run"
+
+
+def _double(data_frame):
+    return data_frame * 2
+
+
+class TestNodeProfilingHooks(TestCase):
+    def setUp(self):
+        self.report_dir = tempfile.mkdtemp()
+        self.hooks = NodeProfilingHooks(
+            enabled=True, report_dir=self.report_dir, budget={}
+        )
+        self.node = node(_double, "input_data", "output_data", name="double")
+        self.input_data = pd.DataFrame({"a": range(N_ROWS), "b": ["x"] * N_ROWS})
+
+    def tearDown(self):
+        shutil.rmtree(self.report_dir)
+
+    def _run_node(self):
+        self.hooks.before_pipeline_run()
+        self.hooks.before_node_run(self.node)
+        inputs = {"input_data": self.input_data}
+        outputs = {"output_data": self.node.run(inputs)["output_data"]}
+        self.hooks.after_node_run(self.node, inputs, outputs)
+        self.hooks.after_pipeline_run({"run_id": RUN_ID})
+
+    def test_profiling(self):
+        self._run_node()
+
+        self.assertEqual(len(self.hooks.node_profiles), 1)
+        node_profile = self.hooks.node_profiles[0]
+        self.assertEqual(node_profile["node"], "double")
+        self.assertGreaterEqual(node_profile["wall_seconds"], 0)
+        self.assertEqual(node_profile["inputs"]["input_data"]["rows"], N_ROWS)
+        self.assertEqual(node_profile["outputs"]["output_data"]["columns"], 2)
+        self.assertGreater(node_profile["outputs"]["output_data"]["memory_mb"], 0)
+
+        with self.subTest("writes reports"):
+            with open(
+                os.path.join(self.report_dir, f"node-profiles_{RUN_ID}.json"), "r"
+            ) as file:
+                self.assertEqual(json.load(file)[0]["node"], "double")
+
+            csv_report = pd.read_csv(
+                os.path.join(self.report_dir, f"node-profiles_{RUN_ID}.csv")
+            )
+            self.assertEqual(csv_report["inputs_rows"].iloc[0], N_ROWS)
+
+        with self.subTest("when a node exceeds its budget"):
+            self.hooks.budget = {"double": {"wall_seconds": -1}}
+
+            with self.assertRaisesRegex(NodeBudgetExceeded, "double: wall_seconds"):
+                self._run_node()
+
+        with self.subTest("with a default budget"):
+            self.hooks.budget = {"*": {"peak_rss_delta_mb": -1}}
+
+            with self.assertRaisesRegex(NodeBudgetExceeded, "peak_rss_delta_mb"):
+                self._run_node()
+
+        with self.subTest("with a budget file"):
+            budget_path = os.path.join(self.report_dir, "budget.json")
+            with open(budget_path, "w") as file:
+                json.dump({"double": {"cpu_seconds": -1}}, file)
+
+            self.hooks = NodeProfilingHooks(
+                enabled=True, report_dir=self.report_dir, budget_path=budget_path
+            )
+            # The file isn't read until a pipeline runs
+            self.assertIsNone(self.hooks.budget)
+
+            with self.assertRaisesRegex(NodeBudgetExceeded, "double: cpu_seconds"):
+                self._run_node()
+
+        with self.subTest("when profiling is disabled"):
+            self.hooks.enabled = False
+            self._run_node()
+
+            self.assertEqual(self.hooks.node_profiles, [])
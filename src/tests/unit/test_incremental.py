@@ -0,0 +1,199 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from io import StringIO
+from unittest import TestCase
+
+import pandas as pd
+from candystore import CandyStore
+from freezegun import freeze_time
+from kedro.io import DataCatalog, MemoryDataSet
+
+from benchmarks.synthetic_data import fake_raw_data
+from augury.incremental import (
+    append_features,
+    combine_final_data,
+    MATCH_PIPELINE_SPEC,
+    LEGACY_MATCH_PIPELINE_SPEC,
+    BETTING_PIPELINE_SPEC,
+    PLAYER_PIPELINE_SPEC,
+)
+from augury.nodes import betting, common, match
+from augury.runner import run_in_memory
+from augury.pipelines.betting_pipeline import create_betting_pipeline
+from augury.pipelines.match_pipeline import (
+    create_match_pipeline,
+    create_legacy_match_pipeline,
+    create_past_match_pipeline,
+)
+from augury.pipelines.player_pipeline import create_player_pipeline
+
+YEAR_RANGE = (2012, 2016)
+START_DATE = "1897-01-01"
+END_DATE = "2099-12-31"
+# Rosters are only used for matches from the start of the current week,
+# and the fake rosters are for the season after the fake player data
+ROSTER_WEEK = f"{YEAR_RANGE[1]}-01-01"
+
+
+def _n_state_rows(state) -> int:
+    if isinstance(state, (pd.DataFrame, pd.Series)):
+        return len(state)
+
+    if isinstance(state, dict):
+        return sum([_n_state_rows(value) for value in state.values()])
+
+    return 0
+
+
+class TestIncremental(TestCase):
+    def setUp(self):
+        self.match_data = (
+            CandyStore(seasons=YEAR_RANGE)
+            .match_results()
+            .pipe(match.clean_match_data)
+            .pipe(common.convert_match_rows_to_teammatch_rows)
+        )
+        self.feature_pipeline = create_match_pipeline(START_DATE, END_DATE).from_inputs(
+            MATCH_PIPELINE_SPEC["state_input"]
+        )
+
+    def test_append_features(self):
+        full_feature_data, _ = append_features(
+            self.feature_pipeline, MATCH_PIPELINE_SPEC, None, self.match_data
+        )
+
+        last_year = self.match_data["year"].max()
+        last_round = self.match_data.query("year == @last_year")["round_number"].max()
+        _, state = append_features(
+            self.feature_pipeline,
+            MATCH_PIPELINE_SPEC,
+            None,
+            self.match_data.query("year < @last_year"),
+        )
+
+        round_feature_data = []
+
+        for round_number, round_data in self.match_data.query(
+            "year == @last_year"
+        ).groupby("round_number"):
+            if round_number == last_round:
+                fixture_data = round_data.assign(score=0, oppo_score=0)
+                _, fixture_state = append_features(
+                    self.feature_pipeline, MATCH_PIPELINE_SPEC, state, fixture_data,
+                )
+
+                with self.subTest("with matches that haven't been played yet"):
+                    self.assertEqual(fixture_state["last_round"], state["last_round"])
+
+            new_feature_data, state = append_features(
+                self.feature_pipeline, MATCH_PIPELINE_SPEC, state, round_data
+            )
+            round_feature_data.append(new_feature_data)
+
+        self.assertEqual(state["last_round"], (last_year, last_round))
+        # The state only grows with the number of teams & venues, not with
+        # the number of matches
+        self.assertLess(_n_state_rows(state), len(self.match_data))
+
+        # Appending one round at a time gives the same features as calculating them
+        # for all matches at once
+        pd.testing.assert_frame_equal(
+            pd.concat(round_feature_data).sort_index(),
+            full_feature_data.query("year == @last_year"),
+            check_exact=True,
+        )
+
+        with self.subTest("when combined with final data saved as JSON"):
+            saved_final_data = pd.read_json(
+                StringIO(
+                    full_feature_data.query("year < @last_year").to_json(
+                        orient="records", date_format="iso"
+                    )
+                ),
+                orient="records",
+            )
+
+            # JSON rounds floats, so saved values are only approximately equal,
+            # but the index and dtypes are the same as for a full run
+            pd.testing.assert_frame_equal(
+                combine_final_data(
+                    saved_final_data, pd.concat(round_feature_data).sort_index()
+                ),
+                full_feature_data,
+            )
+
+    def _append_rounds(self, feature_pipeline, spec, input_data):
+        full_feature_data, _ = append_features(feature_pipeline, spec, None, input_data)
+
+        last_year = input_data["year"].max()
+        _, state = append_features(
+            feature_pipeline, spec, None, input_data.query("year < @last_year")
+        )
+        round_feature_data = []
+
+        for _, round_data in input_data.query("year == @last_year").groupby(
+            "round_number"
+        ):
+            new_feature_data, state = append_features(
+                feature_pipeline, spec, state, round_data
+            )
+            round_feature_data.append(new_feature_data)
+
+        pd.testing.assert_frame_equal(
+            pd.concat(round_feature_data).sort_index(),
+            full_feature_data.query("year == @last_year"),
+            check_exact=True,
+        )
+
+        return state
+
+    def test_append_features_for_betting(self):
+        betting_data = (
+            CandyStore(seasons=YEAR_RANGE)
+            .betting_odds()
+            .pipe(betting.clean_data)
+            .pipe(common.convert_match_rows_to_teammatch_rows)
+        )
+        feature_pipeline = create_betting_pipeline(START_DATE, END_DATE).from_inputs(
+            BETTING_PIPELINE_SPEC["state_input"]
+        )
+
+        state = self._append_rounds(
+            feature_pipeline, BETTING_PIPELINE_SPEC, betting_data
+        )
+
+        # Betting features only look back a season, so we don't need all of history
+        self.assertLess(_n_state_rows(state), len(betting_data))
+
+    def test_append_features_for_legacy_match_data(self):
+        match_data = CandyStore(seasons=YEAR_RANGE).match_results().pipe(
+            match.clean_match_data
+        )
+        feature_pipeline = create_legacy_match_pipeline(
+            START_DATE, END_DATE
+        ).from_inputs(LEGACY_MATCH_PIPELINE_SPEC["state_input"])
+
+        self._append_rounds(feature_pipeline, LEGACY_MATCH_PIPELINE_SPEC, match_data)
+
+    @freeze_time(ROSTER_WEEK)
+    def test_append_features_for_player_data(self):
+        pipeline = create_player_pipeline(
+            START_DATE, END_DATE, past_match_pipeline=create_past_match_pipeline()
+        )
+        catalog = DataCatalog(
+            {
+                data_set_name: MemoryDataSet(data=data)
+                for data_set_name, data in fake_raw_data(YEAR_RANGE).items()
+            }
+        )
+        player_data = run_in_memory(
+            pipeline.to_outputs(PLAYER_PIPELINE_SPEC["state_input"]), catalog
+        ).load(PLAYER_PIPELINE_SPEC["state_input"])
+        feature_pipeline = pipeline.from_inputs(PLAYER_PIPELINE_SPEC["state_input"])
+
+        # Rosters are for the season after the player data, so the last season's
+        # rounds are all for matches that haven't been played yet
+        self.assertIn(YEAR_RANGE[1], player_data["year"].values)
+
+        self._append_rounds(feature_pipeline, PLAYER_PIPELINE_SPEC, player_data)
@@ -1,14 +1,19 @@
 # pylint: disable=missing-module-docstring, missing-function-docstring
 # pylint: disable=missing-class-docstring
 
+import copy
 import os
+import tempfile
 from unittest import TestCase
 from unittest.mock import MagicMock
 
 import pandas as pd
 from faker import Faker
+from kedro.io import DataCatalog, MemoryDataSet
 
-from augury.ml_data import MLData
+from augury.data_cache import MLDataCache
+from augury.io import ColumnarDataSet
+from augury.ml_data import MLData, FEATURE_DTYPE
 
 
 RAW_DATA_DIR = os.path.abspath(
@@ -25,7 +30,9 @@ class TestMLData(TestCase):
     """Tests for MLData class"""
 
     def setUp(self):
-        self.data = MLData(data_set="fake_data", train_year_range=(2017,))
+        self.data = MLData(
+            data_set="fake_data", train_year_range=(2017,), cache=MLDataCache()
+        )
 
     def test_train_data(self):
         X_train, y_train = self.data.train_data
@@ -48,6 +55,19 @@ class TestMLData(TestCase):
             any([X_train[column].dtype == int for column in X_train.columns])
         )
 
+        # Numeric features are all in one block of the same float type
+        self.assertTrue((X_train.select_dtypes("number").dtypes == FEATURE_DTYPE).all())
+
+        with self.subTest("with data from some years"):
+            self.data.train_year_range = (2018,)
+            X_train, y_train = self.data.train_data
+
+            self.assertEqual(
+                X_train.index.get_level_values(1).unique().tolist(), [2017]
+            )
+            self.assertEqual(len(X_train), (self.data.data["year"] == 2017).sum())
+            self.assertTrue(X_train.index.equals(y_train.index))
+
     def test_test_data(self):
         X_test, y_test = self.data.test_data
 
@@ -92,6 +112,148 @@ class TestMLData(TestCase):
         self.assertIsNone(self.data._data)  # pylint: disable=protected-access
         self.assertEqual(self.data.data_set, data_set_name)
 
+    def test_partitioned_data_set(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        data_set = ColumnarDataSet(filepath=os.path.join(temp_dir.name, "fake-data"))
+        data_set.save(self.data.data)
+
+        year_ranges = {
+            "train_year_range": (2017, 2018),
+            "test_year_range": (2017, 2018),
+        }
+        partitioned_data = MLData(
+            context=MagicMock(catalog=DataCatalog({"fake_data": data_set})),
+            data_set="fake_data",
+            cache=self.data.cache,
+            **year_ranges,
+        )
+        json_data = MLData(data_set="fake_data", cache=self.data.cache, **year_ranges)
+
+        # Only loads partitions for years in the train & test year ranges
+        self.assertEqual(partitioned_data.data["year"].unique().tolist(), [2017])
+
+        for data_name in ["train_data", "test_data"]:
+            with self.subTest(data_name=data_name):
+                X_data, y_data = getattr(partitioned_data, data_name)
+                X_json_data, y_json_data = getattr(json_data, data_name)
+
+                pd.testing.assert_frame_equal(X_data, X_json_data)
+                pd.testing.assert_series_equal(y_data, y_json_data)
+
+        with self.subTest("when a year range changes to years that weren't loaded"):
+            partitioned_data.test_year_range = (2018, 2019)
+
+            # pylint: disable=protected-access
+            self.assertIsNone(partitioned_data._data)
+            self.assertEqual(
+                partitioned_data.data["year"].unique().tolist(), [2017, 2018]
+            )
+
     @staticmethod
     def __set_valid_index(data_frame):
         return data_frame.set_index(["team", "year", "round_number"])
+
+    def test_cache(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        data_set = ColumnarDataSet(filepath=os.path.join(temp_dir.name, "fake-data"))
+        data_set.save(self.data.data)
+        context = MagicMock(
+            catalog=DataCatalog({"fake_data": data_set, "other_fake_data": data_set})
+        )
+        data_cache = MLDataCache()
+        data_kwargs = {
+            "context": context,
+            "data_set": "fake_data",
+            "train_year_range": (2018,),
+            "test_year_range": (2018, 2019),
+            "cache": data_cache,
+        }
+
+        data = MLData(**data_kwargs)
+        X_test, _ = data.test_data
+
+        with self.subTest("with another MLData object for the same data set"):
+            other_data = MLData(**data_kwargs)
+            other_data._load_data = MagicMock()  # pylint: disable=protected-access
+            other_X_test, _ = other_data.test_data
+
+            other_data._load_data.assert_not_called()
+            pd.testing.assert_frame_equal(other_X_test, X_test)
+
+            # Each object gets its own copy, so changes to one don't affect others
+            self.assertIsNot(other_data.data, data.data)
+            other_data.data.loc[:, "margin"] = 0
+            self.assertFalse((data.data["margin"] == 0).all())
+
+        with self.subTest("when switching data sets and label columns"):
+            data.data_set = "other_fake_data"
+            data.test_data  # pylint: disable=pointless-statement
+            data.label_col = "result"
+            _, y_test = data.test_data
+            data.data_set = "fake_data"
+            other_X_test, _ = data.test_data
+
+            self.assertEqual(data_cache.misses, 2)
+            self.assertEqual(y_test.name, "result")
+            pd.testing.assert_frame_equal(other_X_test, X_test)
+
+        with self.subTest("when the data set has changed"):
+            data_set.save(self.data.data.query("year == 2018"))
+            new_data = MLData(**data_kwargs)
+
+            self.assertIsNot(new_data.data, data.data)
+            self.assertEqual(new_data.data["year"].unique().tolist(), [2018])
+
+        with self.subTest("when clearing the cache"):
+            data.clear_cache()
+
+            self.assertIsNone(data._data)  # pylint: disable=protected-access
+            self.assertEqual(
+                {data_set_name for data_set_name, _ in data_cache.stats["entries"]},
+                {"other_fake_data"},
+            )
+
+        with self.subTest("with a data set that isn't saved as files"):
+            memory_data = MLData(
+                **{
+                    **data_kwargs,
+                    "context": MagicMock(
+                        catalog=DataCatalog(
+                            {"fake_data": MemoryDataSet(data=self.data.data)}
+                        )
+                    ),
+                }
+            )
+            memory_data.test_data  # pylint: disable=pointless-statement
+
+            # Data that can't be checked for changes isn't shared with other objects
+            self.assertEqual(
+                {data_set_name for data_set_name, _ in data_cache.stats["entries"]},
+                {"other_fake_data"},
+            )
+
+            with self.subTest("and a request cache"):
+                request_cache = MLDataCache()
+                memory_data.request_cache = request_cache
+                memory_data.clear_cache()
+                memory_data.test_data  # pylint: disable=pointless-statement
+
+                other_memory_data = copy.copy(memory_data)
+                other_memory_data.label_col = "result"
+                other_memory_data.test_data  # pylint: disable=pointless-statement
+
+                # Data that only lives as long as the request is shared
+                # through the request's cache instead
+                self.assertEqual(
+                    request_cache.stats["entries"],
+                    [["fake_data", "margin"], ["fake_data", "result"]],
+                )
+                self.assertEqual(request_cache.stats["hits"], 1)
+                self.assertEqual(
+                    {data_set_name for data_set_name, _ in data_cache.stats["entries"]},
+                    {"other_fake_data"},
+                )
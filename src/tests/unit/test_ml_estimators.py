@@ -3,11 +3,25 @@
 
 from unittest import TestCase
 
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import Lasso
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from xgboost import XGBRegressor
+
 from tests.helpers import KedroContextMixin
-from augury.ml_estimators.base_ml_estimator import BaseMLEstimator
+from augury.ml_estimators.base_ml_estimator import (
+    BaseMLEstimator,
+    PARTIAL_FIT_ESTIMATOR_SHARE,
+)
 from augury.settings import ML_MODELS
 
 
+N_ESTIMATORS = 10
+ROW_COUNT = 40
+
+
 class TestMLEstimators(TestCase, KedroContextMixin):
     """Basic spot check for being able to load saved ML estimators"""
 
@@ -19,3 +33,57 @@ class TestMLEstimators(TestCase, KedroContextMixin):
             with self.subTest(model_name=model["name"]):
                 estimator = self.context.catalog.load(model["name"])
                 self.assertIsInstance(estimator, BaseMLEstimator)
+
+
+class TestBaseMLEstimator(TestCase):
+    def setUp(self):
+        self.X = pd.DataFrame(
+            np.random.random((ROW_COUNT, 3)), columns=["stat_a", "stat_b", "stat_c"]
+        )
+        self.y = pd.Series(np.random.random(ROW_COUNT))
+        self.estimator = BaseMLEstimator(self._xgboost_pipeline())
+
+    def test_partial_fit(self):
+        X_train, X_new = self.X.iloc[:30], self.X.iloc[30:]
+        y_train, y_new = self.y.iloc[:30], self.y.iloc[30:]
+
+        self.assertTrue(self.estimator.supports_partial_fit)
+
+        self.estimator.fit(X_train, y_train)
+        scaler, xgboost_model = [step for _, step in self.estimator.pipeline.steps]
+        fitted_mean = scaler.mean_.copy()
+
+        self.estimator.partial_fit(X_new, y_new)
+
+        # Partial fits add boosting rounds for a share of n_estimators
+        self.assertEqual(
+            len(xgboost_model.get_booster().get_dump()),
+            N_ESTIMATORS + round(N_ESTIMATORS * PARTIAL_FIT_ESTIMATOR_SHARE),
+        )
+        self.assertEqual(xgboost_model.get_params()["n_estimators"], N_ESTIMATORS)
+        # Preprocessing steps keep the state from the original fit
+        np.testing.assert_array_equal(scaler.mean_, fitted_mean)
+
+        with self.subTest("when the estimator hasn't been fitted"):
+            partial_fit_estimator = BaseMLEstimator(self._xgboost_pipeline())
+            partial_fit_estimator.partial_fit(X_new, y_new)
+
+            full_fit_estimator = BaseMLEstimator(self._xgboost_pipeline())
+            full_fit_estimator.fit(X_new, y_new)
+
+            np.testing.assert_array_equal(
+                partial_fit_estimator.predict(X_new), full_fit_estimator.predict(X_new)
+            )
+
+        with self.subTest("when the pipeline doesn't end in an XGBoost model"):
+            lasso_estimator = BaseMLEstimator(make_pipeline(StandardScaler(), Lasso()))
+            lasso_estimator.fit(X_train, y_train)
+
+            self.assertFalse(lasso_estimator.supports_partial_fit)
+
+            with self.assertRaises(AssertionError):
+                lasso_estimator.partial_fit(X_new, y_new)
+
+    @staticmethod
+    def _xgboost_pipeline():
+        return make_pipeline(StandardScaler(), XGBRegressor(n_estimators=N_ESTIMATORS))
@@ -0,0 +1,76 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+import os
+import shutil
+import tempfile
+
+from kedro.io import DataCatalog
+from kedro.extras.datasets.pickle import PickleDataSet
+
+from augury.model_registry import ModelRegistry
+from augury.settings import BASE_DIR
+
+
+FAKE_ESTIMATOR_PATH = os.path.join(BASE_DIR, "src/tests/fixtures/fake_estimator.pkl")
+MODEL_NAMES = ["fake_estimator", "other_fake_estimator"]
+
+
+class TestModelRegistry(TestCase):
+    def setUp(self):
+        self.model_dir = tempfile.mkdtemp()
+        self.model_paths = {
+            name: os.path.join(self.model_dir, f"{name}.pkl") for name in MODEL_NAMES
+        }
+
+        for model_path in self.model_paths.values():
+            shutil.copyfile(FAKE_ESTIMATOR_PATH, model_path)
+
+        catalog = DataCatalog(
+            {
+                name: PickleDataSet(filepath=model_path, backend="joblib")
+                for name, model_path in self.model_paths.items()
+            }
+        )
+        self.context = MagicMock(catalog=catalog)
+        self.model_registry = ModelRegistry()
+
+    def tearDown(self):
+        shutil.rmtree(self.model_dir)
+
+    def test_load(self):
+        model = self.model_registry.load(self.context, "fake_estimator")
+        self.assertEqual(model.name, "fake_estimator")
+        self.assertEqual(self.model_registry.misses, 1)
+        self.assertEqual(self.model_registry.hits, 0)
+
+        with self.subTest("when the model is already cached"):
+            cached_model = self.model_registry.load(self.context, "fake_estimator")
+
+            self.assertIs(cached_model, model)
+            self.assertEqual(self.model_registry.misses, 1)
+            self.assertEqual(self.model_registry.hits, 1)
+
+        with self.subTest("when the model file has changed"):
+            model_stat = os.stat(self.model_paths["fake_estimator"])
+            os.utime(
+                self.model_paths["fake_estimator"],
+                (model_stat.st_atime, model_stat.st_mtime + 60),
+            )
+
+            reloaded_model = self.model_registry.load(self.context, "fake_estimator")
+
+            self.assertIsNot(reloaded_model, model)
+            self.assertEqual(self.model_registry.misses, 2)
+            self.assertEqual(self.model_registry.hits, 1)
+
+        with self.subTest("when the memory limit is exceeded"):
+            self.model_registry.memory_limit = os.path.getsize(FAKE_ESTIMATOR_PATH)
+            self.model_registry.load(self.context, "other_fake_estimator")
+
+            self.assertEqual(self.model_registry.evictions, 1)
+            self.assertEqual(
+                self.model_registry.stats["models"], ["other_fake_estimator"]
+            )
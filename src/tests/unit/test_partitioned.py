@@ -0,0 +1,130 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import pandas as pd
+from freezegun import freeze_time
+from kedro.io import DataCatalog, MemoryDataSet
+
+from benchmarks.synthetic_data import fake_raw_data
+from augury.runner import run_in_memory
+from augury.partitioned import (
+    SHARED_DATA_SETS,
+    process_player_partitions,
+    run_partitioned_player_pipeline,
+    split_by_season,
+    without_player_pipeline,
+)
+from augury.pipelines import create_full_pipeline
+from augury.pipelines.match_pipeline import create_past_match_pipeline
+from augury.pipelines.player_pipeline import create_player_pipeline
+
+
+YEAR_RANGE = (2012, 2016)
+# Small enough for each season to get its own partition
+MIN_PARTITION_MB = 0.0
+# Big enough for all seasons to fit in one partition
+MAX_PARTITION_MB = 1024.0
+# Rosters are only used for matches from the start of the current week,
+# and the fake rosters are for the season after the fake player data
+ROSTER_WEEK = f"{YEAR_RANGE[1]}-01-01"
+START_DATE = "1897-01-01"
+END_DATE = "2099-12-31"
+
+
+class TestPartitioned(TestCase):
+    def setUp(self):
+        freezer = freeze_time(ROSTER_WEEK)
+        freezer.start()
+        self.addCleanup(freezer.stop)
+
+        self.pipeline = create_player_pipeline(
+            START_DATE, END_DATE, past_match_pipeline=create_past_match_pipeline()
+        )
+        self.catalog = DataCatalog(
+            {
+                data_set_name: MemoryDataSet(data=data)
+                for data_set_name, data in fake_raw_data(YEAR_RANGE).items()
+            }
+        )
+
+    def test_process_player_partitions(self):
+        full_player_data = run_in_memory(self.pipeline, self.catalog).load(
+            "final_player_data"
+        )
+        shared_data = {
+            data_set_name: self.catalog.load(data_set_name)
+            for data_set_name in SHARED_DATA_SETS
+        }
+        partitions = split_by_season(self.catalog.load("player_data"))
+
+        self.assertEqual(len(partitions), YEAR_RANGE[1] - YEAR_RANGE[0])
+        # Roster data only gets combined with the last batch of seasons,
+        # so we make sure that it's included
+        self.assertIn(YEAR_RANGE[1], full_player_data["year"].values)
+
+        for max_partition_mb in [MIN_PARTITION_MB, MAX_PARTITION_MB]:
+            with self.subTest(max_partition_mb=max_partition_mb):
+                partitioned_player_data = process_player_partitions(
+                    self.pipeline,
+                    partitions,
+                    shared_data,
+                    max_partition_mb=max_partition_mb,
+                )
+
+                # Processing seasons in batches gives the same data as processing
+                # all of them at once
+                pd.testing.assert_frame_equal(
+                    partitioned_player_data, full_player_data, check_exact=True
+                )
+
+        with self.subTest("with matches before the start date"):
+            start_date = f"{YEAR_RANGE[0] + 1}-06-01"
+            pipeline = create_player_pipeline(
+                start_date, END_DATE, past_match_pipeline=create_past_match_pipeline()
+            )
+
+            partitioned_player_data = process_player_partitions(
+                pipeline, partitions, shared_data, max_partition_mb=MIN_PARTITION_MB
+            )
+
+            pd.testing.assert_frame_equal(
+                partitioned_player_data,
+                run_in_memory(pipeline, self.catalog).load("final_player_data"),
+                check_exact=True,
+            )
+
+    def test_run_partitioned_player_pipeline(self):
+        self.catalog.add("final_player_data", MemoryDataSet())
+        context = MagicMock(
+            catalog=self.catalog, start_date=START_DATE, end_date=END_DATE
+        )
+
+        partitioned_player_data = run_partitioned_player_pipeline(
+            context, max_partition_mb=MIN_PARTITION_MB
+        )
+
+        pd.testing.assert_frame_equal(
+            partitioned_player_data,
+            run_in_memory(self.pipeline, self.catalog).load("final_player_data"),
+            check_exact=True,
+        )
+
+        with self.subTest("with the rest of the full pipeline"):
+            full_pipeline = create_full_pipeline(START_DATE, END_DATE)
+            model_data = run_in_memory(full_pipeline, self.catalog).load("model_data")
+
+            self.catalog.add(
+                "final_player_data",
+                MemoryDataSet(data=partitioned_player_data),
+                replace=True,
+            )
+            partitioned_model_data = run_in_memory(
+                without_player_pipeline(full_pipeline), self.catalog
+            ).load("model_data")
+
+            pd.testing.assert_frame_equal(
+                partitioned_model_data, model_data, check_exact=True
+            )
@@ -3,14 +3,35 @@
 
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
+import copy
 import os
 
 import joblib
+import numpy as np
+import pandas as pd
 from freezegun import freeze_time
+from kedro.io import DataCatalog, MemoryDataSet
+from mlxtend.regressor import StackingRegressor
+from sklearn.base import clone
+from sklearn.linear_model import Lasso
+from sklearn.pipeline import Pipeline, make_pipeline
+from sklearn.preprocessing import StandardScaler
+from xgboost import XGBRegressor
 
 from tests.helpers import KedroContextMixin
-from tests.fixtures.fake_estimator import FakeEstimatorData, create_fake_pipeline
-from augury.predictions import Predictor
+from tests.fixtures.fake_estimator import (
+    FakeEstimator,
+    FakeEstimatorData,
+    create_fake_pipeline,
+    PIPELINE,
+    YEAR_IN_DAYS,
+)
+from augury.data_cache import MLDataCache
+from augury.predictions import (
+    Predictor,
+    EXECUTOR_TYPES,
+    _with_pinned_xgboost_threads,
+)
 from augury.settings import BASE_DIR
 
 YEAR_RANGE = (2018, 2019)
@@ -29,6 +50,23 @@ FAKE_ML_MODELS = [
         "label_col": "result",
     },
 ]
+WALK_FORWARD_ML_MODELS = [
+    {
+        "name": model_name,
+        "data_set": "fake_data",
+        "prediction_type": "margin",
+        "label_col": "margin",
+    }
+    for model_name in [
+        "fake_estimator",
+        "fake_xgboost_estimator",
+        "fake_stacking_estimator",
+    ]
+]
+
+
+def _fake_pipeline(regressor):
+    return Pipeline(clone(PIPELINE).steps[:-1] + [("regressor", regressor)])
 
 
 class TestPredictor(TestCase, KedroContextMixin):
@@ -95,3 +133,262 @@ class TestPredictor(TestCase, KedroContextMixin):
                         ]
                     ),
                 )
+
+    @patch("augury.run.create_pipelines", {"fake": create_fake_pipeline()})
+    def test_make_predictions_with_executors(self):
+        ml_models = [
+            *FAKE_ML_MODELS,
+            {**FAKE_ML_MODELS[0], "name": "other_fake_estimator"},
+        ]
+
+        # Each model name gets its own object, as with the real registry,
+        # so no model is used by two tasks at once
+        fake_models = {
+            ml_model["name"]: copy.deepcopy(self.context.catalog.load("fake_estimator"))
+            for ml_model in ml_models
+        }
+        fake_model_registry = MagicMock()
+        fake_model_registry.load.side_effect = lambda _context, name: fake_models[name]
+
+        with freeze_time(f"{self.max_year}-06-15"), patch(
+            "augury.predictions.MODEL_REGISTRY", fake_model_registry
+        ):
+            self.predictor.executor_type = "serial"
+            serial_predictions = self.predictor.make_predictions(ml_models)
+
+            for executor_type in EXECUTOR_TYPES:
+                with self.subTest(executor_type=executor_type):
+                    self.predictor.executor_type = executor_type
+                    model_predictions = self.predictor.make_predictions(ml_models)
+
+                    # Predictions are in the same order, whichever model finishes first
+                    pd.testing.assert_frame_equal(model_predictions, serial_predictions)
+
+    @patch("augury.run.create_pipelines", {"fake": create_fake_pipeline()})
+    def test_make_predictions_with_training(self):
+        self.predictor.train = True
+
+        with freeze_time(f"{self.max_year}-06-15"):
+            self.predictor.executor_type = "serial"
+            serial_predictions = self.predictor.make_predictions(FAKE_ML_MODELS)
+
+            self.assertEqual(len(serial_predictions), len(self.prediction_matches) * 2)
+            # Each model gets a fold per year, and the first fold is never
+            # warm-started
+            self.assertEqual(
+                [
+                    (fold_time["year"], fold_time["warm_start"])
+                    for fold_time in self.predictor.fold_times
+                ],
+                [(YEAR_RANGE[0], False)] * len(FAKE_ML_MODELS),
+            )
+
+            for executor_type in EXECUTOR_TYPES:
+                with self.subTest(executor_type=executor_type):
+                    self.predictor.executor_type = executor_type
+                    model_predictions = self.predictor.make_predictions(FAKE_ML_MODELS)
+
+                    pd.testing.assert_frame_equal(model_predictions, serial_predictions)
+
+    @patch("augury.run.create_pipelines", {"fake": create_fake_pipeline()})
+    def test_make_predictions_with_walk_forward_training(self):
+        first_year, last_year = self.max_year - 1, self.max_year
+        predictor = Predictor(
+            (first_year, last_year + 1), self.context, PREDICTION_ROUND, train=True
+        )
+        fake_data = self._multi_year_fake_data()
+        predictor._data = fake_data  # pylint: disable=protected-access
+
+        training_models = {
+            "fake_estimator": FakeEstimator(pipeline=clone(PIPELINE)),
+            "fake_xgboost_estimator": FakeEstimator(
+                pipeline=_fake_pipeline(XGBRegressor(n_estimators=10)),
+                name="fake_xgboost_estimator",
+            ),
+            "fake_stacking_estimator": FakeEstimator(
+                pipeline=_fake_pipeline(
+                    StackingRegressor(
+                        regressors=[Lasso(), Lasso(alpha=2)], meta_regressor=Lasso()
+                    )
+                ),
+                name="fake_stacking_estimator",
+            ),
+        }
+        self.context.catalog.load.side_effect = training_models.get
+
+        def fold_starts():
+            return [
+                (fold_time["ml_model"], fold_time["year"], fold_time["warm_start"])
+                for fold_time in predictor.fold_times
+            ]
+
+        with freeze_time(f"{self.max_year}-06-15"):
+            predictor.executor_type = "serial"
+            cold_predictions = predictor.make_predictions(WALK_FORWARD_ML_MODELS)
+
+            self.assertEqual(
+                set(cold_predictions["year"]), set(range(first_year, last_year + 1))
+            )
+            # None of these models get the same results from a warm start
+            # as from a full refit, so they're all refit for each fold
+            self.assertEqual(
+                fold_starts(),
+                [
+                    (ml_model["name"], year, False)
+                    for year in range(first_year, last_year + 1)
+                    for ml_model in WALK_FORWARD_ML_MODELS
+                ],
+            )
+
+            with self.subTest("with estimators whose warm starts match a refit"):
+                # Lasso is convex, so its warm starts converge to the same
+                # coefficients, much like Elo models get the same ratings
+                with patch("augury.predictions.EXACT_WARM_START_ESTIMATORS", (Lasso,)):
+                    warm_predictions = predictor.make_predictions(
+                        WALK_FORWARD_ML_MODELS
+                    )
+
+                self.assertEqual(
+                    fold_starts(),
+                    [
+                        ("fake_estimator", first_year, False),
+                        ("fake_xgboost_estimator", first_year, False),
+                        ("fake_stacking_estimator", first_year, False),
+                        ("fake_estimator", last_year, True),
+                        ("fake_xgboost_estimator", last_year, False),
+                        ("fake_stacking_estimator", last_year, True),
+                    ],
+                )
+                pd.testing.assert_frame_equal(
+                    warm_predictions, cold_predictions, check_exact=False
+                )
+
+            with self.subTest("with approximate warm starts"):
+                predictor.approximate_warm_start = True
+                approximate_predictions = predictor.make_predictions(
+                    WALK_FORWARD_ML_MODELS
+                )
+
+                self.assertIn(
+                    ("fake_xgboost_estimator", last_year, True), fold_starts()
+                )
+
+                # The first fold is always fit from scratch
+                pd.testing.assert_frame_equal(
+                    approximate_predictions.query("year == @first_year"),
+                    cold_predictions.query("year == @first_year"),
+                )
+
+                # Later XGBoost folds only add boosting rounds for the new year,
+                # so they differ from a full refit
+                xgboost_query = (
+                    "year == @last_year & ml_model == 'fake_xgboost_estimator'"
+                )
+                self.assertFalse(
+                    np.allclose(
+                        approximate_predictions.query(xgboost_query)[
+                            "predicted_margin"
+                        ],
+                        cold_predictions.query(xgboost_query)["predicted_margin"],
+                    )
+                )
+
+                for executor_type in EXECUTOR_TYPES:
+                    with self.subTest(executor_type=executor_type):
+                        predictor.executor_type = executor_type
+                        model_predictions = predictor.make_predictions(
+                            WALK_FORWARD_ML_MODELS
+                        )
+
+                        pd.testing.assert_frame_equal(
+                            model_predictions, approximate_predictions
+                        )
+
+    @patch("augury.run.create_pipelines", {"fake": create_fake_pipeline()})
+    def test_make_predictions_with_memory_data(self):
+        fake_model = self.context.catalog.load("fake_estimator")
+        memory_data_set = MemoryDataSet(
+            data=FakeEstimatorData(max_year=self.max_year).data.reset_index(drop=True)
+        )
+        context = MagicMock(
+            catalog=DataCatalog(
+                {
+                    "memory_data": memory_data_set,
+                    "fake_estimator": MemoryDataSet(data=fake_model),
+                }
+            )
+        )
+        ml_models = [
+            {**ml_model, "data_set": "memory_data"} for ml_model in FAKE_ML_MODELS
+        ]
+        fake_model_registry = MagicMock()
+        fake_model_registry.load.return_value = fake_model
+
+        load_data = memory_data_set._load  # pylint: disable=protected-access
+        request_caches = []
+
+        def make_request_cache(**cache_kwargs):
+            request_caches.append(MLDataCache(**cache_kwargs))
+            return request_caches[-1]
+
+        with freeze_time(f"{self.max_year}-06-15"), patch(
+            "augury.predictions.MODEL_REGISTRY", fake_model_registry
+        ), patch("augury.predictions.MLDataCache", side_effect=make_request_cache):
+            for train in [False, True]:
+                with self.subTest(train=train), patch.object(
+                    memory_data_set, "_load", wraps=load_data
+                ) as load_memory_data:
+                    predictor = Predictor(
+                        YEAR_RANGE, context, PREDICTION_ROUND, train=train
+                    )
+                    model_predictions = predictor.make_predictions(ml_models)
+
+                    self.assertEqual(
+                        len(model_predictions), len(self.prediction_matches) * 2
+                    )
+                    # Data sets in memory can't be cached between requests,
+                    # but each one only gets loaded once per request
+                    load_memory_data.assert_called_once()
+                    # The data loaded for each label column is shared by all tasks
+                    # and folds, so the second label column's lookup is the only
+                    # time they get data from the cache
+                    self.assertEqual(request_caches[-1].stats["hits"], 1)
+
+    def _multi_year_fake_data(self):
+        fake_data = FakeEstimatorData(max_year=self.max_year)
+
+        # The data fixture only has two seasons, so we add a copy of the first one
+        # to have training data for a fold in each of them
+        first_season = fake_data.data.query("year == @self.max_year - 1")
+        earlier_season = first_season.assign(
+            date=first_season["date"] - pd.Timedelta(days=YEAR_IN_DAYS),
+            year=first_season["year"] - 1,
+        ).set_index(["team", "year", "round_number"], drop=False)
+
+        fake_data._data = (  # pylint: disable=protected-access
+            pd.concat([earlier_season, fake_data.data])
+            .rename_axis([None, None, None])
+            .sort_index()
+        )
+
+        return fake_data
+
+
+class TestXGBoostThreads(TestCase):
+    def test_with_pinned_xgboost_threads(self):
+        X = np.random.random((20, 3))
+        y = np.random.random(20)
+        ml_model = make_pipeline(
+            StandardScaler(), XGBRegressor(n_estimators=2, n_jobs=4)
+        ).fit(X, y)
+
+        pinned_model = _with_pinned_xgboost_threads(ml_model, 1)
+
+        # Loaded models are shared, so only the copy gets changed
+        self.assertIsNot(pinned_model, ml_model)
+        self.assertEqual(ml_model.steps[-1][1].get_params()["n_jobs"], 4)
+        self.assertEqual(pinned_model.steps[-1][1].get_params()["n_jobs"], 1)
+        np.testing.assert_array_equal(pinned_model.predict(X), ml_model.predict(X))
+
+        with self.subTest("when the model already uses the given threads"):
+            self.assertIs(_with_pinned_xgboost_threads(pinned_model, 1), pinned_model)
@@ -0,0 +1,114 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+from augury.result_cache import ResultCache
+
+
+REQUEST_KEY = ((2018, 2019), 1, ("fake_estimator",), False)
+N_REQUESTS = 4
+# Seconds to wait for concurrent requests before failing
+TIMEOUT = 5
+POLL_INTERVAL = 0.01
+
+
+class TestResultCache(TestCase):
+    def setUp(self):
+        self.result_cache = ResultCache(max_results=2)
+
+    def test_get_or_compute(self):
+        compute = MagicMock(return_value={"data": []})
+
+        result = self.result_cache.get_or_compute(REQUEST_KEY, "digest", compute)
+        self.assertEqual(result, {"data": []})
+        compute.assert_called_once()
+
+        with self.subTest("with the same key and input data"):
+            compute.reset_mock()
+            self.result_cache.get_or_compute(REQUEST_KEY, "digest", compute)
+
+            compute.assert_not_called()
+            self.assertEqual(self.result_cache.hits, 1)
+
+        with self.subTest("when the input data has changed"):
+            compute.reset_mock()
+            self.result_cache.get_or_compute(REQUEST_KEY, "new_digest", compute)
+
+            compute.assert_called_once()
+            self.assertEqual(self.result_cache.misses, 2)
+
+        with self.subTest("when computing the result raises an error"):
+            failing_compute = MagicMock(side_effect=ValueError("Bad data"))
+
+            with self.assertRaises(ValueError):
+                self.result_cache.get_or_compute("bad_key", "digest", failing_compute)
+
+            compute.reset_mock()
+            self.result_cache.get_or_compute("bad_key", "digest", compute)
+            compute.assert_called_once()
+
+        with self.subTest("when the cached result has expired"):
+            compute.reset_mock()
+            self.result_cache.ttl_seconds = 60
+
+            with patch("augury.result_cache.time.monotonic", return_value=0):
+                self.result_cache.get_or_compute("timed_key", "digest", compute)
+
+            with patch("augury.result_cache.time.monotonic", return_value=30):
+                self.result_cache.get_or_compute("timed_key", "digest", compute)
+
+            compute.assert_called_once()
+
+            with patch("augury.result_cache.time.monotonic", return_value=90):
+                self.result_cache.get_or_compute("timed_key", "digest", compute)
+
+            self.assertEqual(compute.call_count, 2)
+            self.assertEqual(self.result_cache.expirations, 1)
+            self.result_cache.ttl_seconds = None
+
+        with self.subTest("when there are too many results"):
+            self.result_cache.get_or_compute("other_key", "digest", compute)
+
+            self.assertEqual(self.result_cache.stats["results"], 2)
+
+        with self.subTest("with identical concurrent requests"):
+            self.result_cache.clear()
+            release_computation = threading.Event()
+            computation_count = []
+
+            def slow_compute():
+                computation_count.append(1)
+                release_computation.wait(timeout=TIMEOUT)
+                return {"data": ["slow"]}
+
+            with ThreadPoolExecutor(max_workers=N_REQUESTS) as executor:
+                result_futures = [
+                    executor.submit(
+                        self.result_cache.get_or_compute,
+                        REQUEST_KEY,
+                        "digest",
+                        slow_compute,
+                    )
+                    for _ in range(N_REQUESTS)
+                ]
+
+                # Waiting for the other requests to join the first one's computation,
+                # but not forever, so a regression fails rather than hanging
+                all_coalesced = threading.Event()
+                for _ in range(int(TIMEOUT / POLL_INTERVAL)):
+                    if self.result_cache.coalesced >= N_REQUESTS - 1:
+                        all_coalesced.set()
+                        break
+
+                    all_coalesced.wait(POLL_INTERVAL)
+
+                release_computation.set()
+                results = [future.result(timeout=TIMEOUT) for future in result_futures]
+
+            self.assertTrue(all_coalesced.is_set())
+            self.assertEqual(len(computation_count), 1)
+            self.assertEqual(results, [{"data": ["slow"]}] * N_REQUESTS)
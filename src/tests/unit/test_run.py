@@ -2,12 +2,25 @@
 # pylint: disable=missing-class-docstring
 
 from pathlib import Path
+from unittest.mock import patch, MagicMock
 
 import pytest
+import pandas as pd
+from kedro.pipeline import Pipeline, node
 
+from tests.fixtures.fake_estimator import create_fake_pipeline
 from augury.run import ProjectContext
 
 
+FAKE_FINAL_DATA = pd.DataFrame({"year": [2017, 2018, 2018, 2019], "score": range(4)})
+FAKE_INCREMENTAL_PIPELINE = Pipeline(
+    [
+        node(pd.DataFrame.copy, "fake_match_data", "final_match_data"),
+        node(pd.DataFrame.copy, "final_match_data", "fake_model_data"),
+    ]
+)
+
+
 @pytest.fixture
 def project_context():
     return ProjectContext(str(Path.cwd()))
@@ -21,3 +34,45 @@ class TestProjectContext:
     @staticmethod
     def test_project_version(project_context):  # pylint: disable=redefined-outer-name
         assert project_context.project_version == "0.16.1"
+
+    @staticmethod
+    @patch(
+        "augury.run.create_pipelines",
+        MagicMock(return_value={"fake": create_fake_pipeline()}),
+    )
+    def test_run_prediction_slice(
+        project_context,
+    ):  # pylint: disable=redefined-outer-name
+        persisted_data = project_context.catalog.load("fake_data")
+
+        slice_data = project_context.run_prediction_slice(
+            "fake", "fake_data", (2018, 2019)
+        )
+
+        assert isinstance(slice_data, pd.DataFrame)
+        assert "win_streak" in slice_data.columns
+        # The slice replaces the data set in memory, but not on file
+        assert project_context.catalog.load("fake_data").equals(slice_data)
+        assert ProjectContext(str(Path.cwd())).catalog.load("fake_data").equals(
+            persisted_data
+        )
+
+    @staticmethod
+    @patch(
+        "augury.run.create_pipelines",
+        MagicMock(return_value={"fake": FAKE_INCREMENTAL_PIPELINE}),
+    )
+    @patch(
+        "augury.run.calculate_new_rounds",
+        MagicMock(return_value=(FAKE_FINAL_DATA, None)),
+    )
+    def test_run_prediction_slice_from_final_data(
+        project_context,
+    ):  # pylint: disable=redefined-outer-name
+        for include_history, expected_years in [(False, {2018}), (True, {2017, 2018})]:
+            slice_data = project_context.run_prediction_slice(
+                "fake", "fake_model_data", (2018, 2019), include_history=include_history
+            )
+
+            # Only the nodes after the final data set get run
+            assert set(slice_data["year"]) == expected_years
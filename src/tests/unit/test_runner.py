@@ -0,0 +1,78 @@
+# pylint: disable=missing-module-docstring, missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from unittest import TestCase
+import pickle
+
+import pandas as pd
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+
+from augury.runner import ParallelBranchRunner
+from augury.pipelines import create_pipelines
+
+
+def _double(data_frame):
+    return data_frame * 2
+
+
+def _add(data_frame, other_data_frame):
+    return data_frame + other_data_frame
+
+
+SHARED_NODE_CALLS = []
+
+
+def _count_shared(data_frame):
+    SHARED_NODE_CALLS.append(1)
+    return data_frame
+
+
+class TestParallelBranchRunner(TestCase):
+    def setUp(self):
+        self.pipeline = Pipeline(
+            [
+                node(_count_shared, "raw_shared_data", "shared_data"),
+                node(_add, ["raw_a_data", "shared_data"], "a_data"),
+                node(_double, "a_data", "final_a_data"),
+                node(_add, ["raw_b_data", "shared_data"], "b_data"),
+                node(_double, "b_data", "final_b_data"),
+                node(_add, ["final_a_data", "final_b_data"], "model_data"),
+            ]
+        )
+        self.catalog = DataCatalog(
+            {
+                "raw_a_data": MemoryDataSet(data=pd.DataFrame({"a": [1, 2]})),
+                "raw_b_data": MemoryDataSet(data=pd.DataFrame({"a": [3, 4]})),
+                "raw_shared_data": MemoryDataSet(data=pd.DataFrame({"a": [0, 1]})),
+            }
+        )
+
+    def test_run(self):
+        for use_threads in [False, True]:
+            with self.subTest(use_threads=use_threads):
+                SHARED_NODE_CALLS.clear()
+                runner = ParallelBranchRunner(use_threads=use_threads)
+                outputs = runner.run(self.pipeline, self.catalog)
+
+                pd.testing.assert_frame_equal(
+                    outputs["model_data"], pd.DataFrame({"a": [8, 16]})
+                )
+                # Shared upstream nodes run once, in this process, before
+                # the branches split
+                self.assertEqual(len(SHARED_NODE_CALLS), 1)
+                self.assertEqual(
+                    set(runner.branch_stats.keys()), {"final_a_data", "final_b_data"}
+                )
+                self.assertEqual(
+                    runner.branch_stats["final_a_data"]["peak_memory_mb"] is None,
+                    use_threads,
+                )
+
+    def test_pipeline_nodes_are_picklable(self):
+        pipelines = create_pipelines("2010-01-01", "2015-12-31")
+
+        for pipeline_name in ["full", "legacy"]:
+            for pipeline_node in pipelines[pipeline_name].nodes:
+                with self.subTest(pipeline=pipeline_name, node=pipeline_node.name):
+                    pickle.loads(pickle.dumps(pipeline_node))
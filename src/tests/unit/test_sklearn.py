@@ -1,7 +1,7 @@
 # pylint: disable=missing-docstring
 
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import os
 import warnings
 
@@ -16,7 +16,12 @@ from candystore import CandyStore
 from tests.helpers import KedroContextMixin
 from tests.fixtures.fake_estimator import FakeEstimatorData, create_fake_pipeline
 from augury.nodes import match, common
-from augury.sklearn.models import AveragingRegressor, EloRegressor, KerasClassifier
+from augury.sklearn.models import (
+    AveragingRegressor,
+    EloRegressor,
+    KerasClassifier,
+    TimeSeriesRegressor,
+)
 from augury.sklearn.preprocessing import (
     CorrelationSelector,
     TeammatchToMatchConverter,
@@ -32,6 +37,8 @@ from augury.settings import BASE_DIR
 FAKE = Faker()
 ROW_COUNT = 10
 N_FAKE_CATS = 6
+TIME_SERIES_TEAMS = ["Richmond", "Carlton"]
+N_TIME_SERIES_PARAMS = 3
 
 
 class TestAveragingRegressor(TestCase):
@@ -143,6 +150,113 @@ class TestEloRegressor(TestCase):
             with self.assertRaises(AssertionError):
                 self.regressor.predict(invalid_X_test)
 
+    def test_partial_fit(self):
+        X_train = self.X.query("year == 2014")
+        X_new_rounds = self.X.query("year == 2015 & round_number <= 3")
+        X_test = self.X.query("year == 2015 & round_number > 3")
+        y = np.zeros(len(X_train))
+
+        full_fit_regressor = EloRegressor().fit(pd.concat([X_train, X_new_rounds]))
+        full_fit_predictions = full_fit_regressor.predict(X_test)
+
+        self.regressor.fit(X_train, y)
+
+        for round_number in range(1, 4):
+            self.regressor.partial_fit(
+                X_new_rounds.query("round_number == @round_number")
+            )
+
+        partial_fit_predictions = self.regressor.predict(X_test)
+
+        np.testing.assert_array_equal(full_fit_predictions, partial_fit_predictions)
+
+        with self.subTest("when there's a gap between match rounds"):
+            with self.assertRaises(AssertionError):
+                self.regressor.partial_fit(X_test.query("round_number > 5"))
+
+    def test_warm_start(self):
+        X_train = self.X.query("year == 2014")
+        X_expanded_train = self.X.query("year == 2014 | round_number <= 3")
+        X_test = self.X.query("year == 2015 & round_number > 3")
+
+        full_fit_predictions = EloRegressor().fit(X_expanded_train).predict(X_test)
+
+        self.regressor.fit(X_train)
+        self.regressor.set_params(warm_start=True)
+        self.regressor.fit(X_expanded_train)
+
+        # Warm starts only add the new matches to the fitted ratings
+        np.testing.assert_array_equal(
+            full_fit_predictions, self.regressor.predict(X_test)
+        )
+
+        with self.subTest("when the training data starts in a different year"):
+            X_later_train = self.X.query("year == 2015 & round_number <= 3")
+            X_later_test = self.X.query("year == 2015 & round_number > 3")
+
+            cold_fit_predictions = (
+                EloRegressor().fit(X_later_train).predict(X_later_test)
+            )
+            self.regressor.fit(X_later_train)
+
+            np.testing.assert_array_equal(
+                cold_fit_predictions, self.regressor.predict(X_later_test)
+            )
+
+
+class TestTimeSeriesRegressor(TestCase):
+    def setUp(self):
+        match_dates = pd.date_range("2015-03-01", periods=ROW_COUNT, freq="W")
+        self.X = pd.DataFrame(
+            {
+                "team": np.repeat(TIME_SERIES_TEAMS, ROW_COUNT),
+                "date": np.tile(match_dates, len(TIME_SERIES_TEAMS)),
+            }
+        )
+        self.y = np.random.randint(-50, 50, len(self.X))
+
+        # Each fit gets different params, so we can tell which fit
+        # a warm start continues from
+        self.stats_model = MagicMock()
+        self.stats_model.return_value.fit.side_effect = lambda **_kwargs: MagicMock(
+            params=np.random.random(N_TIME_SERIES_PARAMS)
+        )
+        self.regressor = TimeSeriesRegressor(self.stats_model, order=(1, 0, 1))
+
+    def test_warm_start(self):
+        self.regressor.fit(self.X, self.y)
+
+        for fit_call in self.stats_model.return_value.fit.call_args_list:
+            self.assertNotIn("start_params", fit_call.kwargs)
+
+        # pylint: disable=protected-access
+        fitted_params = {
+            team_name: team_model.params
+            for team_name, team_model in self.regressor._team_models.items()
+        }
+
+        self.stats_model.reset_mock()
+        self.regressor.set_params(warm_start=True)
+        self.regressor.fit(self.X, self.y)
+
+        # Teams are fitted in alphabetical order
+        for team_name, fit_call in zip(
+            sorted(TIME_SERIES_TEAMS),
+            self.stats_model.return_value.fit.call_args_list,
+        ):
+            np.testing.assert_array_equal(
+                fit_call.kwargs["start_params"], fitted_params[team_name]
+            )
+
+        with self.subTest("when the order of the time-series model changes"):
+            self.stats_model.reset_mock()
+            self.regressor.set_params(order=(2, 0, 1))
+            self.regressor.fit(self.X, self.y)
+
+            # Params from a different order would have the wrong shape
+            for fit_call in self.stats_model.return_value.fit.call_args_list:
+                self.assertNotIn("start_params", fit_call.kwargs)
+
 
 class TestTeammatchToMatchConverter(TestCase):
     def setUp(self):